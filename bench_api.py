@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# API sıcak yollarını (submit, durum, listeleme, performans) yerel sahte GSC sunucusuna karşı ölçer.
+#   python bench_api.py                                   # 4 yol × 1k / 10k / 100k
+#   python bench_api.py --paths submit --sizes 10000 --latency 50 --error-rate 0.01 --rate 800
+#   python bench_api.py --out bench_results.jsonl         # sonuçları geçmişe ekle (regresyon takibi)
+# Her senaryo ayrı bir süreçte (ve sunucu da ayrı süreçte) koşar: tepe bellek yalnızca istemciyi ölçer.
+
+PATHS = ["submit", "status", "list", "performance"]
+SIZES = [1000, 10000, 100000]
+PERFORMANCE_DAYS = 7
+
+def _percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _start_server(args, sitemaps: int, rows_per_day: int):
+    cmd = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_gsc_server.py"),
+           "--port", "0", "--sites", str(args.sites), "--sitemaps", str(sitemaps),
+           "--latency", str(args.latency), "--jitter", str(args.jitter), "--error-rate", str(args.error_rate),
+           "--rate", str(args.rate), "--rows-per-day", str(rows_per_day)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    endpoint = proc.stdout.readline().strip()
+    if not endpoint:
+        proc.kill()
+        raise RuntimeError("Sahte sunucu başlatılamadı")
+    return proc, endpoint
+
+# -------------------- Worker (tek senaryo) --------------------
+def run_scenario(args) -> dict:
+    from fake_gsc_server import sitemap_urls, site_urls
+    from gsc_core import SUBMIT_WORKERS, connect, fetch_statuses, iter_existing_sitemaps, submit_sitemaps
+    from gsc_scheduler import MAX_CONCURRENCY, AdaptiveLimiter, QuotaTracker, RequestScheduler
+
+    path, size = args.worker, args.size
+    rows_per_day = max(1, size // (PERFORMANCE_DAYS * args.sites))
+    proc, endpoint = _start_server(args, size if path in ("status", "list") else 0, rows_per_day)
+    try:
+        # gsc_quota.json'a dokunmamak için kalıcı olmayan kota sayacı; diğer her şey connect() varsayılanı
+        scheduler = RequestScheduler(AdaptiveLimiter(start=SUBMIT_WORKERS, maximum=MAX_CONCURRENCY),
+                                     quota=QuotaTracker())
+        client = connect(lambda *_: None, scheduler=scheduler, api_endpoint=endpoint)
+        client.sites_list()  # mülk indeksi ısınsın; ölçüme dahil değil
+        latencies = []
+        call = client._call
+
+        def timed(*a, **kw):
+            t0 = time.perf_counter()
+            try:
+                return call(*a, **kw)
+            finally:
+                latencies.append(time.perf_counter() - t0)
+        client._call = timed
+
+        base_mb = _peak_rss_mb()
+        t0 = time.perf_counter()
+        if path == "submit":
+            summary = submit_sitemaps(client, sitemap_urls(size, args.sites, prefix="new"),
+                                      rate_per_property=args.rate_per_property, burst=args.rate_per_property)
+            items, failed = summary.total, summary.total - summary.ok
+        elif path == "status":
+            statuses = fetch_statuses(client, sitemap_urls(size, args.sites))
+            items, failed = len(statuses), sum(1 for s in statuses if not s.found)
+        elif path == "list":
+            items, failed = sum(1 for _ in iter_existing_sitemaps(client, lambda *_: None)), 0
+        else:
+            from gsc_analytics import AnalyticsStore, sync_sites
+            counts = {"rows": 0, "failed": 0}
+
+            def on_site(site_url, n, err):
+                counts["rows"] += n
+                counts["failed"] += err is not None
+            with tempfile.TemporaryDirectory() as tmp:
+                store = AnalyticsStore(os.path.join(tmp, "bench.sqlite"))
+                sync_sites(client, store, site_urls(args.sites), days=PERFORMANCE_DAYS, on_site=on_site)
+                store.close()
+            items, failed = counts["rows"], counts["failed"]
+        elapsed = time.perf_counter() - t0
+        peak_mb = _peak_rss_mb()
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {
+        "path": path, "size": size, "items": items, "failed": failed, "calls": len(latencies),
+        "seconds": round(elapsed, 3), "items_per_s": round(items / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2), "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+        "peak_mb": round(peak_mb, 1), "delta_mb": round(peak_mb - base_mb, 1),
+        "retries": scheduler.retries, "throttled": scheduler.throttled,
+    }
+
+# -------------------- Orchestration --------------------
+def _worker_cmd(args, path: str, size: int) -> list:
+    return [sys.executable, os.path.abspath(__file__), "--worker", path, "--size", str(size),
+            "--sites", str(args.sites), "--latency", str(args.latency), "--jitter", str(args.jitter),
+            "--error-rate", str(args.error_rate), "--rate", str(args.rate),
+            "--rate-per-property", str(args.rate_per_property)]
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="GSC API sıcak yolları benchmark'ı (yerel sahte sunucu)")
+    p.add_argument("--paths", default=",".join(PATHS), help=f"Virgülle: {','.join(PATHS)}")
+    p.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Virgülle sitemap (performans: satır) sayıları")
+    p.add_argument("--sites", type=int, default=20, help="Mülk sayısı")
+    p.add_argument("--latency", type=float, default=20.0, help="Sunucu gecikmesi (ms)")
+    p.add_argument("--jitter", type=float, default=5.0, help="± gecikme sapması (ms)")
+    p.add_argument("--error-rate", type=float, default=0.0, help="500 hata oranı (0-1)")
+    p.add_argument("--rate", type=float, default=0.0, help="Sunucu saniyede istek sınırı, aşınca 429 (0 = sınırsız)")
+    p.add_argument("--rate-per-property", type=float, default=1e6,
+                   help="İstemci mülk başı submit hızı (varsayılan: sınırsız; uygulamanın 5/sn'si ölçümü boğar)")
+    p.add_argument("--out", help="Sonuçları bu JSONL dosyasına ekle")
+    p.add_argument("--worker", choices=PATHS, help=argparse.SUPPRESS)
+    p.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    return p
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.worker:
+        print(json.dumps(run_scenario(args)))
+        return 0
+    paths = [p.strip() for p in args.paths.split(",") if p.strip()]
+    unknown = [p for p in paths if p not in PATHS]
+    if unknown:
+        print(f"Bilinmeyen yol: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    print(f"{'yol':12s} {'boyut':>8s} {'öğe/sn':>10s} {'süre':>8s} {'çağrı':>7s} {'p50 ms':>8s} {'p99 ms':>8s} "
+          f"{'tepe MB':>8s} {'Δ MB':>7s} {'hata':>6s} {'tekrar':>7s}")
+    failed = False
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    for path in paths:
+        for size in sizes:
+            proc = subprocess.run(_worker_cmd(args, path, size), capture_output=True, text=True)
+            if proc.returncode != 0:
+                failed = True
+                err = (proc.stderr.strip().splitlines() or ["?"])[-1]
+                print(f"{path:12s} {size:8,d} ❌ {err}")
+                continue
+            r = json.loads(proc.stdout.strip().splitlines()[-1])
+            print(f"{path:12s} {size:8,d} {r['items_per_s']:10,.1f} {r['seconds']:7.2f}s {r['calls']:7,d} "
+                  f"{r['p50_ms']:8.2f} {r['p99_ms']:8.2f} {r['peak_mb']:8.1f} {r['delta_mb']:7.1f} "
+                  f"{r['failed']:6,d} {r['retries']:7,d}")
+            if args.out:
+                r.update(time=stamp, latency=args.latency, error_rate=args.error_rate, rate=args.rate, sites=args.sites)
+                with open(args.out, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(r) + "\n")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
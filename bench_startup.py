@@ -0,0 +1,49 @@
+import statistics
+import subprocess
+import sys
+import time
+
+# CLI'nin soğuk başlangıç süresini ölçer ve Tk / Google istemcisinin yüklenmediğini doğrular.
+#   python bench_startup.py [tekrar]
+
+CASES = [
+    ("python -c pass (taban)", [sys.executable, "-c", "pass"]),
+    ("python -m gsc_cli --help", [sys.executable, "-m", "gsc_cli", "--help"]),
+    ("import gsc_sitemap_submit_gui_metro", [sys.executable, "-c", "import gsc_sitemap_submit_gui_metro"]),
+]
+
+IMPORT_CHECK = (
+    "import sys, gsc_cli; gsc_cli.build_parser().parse_args(['list']); "
+    "bad = [m for m in ('tkinter', '_tkinter', 'googleapiclient', 'google.oauth2', 'httplib2') if m in sys.modules]; "
+    "print(','.join(bad))"
+)
+
+def measure(cmd, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - t0) * 1000)
+        if proc.returncode != 0:
+            return None
+    return times
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    for name, cmd in CASES:
+        times = measure(cmd, repeat)
+        if times is None:
+            print(f"{name:40s} çalıştırılamadı (bağımlılık eksik?)")
+            continue
+        print(f"{name:40s} min {min(times):7.1f} ms   medyan {statistics.median(times):7.1f} ms")
+
+    out = subprocess.run([sys.executable, "-c", IMPORT_CHECK], capture_output=True, text=True, check=True)
+    loaded = out.stdout.strip()
+    if loaded:
+        print(f"❌ CLI başlangıcında yüklenmemesi gereken modüller: {loaded}")
+        return 1
+    print("✅ CLI başlangıcında tkinter / Google istemci modülleri yüklenmedi.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+import argparse
+import datetime
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+# webmasters v3'ün uygulamanın kullandığı uçlarını taklit eden yerel sunucu (benchmark / regresyon testi için).
+#   python fake_gsc_server.py --port 8080 --sites 20 --sitemaps 10000 --latency 20 --error-rate 0.01 --rate 500
+# Uygulamayı bağlamak için:  GSC_API_ENDPOINT=http://127.0.0.1:8080/webmasters/v3/ python -m gsc_cli list
+
+API_PREFIX = "/webmasters/v3/"
+
+def site_urls(count: int) -> list:
+    return [f"https://site{i}.example/" for i in range(count)]
+
+def sitemap_urls(count: int, sites: int, prefix: str = "sitemap") -> list:
+    # sitemap'ler mülklere sırayla dağıtılır; --sitemaps ile önceden yüklenenler prefix="sitemap"
+    site_list = site_urls(sites)
+    return [f"{site_list[i % sites]}{prefix}-{i}.xml" for i in range(count)]
+
+def _error(code: int, reason: str, message: str) -> dict:
+    return {"error": {"code": code, "message": message, "errors": [{"reason": reason, "message": message}]}}
+
+class FakeGsc:
+    # Sunucu durumu ve davranışı; HTTP katmanından bağımsız, thread-safe.
+    def __init__(self, sites: int = 20, sitemaps: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, rate: float = 0.0, burst: Optional[float] = None,
+                 rows_per_day: int = 100, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.rows_per_day = rows_per_day
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.sites = {s: {} for s in site_urls(sites)}
+        for path in sitemap_urls(sitemaps, sites):
+            self.sites[path[:path.rindex("/") + 1]][path] = self._resource(path, submitted=True)
+        self.requests = {}
+
+    @staticmethod
+    def _resource(path: str, submitted: bool) -> dict:
+        now = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        n = int(hashlib.md5(path.encode()).hexdigest()[:4], 16) % 5000
+        return {
+            "path": path, "lastSubmitted": now, "isPending": not submitted, "isSitemapsIndex": False,
+            "type": "sitemap", "lastDownloaded": now if submitted else None, "warnings": "0", "errors": "0",
+            "contents": [{"type": "web", "submitted": str(n), "indexed": str(n * 9 // 10)}],
+        }
+
+    def _take_token(self) -> bool:
+        if self.rate <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def handle(self, method: str, path: str, body: Optional[dict]):
+        # (durum, yanıt gövdesi | None, ek başlıklar)
+        parts = [unquote(p) for p in path[len(API_PREFIX):].split("/")] if path.startswith(API_PREFIX) else []
+        endpoint = self._endpoint(method, parts)
+        with self._lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            allowed = self._take_token()
+            failed = self.error_rate > 0 and self._random.random() < self.error_rate
+            delay = self.latency + (self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        if not allowed:
+            return 429, _error(429, "rateLimitExceeded", "Rate limit exceeded"), {"Retry-After": "1"}
+        if failed:
+            return 500, _error(500, "backendError", "Backend Error"), {}
+        if endpoint is None:
+            return 404, _error(404, "notFound", "Not Found"), {}
+        with self._lock:
+            return getattr(self, "_" + endpoint.replace(".", "_"))(parts, body)
+
+    @staticmethod
+    def _endpoint(method: str, parts: list) -> Optional[str]:
+        if parts == ["sites"] and method == "GET":
+            return "sites.list"
+        if len(parts) == 3 and parts[0] == "sites" and parts[2] == "sitemaps" and method == "GET":
+            return "sitemaps.list"
+        if len(parts) == 4 and parts[0] == "sites" and parts[2] == "sitemaps":
+            return {"GET": "sitemaps.get", "PUT": "sitemaps.submit"}.get(method)
+        if parts[:1] == ["sites"] and parts[2:] == ["searchAnalytics", "query"] and method == "POST":
+            return "searchanalytics.query"
+        return None
+
+    def _site(self, site_url: str):
+        sitemaps = self.sites.get(site_url)
+        if sitemaps is None:
+            return None, (403, _error(403, "forbidden", f"User does not have sufficient permission for site '{site_url}'."), {})
+        return sitemaps, None
+
+    def _sites_list(self, parts, body):
+        return 200, {"siteEntry": [{"siteUrl": s, "permissionLevel": "siteOwner"} for s in self.sites]}, {}
+
+    def _sitemaps_list(self, parts, body):
+        sitemaps, err = self._site(parts[1])
+        return err or (200, {"sitemap": list(sitemaps.values())} if sitemaps else {}, {})
+
+    def _sitemaps_get(self, parts, body):
+        sitemaps, err = self._site(parts[1])
+        if err:
+            return err
+        sm = sitemaps.get(parts[3])
+        return (200, sm, {}) if sm else (404, _error(404, "notFound", "Sitemap not found"), {})
+
+    def _sitemaps_submit(self, parts, body):
+        sitemaps, err = self._site(parts[1])
+        if err:
+            return err
+        sitemaps[parts[3]] = self._resource(parts[3], submitted=False)
+        return 204, None, {}
+
+    def _searchanalytics_query(self, parts, body):
+        _, err = self._site(parts[1])
+        if err:
+            return err
+        body = body or {}
+        start = datetime.date.fromisoformat(body["startDate"])
+        end = datetime.date.fromisoformat(body["endDate"])
+        dims = body.get("dimensions", [])
+        per_day = 1 if dims == ["date"] else self.rows_per_day
+        total = ((end - start).days + 1) * per_day
+        first = int(body.get("startRow", 0))
+        last = min(total, first + int(body.get("rowLimit", 1000)))
+        rows = []
+        for i in range(first, last):
+            day, k = divmod(i, per_day)
+            date = (start + datetime.timedelta(days=day)).isoformat()
+            keys = [date, f"{parts[1]}page-{k}", f"sorgu {k % 97}"][:len(dims)] if dims else []
+            clicks = (i * 7919) % 50
+            rows.append({"keys": keys, "clicks": clicks, "impressions": clicks * 10 + 5,
+                         "ctr": clicks / (clicks * 10 + 5), "position": 1 + (i % 30)})
+        return 200, ({"rows": rows, "responseAggregationType": "byPage"} if rows else {}), {}
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: istemcinin bağlantı havuzu da ölçülsün
+    disable_nagle_algorithm = True  # başlık ve gövde ayrı yazılır; Nagle + gecikmeli ACK her yanıta ~40 ms ekler
+
+    def log_message(self, *args):
+        pass
+
+    def _serve(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            body = None
+        status, payload, headers = self.server.gsc.handle(method, urlsplit(self.path).path, body)
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._serve("GET")
+
+    def do_PUT(self):
+        self._serve("PUT")
+
+    def do_POST(self):
+        self._serve("POST")
+
+class FakeGscServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, gsc: FakeGsc, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.gsc = gsc
+
+    @property
+    def api_endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+def start_server(port: int = 0, **opts) -> FakeGscServer:
+    # Arka plan thread'inde başlatır; kapatmak için server.shutdown()
+    server = FakeGscServer(FakeGsc(**opts), port=port)
+    threading.Thread(target=server.serve_forever, daemon=True, name="fake-gsc").start()
+    return server
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Yerel sahte GSC (webmasters v3) sunucusu")
+    p.add_argument("--port", type=int, default=8080, help="0 = boş bir port seç")
+    p.add_argument("--sites", type=int, default=20, help="Doğrulanmış mülk sayısı")
+    p.add_argument("--sitemaps", type=int, default=0, help="Önceden kayıtlı sitemap sayısı (mülklere dağıtılır)")
+    p.add_argument("--latency", type=float, default=0.0, help="İstek başına gecikme (ms)")
+    p.add_argument("--jitter", type=float, default=0.0, help="Gecikmeye eklenen ± rastgele sapma (ms)")
+    p.add_argument("--error-rate", type=float, default=0.0, help="500 backendError oranı (0-1)")
+    p.add_argument("--rate", type=float, default=0.0, help="Saniyede izin verilen istek; aşınca 429 (0 = sınırsız)")
+    p.add_argument("--burst", type=float, help="Anlık patlama kapasitesi (varsayılan: --rate)")
+    p.add_argument("--rows-per-day", type=int, default=100, help="searchAnalytics: gün başına sayfa/sorgu satırı")
+    args = p.parse_args(argv)
+    server = FakeGscServer(FakeGsc(sites=args.sites, sitemaps=args.sitemaps, latency=args.latency / 1000,
+                                   jitter=args.jitter / 1000, error_rate=args.error_rate, rate=args.rate,
+                                   burst=args.burst, rows_per_day=args.rows_per_day), port=args.port)
+    print(server.api_endpoint, flush=True)  # ilk satır: bench_api.py bu adresi okur
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.gsc.requests), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
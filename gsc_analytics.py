@@ -0,0 +1,171 @@
+import datetime
+import sqlite3
+import threading
+from typing import Iterable, List, Optional
+
+from gsc_workers import bounded_map
+
+ANALYTICS_DB = "gsc_analytics.sqlite"
+ROW_LIMIT = 25000          # searchanalytics.query sayfa boyutu (API üst sınırı)
+FRESH_DAYS = 3             # GSC verisi ~3 gün gecikmeli kesinleşir; bu günler her yenilemede yeniden çekilir
+ANALYTICS_WORKERS = 4      # paralel site
+DETAIL_DIMENSIONS = ["date", "page", "query"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily (
+    site TEXT, date TEXT, clicks REAL, impressions REAL, ctr REAL, position REAL,
+    PRIMARY KEY (site, date)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pages (id INTEGER PRIMARY KEY, url TEXT UNIQUE);
+CREATE TABLE IF NOT EXISTS queries (id INTEGER PRIMARY KEY, text TEXT UNIQUE);
+CREATE TABLE IF NOT EXISTS detail (
+    site TEXT, date TEXT, page INTEGER, query INTEGER,
+    clicks INTEGER, impressions INTEGER, position REAL,
+    PRIMARY KEY (site, date, page, query)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fetched (
+    site TEXT, date TEXT, detail INTEGER, final INTEGER,
+    PRIMARY KEY (site, date)) WITHOUT ROWID;
+"""
+
+def _days(start: datetime.date, end: datetime.date) -> List[str]:
+    return [(start + datetime.timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+def _ranges(days: List[str]):
+    # ardışık günleri (başlangıç, bitiş) aralıklarına topla
+    out = []
+    for d in sorted(days):
+        day = datetime.date.fromisoformat(d)
+        if out and (day - out[-1][1]).days == 1:
+            out[-1][1] = day
+        else:
+            out.append([day, day])
+    return [(a, b) for a, b in out]
+
+class AnalyticsStore:
+    # Search Analytics satırlarının yerel deposu. Sayfa ve sorgu metinleri sözlük tablolarında
+    # bir kez tutulur, ayrıntı tablosu yalnızca tamsayı kimlikler ve metrikler içerir.
+    def __init__(self, path: str = ANALYTICS_DB):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._ids = {"pages": {}, "queries": {}}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _intern(self, table: str, value: str) -> int:
+        ids = self._ids[table]
+        i = ids.get(value)
+        if i is None:
+            col = "url" if table == "pages" else "text"
+            row = self._db.execute(f"SELECT id FROM {table} WHERE {col}=?", (value,)).fetchone()
+            if row is None:
+                i = self._db.execute(f"INSERT INTO {table}({col}) VALUES (?)", (value,)).lastrowid
+            else:
+                i = row[0]
+            ids[value] = i
+        return i
+
+    def missing_days(self, site: str, start: datetime.date, end: datetime.date, detail: bool) -> List[str]:
+        with self._lock:
+            done = {d for d, in self._db.execute(
+                "SELECT date FROM fetched WHERE site=? AND date BETWEEN ? AND ? AND final=1 AND detail>=?",
+                (site, start.isoformat(), end.isoformat(), int(detail)))}
+        return [d for d in _days(start, end) if d not in done]
+
+    def clear_range(self, site: str, start: datetime.date, end: datetime.date):
+        args = (site, start.isoformat(), end.isoformat())
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM daily WHERE site=? AND date BETWEEN ? AND ?", args)
+            self._db.execute("DELETE FROM detail WHERE site=? AND date BETWEEN ? AND ?", args)
+
+    def write_daily(self, site: str, rows: Iterable[dict]):
+        data = [(site, r["keys"][0], r.get("clicks", 0), r.get("impressions", 0), r.get("ctr", 0),
+                 r.get("position", 0)) for r in rows]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO daily VALUES (?,?,?,?,?,?)", data)
+
+    def write_detail(self, site: str, rows: Iterable[dict]):
+        with self._lock, self._db:
+            data = [(site, r["keys"][0], self._intern("pages", r["keys"][1]), self._intern("queries", r["keys"][2]),
+                     int(r.get("clicks", 0)), int(r.get("impressions", 0)), r.get("position", 0)) for r in rows]
+            self._db.executemany("INSERT OR REPLACE INTO detail VALUES (?,?,?,?,?,?,?)", data)
+
+    def mark_fetched(self, site: str, days: Iterable[str], detail: bool, final_before: str):
+        data = [(site, d, int(detail), int(d < final_before)) for d in days]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO fetched VALUES (?,?,?,?)", data)
+
+    def summary(self, site: str, start: datetime.date, end: datetime.date) -> dict:
+        with self._lock:
+            clicks, impressions, pos_weighted = self._db.execute(
+                "SELECT COALESCE(SUM(clicks),0), COALESCE(SUM(impressions),0), COALESCE(SUM(position*impressions),0) "
+                "FROM daily WHERE site=? AND date BETWEEN ? AND ?",
+                (site, start.isoformat(), end.isoformat())).fetchone()
+        return {
+            "clicks": clicks,
+            "impressions": impressions,
+            "ctr": round(clicks / impressions * 100, 2) if impressions else 0.0,
+            "position": round(pos_weighted / impressions, 2) if impressions else 0.0,
+        }
+
+    def top(self, site: str, dimension: str, start: datetime.date, end: datetime.date, limit: int = 5) -> list:
+        table, col = ("pages", "url") if dimension == "page" else ("queries", "text")
+        with self._lock:
+            return self._db.execute(
+                f"SELECT t.{col}, SUM(d.clicks) AS c, SUM(d.impressions) FROM detail d JOIN {table} t "
+                f"ON t.id = d.{dimension} WHERE d.site=? AND d.date BETWEEN ? AND ? "
+                f"GROUP BY d.{dimension} ORDER BY c DESC LIMIT ?",
+                (site, start.isoformat(), end.isoformat(), limit)).fetchall()
+
+def date_window(days: int, end: Optional[datetime.date] = None):
+    end = end or datetime.date.today() - datetime.timedelta(days=1)
+    return end - datetime.timedelta(days=days - 1), end
+
+def _pages(client, site_url: str, body: dict):
+    # rowLimit/startRow ile sayfa sayfa satır üretir
+    start_row = 0
+    while True:
+        rows = client.searchanalytics_query(site_url, dict(body, rowLimit=ROW_LIMIT, startRow=start_row)).get("rows", [])
+        if rows:
+            yield rows
+        if len(rows) < ROW_LIMIT:
+            return
+        start_row += ROW_LIMIT
+
+def sync_site(client, store: AnalyticsStore, site_url: str, start: datetime.date, end: datetime.date,
+              detail: bool = True) -> int:
+    # Yalnızca eksik (veya henüz kesinleşmemiş) günleri indirir; indirilen satır sayısını döner.
+    missing = store.missing_days(site_url, start, end, detail)
+    final_before = (datetime.date.today() - datetime.timedelta(days=FRESH_DAYS)).isoformat()
+    n = 0
+    for a, b in _ranges(missing):
+        store.clear_range(site_url, a, b)
+        body = {"startDate": a.isoformat(), "endDate": b.isoformat()}
+        for rows in _pages(client, site_url, dict(body, dimensions=["date"])):
+            store.write_daily(site_url, rows)
+            n += len(rows)
+        if detail:
+            for rows in _pages(client, site_url, dict(body, dimensions=DETAIL_DIMENSIONS)):
+                store.write_detail(site_url, rows)
+                n += len(rows)
+        store.mark_fetched(site_url, _days(a, b), detail, final_before)
+    return n
+
+def sync_sites(client, store: AnalyticsStore, sites: Iterable[str], days: int = 7, detail: bool = True,
+               workers: int = ANALYTICS_WORKERS, on_site=None):
+    # on_site(site_url, satır_sayısı, hata) her site bittiğinde çağıran thread'de çalışır;
+    # siteler akış halinde alınır, aynı anda en fazla `workers` site işlenir.
+    start, end = date_window(days)
+    for site_url, fut in bounded_map(lambda s: sync_site(client, store, s, start, end, detail), sites, workers,
+                                     name="gsc-analytics"):
+        try:
+            n, err = fut.result(), None
+        except Exception as e:
+            n, err = 0, e
+        if on_site:
+            on_site(site_url, n, err)
+    return start, end
@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+CACHE_FILE = "gsc_cache.json"
+CACHE_MAX_ENTRIES = 4096
+CACHE_TTL = {              # saniye; listede olmayan uç noktalar önbelleğe alınmaz
+    "sites.list": 3600,
+    "sitemaps.list": 300,
+    "sitemaps.get": 300,
+}
+
+class ResponseCache:
+    # Salt-okunur GSC yanıtları için TTL + LRU önbellek. Anahtar: (endpoint, site_url, ...) demeti.
+    # Süreler duvar saatiyle tutulur ki diske yazılan kayıtlar yeniden başlatmadan sonra da geçerli olsun.
+    def __init__(self, ttl: Optional[Dict[str, float]] = None, max_entries: int = CACHE_MAX_ENTRIES,
+                 path: Optional[str] = None):
+        self.ttl = dict(CACHE_TTL if ttl is None else ttl)
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Tuple, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        if path:
+            self.load()
+
+    def __len__(self):
+        return len(self._data)
+
+    def cacheable(self, endpoint: str) -> bool:
+        return self.ttl.get(endpoint, 0) > 0
+
+    def get(self, key: Tuple):
+        # (bulundu_mu, değer)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[1]
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple, value):
+        ttl = self.ttl.get(key[0], 0)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_or_fetch(self, key: Tuple, fetch: Callable[[], object]):
+        found, value = self.get(key)
+        if found:
+            return value
+        value = fetch()
+        self.put(key, value)
+        return value
+
+    def invalidate(self, *keys: Tuple):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._data),
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def summary(self) -> str:
+        st = self.stats()
+        return f"Önbellek: {st['hits']} isabet / {st['misses']} ıska, {st['entries']} kayıt"
+
+    # ---------- Persistence ----------
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        with self._lock:
+            for key, expires, value in raw:
+                if expires > now:
+                    self._data[tuple(key)] = (expires, value)
+
+    def save(self):
+        if not self.path:
+            return
+        now = time.time()
+        with self._lock:
+            raw = [[list(k), exp, v] for k, (exp, v) in self._data.items() if exp > now]
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(raw, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
@@ -0,0 +1,246 @@
+import argparse
+import os
+import sys
+
+from gsc_core import (SUBMIT_RATE_PER_PROPERTY, SUBMIT_WORKERS, connect, fetch_statuses, iter_existing_sitemaps,
+                      submit_sitemaps)
+from gsc_metrics import METRICS_ENV, MetricsRegistry, ThreadProfiler
+
+# Tk'siz, cron/daemon dostu giriş noktası:  python -m gsc_cli <komut> ...
+# Sonuçlar stdout'a (TAB ayrılmış), log mesajları stderr'e yazılır.
+
+def _log(msg: str):
+    print(msg, file=sys.stderr, flush=True)
+
+def _iter_urls(args):
+    # Dosya/stdin akış halinde okunur; aynı URL iki kez işlenmez.
+    from gsc_import import iter_sitemap_urls, normalize_url
+    seen = set()
+    def fresh(urls):
+        for u in urls:
+            if u and u not in seen:
+                seen.add(u)
+                yield u
+    yield from fresh(normalize_url(u) for u in args.urls)
+    if args.file:
+        yield from fresh(iter_sitemap_urls(args.file))
+
+def _connect(args):
+    cache = None
+    if not args.no_cache:
+        from gsc_cache import CACHE_FILE, ResponseCache
+        cache = ResponseCache(path=CACHE_FILE)
+    return connect(_log, cache=cache, metrics=args.metrics_registry)
+
+def _finish_metrics(args, metrics, profiler):
+    if args.stats:
+        _log(metrics.report().rstrip())
+    try:
+        if args.metrics:
+            metrics.stop()
+            _log(f"📈 Metrikler yazıldı: {args.metrics}")
+        if profiler is not None:
+            top = profiler.dump(args.profile)
+            _log(f"🔬 Profil kaydedildi: {args.profile}\n{top.rstrip()}")
+    except OSError as e:
+        _log(f"HATA (metrik/profil kaydetme): {e}")
+
+def cmd_submit(args) -> int:
+    client = args.client
+    def on_result(res):
+        if res.ok:
+            print(f"OK\t{res.url}", flush=True)
+        else:
+            print(f"ERR\t{res.url}\t{res.error}", flush=True)
+    from gsc_history import HISTORY_DB, SubmissionHistory
+    history = SubmissionHistory(HISTORY_DB)
+    try:
+        engine_opts = {"rate_per_property": args.rate}
+        if args.workers:
+            engine_opts["workers"] = args.workers
+        summary = submit_sitemaps(client, _iter_urls(args), on_result=on_result, history=history,
+                                  incremental=args.incremental, **engine_opts)
+    finally:
+        history.close()
+    _log(f"Tamamlandı. Başarılı: {summary.ok}/{summary.total} — "
+         f"{summary.throughput:.1f} submit/sn ({summary.elapsed:.1f} sn)")
+    if args.incremental:
+        _log(f"♻️ {summary.skipped} sitemap değişmemiş, {summary.skipped} API çağrısı önlendi.")
+    return 0 if summary.failed == 0 else 1
+
+def cmd_list(args) -> int:
+    client = args.client
+    total = 0
+    for site_url, sm_url, sm in iter_existing_sitemaps(client, _log):
+        print(f"{site_url}\t{sm_url}\t{sm.get('lastSubmitted', '')}")
+        total += 1
+    _log(f"Toplam {total} sitemap bulundu.")
+    return 0
+
+def cmd_status(args) -> int:
+    client = args.client
+    rows = fetch_statuses(client, _iter_urls(args))
+    from gsc_history import HISTORY_DB, SubmissionHistory
+    history = SubmissionHistory(HISTORY_DB)
+    history.record_statuses(rows)
+    history.close()
+    print("url\tsite\tpending\tlast_downloaded\terrors\twarnings\tsubmitted\tindexed\terror")
+    for r in rows:
+        print(f"{r.url}\t{r.site_url or ''}\t{r.is_pending}\t{r.last_downloaded}\t{r.errors}\t"
+              f"{r.warnings}\t{r.submitted}\t{r.indexed}\t{r.error}")
+    return 0 if not any(r.error for r in rows) else 1
+
+def cmd_performance(args) -> int:
+    from gsc_analytics import ANALYTICS_DB, AnalyticsStore, sync_sites
+    client = args.client
+    sites = [args.site] if args.site else [s.get("siteUrl") for s in client.sites_list()]
+    store = AnalyticsStore(ANALYTICS_DB)
+    failed = 0
+    def on_site(site_url, n_rows, err):
+        nonlocal failed
+        if err is not None:
+            failed += 1
+            _log(f"⚠️ {site_url} performans alınamadı: {err}")
+        else:
+            _log(f"📊 {site_url}: {n_rows} yeni satır")
+    try:
+        start, end = sync_sites(client, store, sites, days=args.days, detail=not args.no_detail, on_site=on_site)
+        print("site\tclicks\timpressions\tctr\tposition")
+        for site_url in sites:
+            p = store.summary(site_url, start, end)
+            print(f"{site_url}\t{p['clicks']:.0f}\t{p['impressions']:.0f}\t{p['ctr']}\t{p['position']}")
+    finally:
+        store.close()
+    return 0 if failed == 0 else 1
+
+def cmd_login(args) -> int:
+    from gsc_credentials import login
+    path = login(args.name, _log, client_secrets=args.client_secrets)
+    _log(f"🔑 '{args.name}' hesabı eklendi: {path}. Sonraki bağlantıda havuza katılır.")
+    return 0
+
+def cmd_watch(args) -> int:
+    import threading
+    from gsc_history import HISTORY_DB, SubmissionHistory
+    from gsc_watch import WATCH_WORKERS, SitemapWatcher
+    history = SubmissionHistory(HISTORY_DB)
+    def on_check(url, changed, interval, error):
+        if error:
+            _log(f"⚠️ {url}: {error} (sonraki kontrol {interval / 60:.0f} dk)")
+        elif changed:
+            _log(f"♻️ Değişti: {url} (sonraki kontrol {interval / 60:.0f} dk)")
+    def on_result(res):
+        print(f"{'OK' if res.ok else 'ERR'}\t{res.url}\t{res.error}".rstrip("\t"), flush=True)
+    opts = {k: v for k, v in (("min_interval", args.min), ("max_interval", args.max)) if v}
+    watcher = SitemapWatcher(args.client, history, workers=args.workers or WATCH_WORKERS, on_check=on_check,
+                             on_result=on_result, **opts)
+    _log(f"👁️ {watcher.add(_iter_urls(args))} sitemap izleniyor (Ctrl+C ile durdurun)…")
+    try:
+        watcher.run(threading.Event())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        history.close()
+        _log(watcher.summary())
+    return 0
+
+def cmd_validate(args) -> int:
+    from gsc_validator import VALIDATE_CONNECTIONS, validate_sitemaps
+    print("url\tparent\tkind\tentries\tbytes\tgzip\tok\tissues")
+    def on_result(r):
+        print(f"{r.url}\t{r.parent or ''}\t{r.kind}\t{r.entries}\t{r.size}\t{r.compressed}\t{r.ok}\t{r.issues}",
+              flush=True)
+    summary = validate_sitemaps(_iter_urls(args), connections=args.connections or VALIDATE_CONNECTIONS, expand=not args.no_expand,
+                                on_result=on_result)
+    _log(f"Doğrulama tamamlandı: {summary.valid}/{summary.total} geçerli, "
+         f"{summary.expanded} alt sitemap genişletildi ({summary.elapsed:.1f} sn)")
+    return 0 if summary.invalid == 0 else 1
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m gsc_cli", description="GSC Sitemap Submitter (CLI)")
+    parser.add_argument("--no-cache", action="store_true", help="Yanıt önbelleğini (gsc_cache.json) kullanma")
+    parser.add_argument("--metrics", metavar="DOSYA", default=os.environ.get(METRICS_ENV),
+                        help=f"Gecikme metriklerini Prometheus textfile olarak yaz (ortam: {METRICS_ENV})")
+    parser.add_argument("--stats", action="store_true", help="Bitişte uç nokta / mülk gecikme tablosunu stderr'e yaz")
+    parser.add_argument("--profile", metavar="DOSYA", help="Komutu cProfile ile ölç, .prof olarak kaydet")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_url_args(p):
+        p.add_argument("urls", nargs="*", help="Sitemap URL'leri")
+        p.add_argument("-f", "--file", help="URL listesi: .txt / .csv / .gz ('-' = stdin)")
+
+    p = sub.add_parser("submit", help="Sitemap'leri GSC'ye gönder")
+    add_url_args(p)
+    p.add_argument("-w", "--workers", type=int, help="İşçi sayısı (varsayılan: AIMD üst sınırı; "
+                                                     f"başlangıç eşzamanlılığı {SUBMIT_WORKERS})")
+    p.add_argument("-r", "--rate", type=float, default=SUBMIT_RATE_PER_PROPERTY,
+                   help="Mülk başına saniyede submit")
+    p.add_argument("-i", "--incremental", action="store_true",
+                   help="Son başarılı submit'ten beri değişmeyen sitemap'leri atla (gsc_history.sqlite)")
+    p.set_defaults(func=cmd_submit)
+
+    p = sub.add_parser("list", help="GSC'de kayıtlı sitemap'leri listele")
+    p.set_defaults(func=cmd_list)
+
+    p = sub.add_parser("status", help="Sitemap durumlarını kontrol et")
+    add_url_args(p)
+    p.set_defaults(func=cmd_status)
+
+    p = sub.add_parser("login", help="Ek Google hesabı yetkilendir (tokens/<ad>.json)")
+    p.add_argument("name", help="Hesap adı, ör. ajans2")
+    p.add_argument("--client-secrets", default="credentials.json",
+                   help="OAuth istemci dosyası (farklı Cloud projesi için ayrı dosya)")
+    p.set_defaults(func=cmd_login, offline=True)
+
+    p = sub.add_parser("watch", help="Sitemap'leri koşullu GET ile izle, yalnızca değişenleri submit et")
+    add_url_args(p)
+    p.add_argument("-w", "--workers", type=int, help="Eşzamanlı kontrol sayısı")
+    p.add_argument("--min", type=float, help="En kısa kontrol aralığı (sn)")
+    p.add_argument("--max", type=float, help="En uzun kontrol aralığı (sn)")
+    p.set_defaults(func=cmd_watch)
+
+    p = sub.add_parser("validate", help="Sitemap'leri indirip doğrula, index'leri genişlet (GSC'ye bağlanmaz)")
+    add_url_args(p)
+    p.add_argument("-c", "--connections", type=int, help="Eşzamanlı indirme sayısı")
+    p.add_argument("--no-expand", action="store_true", help="Index'lerin alt sitemap'lerini indirme")
+    p.set_defaults(func=cmd_validate, offline=True)
+
+    p = sub.add_parser("performance", help="Search Analytics özeti")
+    p.add_argument("-s", "--site", help="Yalnızca bu mülk (varsayılan: tümü)")
+    p.add_argument("-d", "--days", type=int, default=7, help="Gün sayısı")
+    p.add_argument("--no-detail", action="store_true", help="Sayfa/sorgu kırılımını indirme, yalnızca günlük toplamlar")
+    p.set_defaults(func=cmd_performance)
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    client = None
+    metrics = args.metrics_registry = MetricsRegistry()
+    if args.metrics:
+        metrics.start_exporter(args.metrics, _log)
+    profiler = ThreadProfiler() if args.profile else None
+    try:
+        client = args.client = None if getattr(args, "offline", False) else _connect(args)
+        if profiler is None:
+            return args.func(args)
+        with profiler:
+            return args.func(args)
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        _log(f"HATA: {e}")
+        return 2
+    finally:
+        if client is not None:
+            _log(client.scheduler.summary())
+            try:
+                client.scheduler.quota.save()
+                if client.cache is not None:
+                    _log(client.cache.summary())
+                    client.cache.save()
+            except OSError as e:
+                _log(f"HATA (durum kaydetme): {e}")
+        _finish_metrics(args, metrics, profiler)
+
+if __name__ == "__main__":
+    sys.exit(main())
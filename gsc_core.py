@@ -0,0 +1,504 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from gsc_metrics import API_CALL, API_REQUEST, MetricsRegistry
+from gsc_scheduler import MAX_CONCURRENCY
+from gsc_workers import bounded_map
+
+SCOPES = ["https://www.googleapis.com/auth/webmasters"]
+SUBMIT_WORKERS = 8              # eşzamanlı submit işçisi
+SUBMIT_RATE_PER_PROPERTY = 5.0  # mülk başına saniyede submit
+SUBMIT_BURST = 10               # mülk başına anlık patlama kapasitesi
+STATUS_WORKERS = 8              # durum kontrolünde paralel mülk sorgusu
+PROPERTY_INDEX_TTL = 300        # sn; doğrulanmış mülk indeksinin yeniden kurulma aralığı
+PARTIAL_INDEX_TTL = 60          # sn; bir hesabın mülkleri alınamadıysa indeks bu kadar sonra yeniden kurulur
+SERVICE_POOL_SIZE = MAX_CONCURRENCY + 2  # submit sürerken listeleme/durum için pay
+HTTP_TIMEOUT = 60
+API_ENDPOINT_ENV = "GSC_API_ENDPOINT"  # ör. yerel sahte sunucu: http://127.0.0.1:8080/webmasters/v3/
+# sites.list permissionLevel; birden çok hesap aynı mülke erişiyorsa en yetkilisi kullanılır
+PERMISSION_RANK = {"siteOwner": 3, "siteFullUser": 2, "siteRestrictedUser": 1, "siteUnverifiedUser": 0}
+
+# Google istemci modülleri yalnızca gerektiğinde yüklenir; bu modül Tk'ye de bağımlı değildir.
+
+# -------------------- OAuth --------------------
+def get_credentials(log_fn, token_path: str = "token.json", client_secrets: str = "credentials.json"):
+    from google.oauth2.credentials import Credentials
+    if os.path.exists(token_path):
+        log_fn(f"Mevcut {token_path} bulundu, kimlik doğrulanıyor…")
+        return Credentials.from_authorized_user_file(token_path, SCOPES)
+    if not os.path.exists(client_secrets):
+        raise FileNotFoundError(f"{client_secrets} yok! Google Cloud → OAuth 'Desktop app' oluşturup bu klasöre koyun.")
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    log_fn("Tarayıcı ile OAuth akışı başlatılıyor…")
+    flow = InstalledAppFlow.from_client_secrets_file(client_secrets, SCOPES)
+    creds = flow.run_local_server(port=0)
+    if os.path.dirname(token_path):
+        os.makedirs(os.path.dirname(token_path), exist_ok=True)
+    with open(token_path, "w", encoding="utf-8") as f:
+        f.write(creds.to_json())
+    log_fn(f"OAuth tamamlandı, {token_path} kaydedildi.")
+    return creds
+
+# -------------------- Helpers --------------------
+def base_prefix_from_sitemap(sitemap_url: str) -> str:
+    p = urlparse(sitemap_url.strip())
+    if not p.scheme or not p.netloc:
+        raise ValueError("Geçersiz URL (şema/host yok)")
+    return f"{p.scheme}://{p.netloc}/"
+
+def is_probably_sitemap(u: str) -> bool:
+    u = u.strip().lower()
+    return u.endswith(".xml") or "sitemap" in u
+
+def sitemap_full_url(site_url: str, sm_path: str) -> str:
+    # GSC path'i göreliyse site_url ile birleştir
+    if sm_path.startswith("/"):
+        return site_url.rstrip("/") + sm_path
+    return sm_path
+
+# -------------------- Service Pool --------------------
+class SharedCredentials:
+    # Tüm işçiler aynı kimliği kullanır; yenileme tek kilit altında ve bir kez yapılır.
+    def __init__(self, creds):
+        self._creds = creds
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self._creds, name)
+
+    def refresh(self, request):
+        seen = self._creds.token
+        with self._lock:
+            if self._creds.token != seen and self._creds.valid:
+                return  # biz beklerken başka bir işçi yeniledi
+            self._creds.refresh(request)
+
+    def before_request(self, request, method, url, headers):
+        if not self._creds.valid:
+            self.refresh(request)
+        self._creds.apply(headers)
+
+class ServicePool:
+    # httplib2 taşıyıcısı thread-safe değil: her kiralama kendi AuthorizedHttp'sine sahip bir
+    # servis alır. Servisler geri verildiğinde TLS bağlantıları açık kalır (keep-alive).
+    _discovery_doc = None
+
+    def __init__(self, creds, size: int = SERVICE_POOL_SIZE, timeout: float = HTTP_TIMEOUT,
+                 api_endpoint: Optional[str] = None):
+        self.creds = SharedCredentials(creds)
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.api_endpoint = api_endpoint  # None = googleapis.com
+        self._idle = queue.LifoQueue()  # en son kullanılan = bağlantısı en sıcak olan
+        self._created = 0
+        self.in_use = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _document(cls):
+        if cls._discovery_doc is None:
+            from googleapiclient.discovery_cache import get_static_doc
+            cls._discovery_doc = get_static_doc("webmasters", "v3")
+        return cls._discovery_doc
+
+    def _new_service(self):
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build_from_document
+        http = AuthorizedHttp(self.creds, http=httplib2.Http(timeout=self.timeout))
+        options = {"api_endpoint": self.api_endpoint} if self.api_endpoint else None
+        return build_from_document(self._document(), http=http, client_options=options)
+
+    @contextmanager
+    def lease(self):
+        try:
+            svc = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            if create:
+                try:
+                    svc = self._new_service()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                svc = self._idle.get()
+        with self._lock:
+            self.in_use += 1
+        try:
+            yield svc
+        finally:
+            with self._lock:
+                self.in_use -= 1
+            self._idle.put(svc)
+
+    def execute(self, make_request):
+        # make_request(service) -> HttpRequest; örn. lambda s: s.sites().list()
+        with self.lease() as svc:
+            return make_request(svc).execute()
+
+# -------------------- Rate Limit --------------------
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, keep_waiting: Optional[Callable[[], bool]] = None) -> bool:
+        # keep_waiting() her beklemeden sonra sorulur; False dönerse jeton alınmadan False döner
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait_s = (1 - self._tokens) / self.rate
+            time.sleep(wait_s)
+            if keep_waiting is not None and not keep_waiting():
+                return False
+
+# -------------------- Submit Engine --------------------
+@dataclass
+class SubmitResult:
+    url: str
+    prefix: Optional[str]
+    ok: bool
+    error: str = ""
+    seconds: float = 0.0
+
+@dataclass
+class SubmitSummary:
+    total: int
+    ok: int
+    elapsed: float
+    skipped: int = 0  # artımlı modda değişmediği için gönderilmeyen (önlenen API çağrısı)
+
+    @property
+    def failed(self) -> int:
+        return self.total - self.ok
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+class SubmitEngine:
+    # submit_fn(prefix, url) tek bir sitemap'i gönderir; işçi thread'lerinde çağrılır.
+    # should_run() her submit'ten hemen önce işçi thread'inde sorulur (duraklatmada bekleyebilir);
+    # False dönerse sıradaki sitemap API çağrısı yapılmadan bırakılır ve sonuçlara girmez.
+    def __init__(self, submit_fn: Callable[[str, str], object], workers: int = SUBMIT_WORKERS,
+                 rate_per_property: float = SUBMIT_RATE_PER_PROPERTY, burst: float = SUBMIT_BURST,
+                 resolve: Callable[[str], str] = base_prefix_from_sitemap,
+                 should_run: Optional[Callable[[], bool]] = None):
+        self.submit_fn = submit_fn
+        self.should_run = should_run or (lambda: True)
+        self.workers = max(1, workers)
+        self.rate_per_property = rate_per_property
+        self.burst = burst
+        self.resolve = resolve
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    def _bucket(self, prefix: str) -> TokenBucket:
+        with self._buckets_lock:
+            b = self._buckets.get(prefix)
+            if b is None:
+                b = self._buckets[prefix] = TokenBucket(self.rate_per_property, self.burst)
+            return b
+
+    def _submit_one(self, url: str) -> Optional[SubmitResult]:
+        if not self.should_run():
+            return None
+        t0 = time.monotonic()
+        prefix = None
+        try:
+            prefix = self.resolve(url)
+            if not self._bucket(prefix).acquire(self.should_run):  # hız sınırı beklenirken iptal edildi
+                return None
+            self.submit_fn(prefix, url)
+            return SubmitResult(url, prefix, True, seconds=time.monotonic() - t0)
+        except Exception as e:
+            return SubmitResult(url, prefix, False, str(e), time.monotonic() - t0)
+
+    def run(self, urls: Iterable[str], on_result: Optional[Callable[[SubmitResult], None]] = None) -> SubmitSummary:
+        # on_result çağıran thread'de çalışır; aynı anda en fazla workers*4 iş bekletilir.
+        total = ok = 0
+        start = time.monotonic()
+        for _, fut in bounded_map(self._submit_one, urls, self.workers, self.workers * 4, name="gsc-submit"):
+            res = fut.result()
+            if res is None:
+                continue
+            total += 1
+            ok += res.ok
+            if on_result:
+                on_result(res)
+        return SubmitSummary(total, ok, time.monotonic() - start)
+
+# -------------------- GSC Client --------------------
+class GscClient:
+    # Uygulamadaki tüm webmasters v3 çağrıları buradan geçer. `pool` (gsc_credentials.CredentialPool)
+    # her çağrıyı mülke erişimi olan hesabın servis havuzuna yönlendirir. `cache` (gsc_cache.ResponseCache)
+    # verilirse salt-okunur yanıtlar önbellekten gelir; submit ilgili kayıtları geçersiz kılar.
+    # `scheduler` (gsc_scheduler.RequestScheduler) yeniden deneme, AIMD ve kota takibini üstlenir.
+    # `metrics` (gsc_metrics.MetricsRegistry) her HTTP denemesini ve mantıksal çağrıyı uç nokta + mülk başına ölçer.
+    def __init__(self, pool, cache=None, scheduler=None, metrics=None, log_fn=None):
+        self.pool = pool
+        self.cache = cache
+        self.scheduler = scheduler
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self.log_fn = log_fn or (lambda *_: None)
+        self.sites_partial = False  # son sites.list'te en az bir hesabın mülkleri alınamadı
+        self._index = None
+        self._index_built = 0.0
+        self._index_lock = threading.Lock()
+
+    def property_index(self):
+        # sites.list üzerinden kurulan gsc_properties.PropertyIndex; PROPERTY_INDEX_TTL boyunca yeniden kullanılır
+        with self._index_lock:
+            ttl = PARTIAL_INDEX_TTL if self.sites_partial else PROPERTY_INDEX_TTL
+            if self._index is None or time.monotonic() - self._index_built > ttl:
+                from gsc_properties import PropertyIndex
+                self._index = PropertyIndex(self.sites_list())
+                self._index_built = time.monotonic()
+            return self._index
+
+    def resolve(self, sitemap_url: str) -> str:
+        # Sitemap'in ait olduğu doğrulanmış mülk; yoksa API çağrısı yapmadan UnownedPropertyError
+        return self.property_index().resolve_or_raise(sitemap_url)
+
+    def _call(self, endpoint: str, site_url: Optional[str], make_request, account=None):
+        account = account or self.pool.for_site(site_url)
+        labels = {"endpoint": endpoint, "property": site_url or ""}
+
+        def attempt():
+            with self.metrics.timer(API_REQUEST, **labels):
+                return account.pool.execute(make_request)
+
+        with self.metrics.timer(API_CALL, **labels):
+            if self.scheduler is None:
+                return attempt()
+            if len(self.pool) > 1:
+                endpoint = f"{endpoint}@{account.name}"  # kota hesap (Cloud projesi) başına sayılır
+            return self.scheduler.call(endpoint, site_url, attempt)
+
+    def _read(self, key: tuple, site_url: Optional[str], make_request):
+        if self.cache is None or not self.cache.cacheable(key[0]):
+            return self._call(key[0], site_url, make_request)
+        return self.cache.get_or_fetch(key, lambda: self._call(key[0], site_url, make_request))
+
+    def _sites_list_all(self) -> dict:
+        # Her hesabın mülkleri birleştirilir; mülk başına en yüksek yetkiye sahip hesaplar da saklanır.
+        entries, accounts, ranks, errors = {}, {}, {}, []
+        for account in self.pool.accounts:
+            try:
+                resp = self._call("sites.list", None, lambda s: s.sites().list(), account=account)
+            except Exception as e:
+                errors.append(e)
+                self.log_fn(f"⚠️ {account.name} hesabının mülkleri alınamadı: {e}")
+                continue
+            for e in resp.get("siteEntry", []):
+                site_url, rank = e.get("siteUrl"), PERMISSION_RANK.get(e.get("permissionLevel"), 0)
+                best = ranks.get(site_url, -1)
+                if rank > best:
+                    entries[site_url], ranks[site_url] = e, rank
+                    accounts[site_url] = [account.name]
+                elif rank == best:
+                    accounts[site_url].append(account.name)
+        if errors and len(errors) == len(self.pool.accounts):
+            raise errors[0]
+        return {"siteEntry": list(entries.values()), "accounts": accounts, "partial": bool(errors)}
+
+    def sites_list(self):
+        key = ("sites.list", *self.pool.names)
+        cached = self.cache is not None and self.cache.cacheable(key[0])
+        found, resp = self.cache.get(key) if cached else (False, None)
+        if not found:
+            resp = self._sites_list_all()
+            if cached and not resp["partial"]:
+                self.cache.put(key, resp)  # eksik sonuç saklanmaz; hesap düzelince bir sonraki çağrı tamamlar
+        self.sites_partial = resp.get("partial", False)
+        self.pool.set_site_accounts(resp.get("accounts", {}))
+        return resp.get("siteEntry", [])
+
+    def sitemaps_list(self, site_url: str, sitemap_index: Optional[str] = None):
+        # sitemap_index verilirse yalnızca o index'in alt sitemap'leri listelenir
+        if sitemap_index is None:
+            return self._read(("sitemaps.list", site_url), site_url,
+                              lambda s: s.sitemaps().list(siteUrl=site_url)).get("sitemap", [])
+        return self._read(("sitemaps.list", site_url, sitemap_index), site_url,
+                          lambda s: s.sitemaps().list(siteUrl=site_url, sitemapIndex=sitemap_index)).get("sitemap", [])
+
+    def sitemaps_get(self, site_url: str, feedpath: str):
+        return self._read(("sitemaps.get", site_url, feedpath), site_url,
+                          lambda s: s.sitemaps().get(siteUrl=site_url, feedpath=feedpath))
+
+    def sitemaps_submit(self, site_url: str, feedpath: str):
+        try:
+            return self._call("sitemaps.submit", site_url,
+                              lambda s: s.sitemaps().submit(siteUrl=site_url, feedpath=feedpath))
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(("sitemaps.list", site_url), ("sitemaps.get", site_url, feedpath))
+
+    def searchanalytics_query(self, site_url: str, body: dict):
+        return self._call("searchanalytics.query", site_url,
+                          lambda s: s.searchanalytics().query(siteUrl=site_url, body=body))
+
+def connect(log_fn, cache=None, scheduler=None, api_endpoint: Optional[str] = None, metrics=None) -> GscClient:
+    from gsc_credentials import CredentialPool, anonymous_account, load_accounts
+    api_endpoint = api_endpoint or os.environ.get(API_ENDPOINT_ENV)
+    if api_endpoint:
+        log_fn(f"🧪 API adresi: {api_endpoint} (OAuth atlandı)")
+        pool = CredentialPool([anonymous_account(api_endpoint)])
+    else:
+        pool = CredentialPool(load_accounts(log_fn))
+    if len(pool) > 1:
+        log_fn(f"🔑 {len(pool)} hesap yüklendi: {', '.join(pool.names)}")
+    if scheduler is None:
+        # her hesap kendi kotası ve bağlantı havuzuyla gelir; eşzamanlılık tavanı hesap sayısıyla büyür
+        from gsc_scheduler import QUOTA_FILE, AdaptiveLimiter, QuotaTracker, RequestScheduler
+        n = len(pool)
+        scheduler = RequestScheduler(AdaptiveLimiter(start=SUBMIT_WORKERS * n, maximum=MAX_CONCURRENCY * n),
+                                     quota=QuotaTracker(path=QUOTA_FILE))
+    pool.start_refresher(log_fn)
+    return GscClient(pool, cache=cache, scheduler=scheduler, metrics=metrics, log_fn=log_fn)
+
+# -------------------- Operations --------------------
+def iter_existing_sitemaps(client: GscClient, log_fn):
+    # (site_url, sitemap_url, sitemap kaynağı) üçlülerini üretir
+    from googleapiclient.errors import HttpError
+    for site in client.sites_list():
+        site_url = site.get("siteUrl")
+        log_fn(f"🌐 Site: {site_url}")
+        try:
+            for sm in client.sitemaps_list(site_url):
+                yield site_url, sitemap_full_url(site_url, sm.get("path")), sm
+        except HttpError as e:
+            log_fn(f"   ⚠️ Sitemap bilgisi alınamadı: {e}")
+
+def unowned_sitemaps(client: GscClient, urls: Iterable[str]) -> List[str]:
+    # Doğrulanmış bir mülke düşmeyen URL'ler (yerelde, API çağrısı olmadan)
+    index = client.property_index()
+    return [u for u in urls if index.resolve(u) is None]
+
+def submit_sitemaps(client: GscClient, urls: Iterable[str], on_result=None, history=None,
+                    incremental: bool = False, on_skip=None, **engine_opts) -> SubmitSummary:
+    # history: gsc_history.SubmissionHistory; incremental=True ise değişmeyen sitemap'ler atlanır (on_skip(url)).
+    planner = None
+    if incremental and history is not None:
+        from gsc_history import IncrementalPlanner
+        planner = IncrementalPlanner(history, on_skip=on_skip)
+        urls = planner.iter_changed(urls)
+
+    def record(res):
+        if history is not None:
+            history.record_submit(res.url, res.prefix, res.ok, res.error)
+        if on_result:
+            on_result(res)
+
+    if client.scheduler is not None:
+        # gerçek eşzamanlılığı AIMD sınırlayıcısı belirler; işçi sayısı onun üst sınırı kadar olmalı
+        engine_opts.setdefault("workers", client.scheduler.limiter.maximum)
+    engine_opts.setdefault("resolve", client.resolve)
+    engine = SubmitEngine(client.sitemaps_submit, **engine_opts)
+    summary = engine.run(urls, on_result=record)
+    if planner is not None:
+        summary.skipped = planner.skipped
+    return summary
+
+NOT_SUBMITTED = "GSC'de kayıtlı değil (gönderilmemiş)"
+
+@dataclass
+class SitemapStatus:
+    url: str
+    site_url: Optional[str]
+    found: bool = False
+    is_pending: bool = False
+    last_downloaded: str = ""
+    last_submitted: str = ""
+    errors: int = 0
+    warnings: int = 0
+    submitted: int = 0
+    indexed: int = 0
+    error: str = ""
+
+    @classmethod
+    def from_resource(cls, url: str, site_url: str, sm: dict) -> "SitemapStatus":
+        contents = sm.get("contents", [])
+        return cls(url, site_url, True,
+                   is_pending=bool(sm.get("isPending", False)),
+                   last_downloaded=sm.get("lastDownloaded", ""),
+                   last_submitted=sm.get("lastSubmitted", ""),
+                   errors=int(sm.get("errors", 0)),
+                   warnings=int(sm.get("warnings", 0)),
+                   submitted=sum(int(c.get("submitted", 0)) for c in contents),
+                   indexed=sum(int(c.get("indexed", 0)) for c in contents))
+
+def fetch_statuses(client: GscClient, urls: Iterable[str], workers: int = STATUS_WORKERS,
+                   resolve: Optional[Callable[[str], str]] = None) -> List[SitemapStatus]:
+    # URL başına sitemaps.get yerine mülk başına tek sitemaps.list (paralel), sonuçlar yerelde eşlenir.
+    # Listede çıkmayanlar için mülkün index'leri (isSitemapsIndex) index başına bir kez genişletilir;
+    # yine bulunamayanlar API çağrısı yapılmadan NOT_SUBMITTED olarak işaretlenir.
+    resolve = resolve or client.resolve
+    urls = list(dict.fromkeys(urls))
+    results: Dict[str, SitemapStatus] = {}
+    groups = defaultdict(list)
+    for u in urls:
+        try:
+            groups[resolve(u)].append(u)
+        except Exception as e:
+            results[u] = SitemapStatus(u, None, error=str(e))
+
+    def list_site(site_url):
+        wanted = groups[site_url]
+        by_url, expanded, index_error = {}, set(), None
+
+        def add(entries):
+            for sm in entries:
+                by_url.setdefault(sitemap_full_url(site_url, sm.get("path", "")), sm)
+        add(client.sitemaps_list(site_url))
+        while any(u not in by_url for u in wanted):
+            indexes = [u for u, sm in by_url.items() if sm.get("isSitemapsIndex") and u not in expanded]
+            if not indexes:
+                break
+            for index_url in indexes:
+                expanded.add(index_url)
+                try:
+                    add(client.sitemaps_list(site_url, sitemap_index=index_url))
+                except Exception as e:
+                    index_error = e
+        return by_url, index_error
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="gsc-status") as ex:
+        futures = {ex.submit(list_site, site_url): site_url for site_url in groups}
+        for fut in futures:
+            site_url = futures[fut]
+            try:
+                by_url, index_error = fut.result()
+            except Exception as e:
+                for u in groups[site_url]:
+                    results[u] = SitemapStatus(u, site_url, error=str(e))
+                continue
+            missing = NOT_SUBMITTED if index_error is None else f"Index alt listesi alınamadı: {index_error}"
+            for u in groups[site_url]:
+                sm = by_url.get(u)
+                if sm is None:
+                    results[u] = SitemapStatus(u, site_url, error=missing)
+                else:
+                    results[u] = SitemapStatus.from_resource(u, site_url, sm)
+    return [results[u] for u in urls]
@@ -0,0 +1,138 @@
+import datetime
+import glob
+import os
+import threading
+from typing import Dict, List, Optional
+
+from gsc_core import HTTP_TIMEOUT, SERVICE_POOL_SIZE, ServicePool, get_credentials
+
+LEGACY_TOKEN = "token.json"
+TOKENS_DIR = "tokens"          # ek hesaplar: tokens/<ad>.json (python -m gsc_cli login <ad>)
+CLIENT_SECRETS = "credentials.json"
+REFRESH_AHEAD = 300.0          # sn; bitişine bu kadar kalan token arka planda yenilenir
+REFRESH_INTERVAL = 60.0        # sn; token bitiş kontrol aralığı
+
+def token_path(name: str) -> str:
+    return os.path.join(TOKENS_DIR, f"{name}.json")
+
+def token_files() -> List[str]:
+    paths = [LEGACY_TOKEN] if os.path.exists(LEGACY_TOKEN) else []
+    return paths + sorted(glob.glob(os.path.join(TOKENS_DIR, "*.json")))
+
+def _account_name(path: str) -> str:
+    return "default" if path == LEGACY_TOKEN else os.path.splitext(os.path.basename(path))[0]
+
+class Account:
+    # Tek bir OAuth kimliği (Google hesabı / Cloud projesi) ve ona ait servis havuzu.
+    def __init__(self, name: str, path: Optional[str], creds, pool_size: int = SERVICE_POOL_SIZE,
+                 timeout: float = HTTP_TIMEOUT, api_endpoint: Optional[str] = None):
+        self.name = name
+        self.path = path
+        self.pool = ServicePool(creds, size=pool_size, timeout=timeout, api_endpoint=api_endpoint)
+        self.creds = self.pool.creds  # SharedCredentials: işçilerle aynı kilit
+
+    def seconds_left(self) -> Optional[float]:
+        expiry = getattr(self.creds, "expiry", None)  # google-auth: saat dilimsiz UTC
+        if expiry is None:
+            return None
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds()
+
+    def refresh(self):
+        import httplib2
+        from google_auth_httplib2 import Request
+        self.creds.refresh(Request(httplib2.Http(timeout=self.pool.timeout)))
+        self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.creds.to_json())
+        os.replace(tmp, self.path)
+
+def load_accounts(log_fn, client_secrets: str = CLIENT_SECRETS) -> List[Account]:
+    # token.json (varsa) + tokens/*.json; hiçbiri yoksa tarayıcıda OAuth ile token.json oluşturulur
+    paths = token_files() or [LEGACY_TOKEN]
+    accounts = []
+    for path in paths:
+        creds = get_credentials(log_fn, token_path=path, client_secrets=client_secrets)
+        accounts.append(Account(_account_name(path), path, creds))
+    return accounts
+
+def anonymous_account(api_endpoint: str) -> Account:
+    # Yerel sahte sunucu (fake_gsc_server.py) / test ortamı: kimlik bilgisi gönderilmez
+    from google.auth.credentials import AnonymousCredentials
+    return Account("anon", None, AnonymousCredentials(), api_endpoint=api_endpoint)
+
+def login(name: str, log_fn, client_secrets: str = CLIENT_SECRETS) -> str:
+    # Yeni hesap ekle: tarayıcıda yetkilendir, tokens/<ad>.json'a kaydet
+    path = token_path(name)
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} zaten var; önce silin.")
+    get_credentials(log_fn, token_path=path, client_secrets=client_secrets)
+    return path
+
+class CredentialPool:
+    # Birden çok hesabı tek havuzda toplar. sites.list sonucu mülk -> hesap eşlemesini kurar; her çağrı
+    # o mülke (en yüksek yetkiyle) erişebilen hesaplardan o an en az meşgul olanına gider.
+    def __init__(self, accounts: List[Account]):
+        if not accounts:
+            raise ValueError("En az bir hesap gerekli")
+        self.accounts = accounts
+        self._by_name = {a.name: a for a in accounts}
+        self._sites: Dict[str, List[str]] = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self):
+        return len(self.accounts)
+
+    @property
+    def names(self) -> List[str]:
+        return [a.name for a in self.accounts]
+
+    def set_site_accounts(self, mapping: Dict[str, List[str]]):
+        self._sites = dict(mapping)
+
+    def site_accounts(self) -> Dict[str, List[str]]:
+        return dict(self._sites)
+
+    def for_site(self, site_url: Optional[str]) -> Account:
+        candidates = [self._by_name[n] for n in self._sites.get(site_url, ()) if n in self._by_name]
+        if not candidates:
+            return self.accounts[0]
+        return min(candidates, key=lambda a: a.pool.in_use)
+
+    def execute(self, make_request):
+        return self.accounts[0].pool.execute(make_request)
+
+    # ---------- Token refresh ----------
+    def refresh_expiring(self, log_fn, ahead: float = REFRESH_AHEAD) -> int:
+        n = 0
+        for account in self.accounts:
+            left = account.seconds_left()
+            if left is None or left > ahead:
+                continue
+            try:
+                account.refresh()
+                n += 1
+            except Exception as e:
+                log_fn(f"⚠️ {account.name} hesabının token'ı yenilenemedi: {e}")
+        return n
+
+    def start_refresher(self, log_fn, interval: float = REFRESH_INTERVAL):
+        # İstek anında yenileme beklemesin diye token'lar bitmeden arka planda yenilenir ve diske yazılır.
+        if self._thread is not None:
+            return
+        def loop():
+            while True:
+                self.refresh_expiring(log_fn)
+                if self._stop.wait(interval):
+                    return
+        self._thread = threading.Thread(target=loop, daemon=True, name="gsc-token-refresh")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
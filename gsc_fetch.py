@@ -0,0 +1,46 @@
+import hashlib
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import Optional
+
+FETCH_TIMEOUT = 30
+FETCH_CHUNK = 64 * 1024
+USER_AGENT = "gsc-sitemap-submitter (+https://github.com/ebubekirbastama/gsc-sitemap-submitter-metro)"
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    error: str = ""
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+def fetch_conditional(url: str, etag: Optional[str] = None, last_modified: Optional[str] = None,
+                      timeout: float = FETCH_TIMEOUT) -> FetchResult:
+    # If-None-Match / If-Modified-Since ile GET; gövde akış halinde SHA-256'ya verilir, bellekte tutulmaz.
+    headers = {"User-Agent": USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            h = hashlib.sha256()
+            for chunk in iter(lambda: resp.read(FETCH_CHUNK), b""):
+                h.update(chunk)
+            return FetchResult(url, resp.status, resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+                               h.hexdigest())
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return FetchResult(url, 304, e.headers.get("ETag") or etag,
+                               e.headers.get("Last-Modified") or last_modified)
+        return FetchResult(url, e.code, error=f"HTTP {e.code}")
+    except Exception as e:
+        return FetchResult(url, error=str(e))
@@ -0,0 +1,141 @@
+import sqlite3
+import threading
+import time
+from typing import Iterable, Iterator, Optional
+
+from gsc_fetch import FetchResult, fetch_conditional
+from gsc_workers import bounded_map
+
+HISTORY_DB = "gsc_history.sqlite"
+CHANGE_CHECK_WORKERS = 16  # değişiklik kontrolünde paralel GET
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sitemaps (
+    url TEXT PRIMARY KEY,
+    site_url TEXT,
+    last_submit REAL,
+    last_result TEXT,
+    last_error TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    checked REAL,
+    gsc_last_downloaded TEXT,
+    watch_interval REAL,
+    pending_etag TEXT,
+    pending_last_modified TEXT,
+    pending_hash TEXT,
+    pending_checked REAL
+);
+"""
+# eski veritabanlarına sonradan eklenen sütunlar
+_ADDED_COLUMNS = (("watch_interval", "REAL"), ("pending_etag", "TEXT"), ("pending_last_modified", "TEXT"),
+                  ("pending_hash", "TEXT"), ("pending_checked", "REAL"))
+# başarılı submit: gönderilen içeriğin doğrulayıcıları kalıcı sütunlara taşınır
+_PROMOTE = """
+UPDATE sitemaps SET etag=pending_etag, last_modified=pending_last_modified,
+    content_hash=COALESCE(pending_hash, content_hash),
+    pending_etag=NULL, pending_last_modified=NULL, pending_hash=NULL, pending_checked=NULL
+WHERE url=? AND pending_checked IS NOT NULL
+"""
+
+def content_unchanged(res: FetchResult, row: dict) -> bool:
+    # 304 ya da gövde özeti kayıtlı özetle aynı
+    return res.not_modified or (res.content_hash is not None and res.content_hash == row.get("content_hash"))
+
+class SubmissionHistory:
+    # Sitemap başına son submit zamanı/sonucu, içerik özeti (ETag, Last-Modified, SHA-256)
+    # ve GSC'nin bildirdiği lastDownloaded.
+    def __init__(self, path: str = HISTORY_DB):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        cols = {r["name"] for r in self._db.execute("PRAGMA table_info(sitemaps)")}
+        for col, typ in _ADDED_COLUMNS:
+            if col not in cols:
+                self._db.execute(f"ALTER TABLE sitemaps ADD COLUMN {col} {typ}")
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get(self, url: str) -> Optional[dict]:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM sitemaps WHERE url=?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    def _execute_upsert(self, url: str, fields: dict):
+        cols = ", ".join(fields)
+        marks = ", ".join("?" for _ in fields)
+        updates = ", ".join(f"{c}=excluded.{c}" for c in fields)
+        self._db.execute(f"INSERT INTO sitemaps (url, {cols}) VALUES (?, {marks}) "
+                         f"ON CONFLICT(url) DO UPDATE SET {updates}", (url, *fields.values()))
+
+    def _upsert(self, url: str, **fields):
+        with self._lock, self._db:
+            self._execute_upsert(url, fields)
+
+    def record_submit(self, url: str, site_url: Optional[str], ok: bool, error: str = ""):
+        with self._lock, self._db:
+            self._execute_upsert(url, {"site_url": site_url, "last_submit": time.time(),
+                                       "last_result": "ok" if ok else "error", "last_error": error})
+            if ok:
+                self._db.execute(_PROMOTE, (url,))
+
+    def record_fetch(self, res: FetchResult, commit: bool = False):
+        # Değişmiş olabilecek içeriğin doğrulayıcıları submit başarılı olana kadar pending_* sütunlarında
+        # bekler; iptal edilen bir çalışmada getirilip gönderilmeyen değişiklik sonraki çalışmada yine
+        # değişmiş görünür. commit=True: içerik gönderilenle aynı (ya da izleme taban çizgisi).
+        now = time.time()
+        if commit:
+            fields = {"checked": now, "etag": res.etag, "last_modified": res.last_modified}
+            if res.content_hash:
+                fields["content_hash"] = res.content_hash
+        else:
+            fields = {"checked": now, "pending_etag": res.etag, "pending_last_modified": res.last_modified,
+                      "pending_hash": res.content_hash, "pending_checked": now}
+        self._upsert(res.url, **fields)
+
+    def record_watch(self, url: str, interval: float):
+        self._upsert(url, watch_interval=interval)
+
+    def record_statuses(self, rows: Iterable):
+        # gsc_core.SitemapStatus satırlarından GSC lastDownloaded bilgisini sakla
+        for r in rows:
+            if r.found:
+                self._upsert(r.url, site_url=r.site_url, gsc_last_downloaded=r.last_downloaded)
+
+class IncrementalPlanner:
+    # Daha önce başarıyla gönderilmiş ve içeriği değişmemiş sitemap'leri eler. Değişiklik, kayıtlı
+    # ETag/Last-Modified ile koşullu GET (304) ya da gövdenin SHA-256 özeti üzerinden anlaşılır.
+    def __init__(self, history: SubmissionHistory, workers: int = CHANGE_CHECK_WORKERS, fetch=fetch_conditional,
+                 on_skip=None):
+        self.history = history
+        self.workers = max(1, workers)
+        self.fetch = fetch
+        self.on_skip = on_skip  # on_skip(url): değişmediği için atlanan sitemap; iter_changed'i tüketen thread'de
+        self.checked = 0
+        self.skipped = 0
+
+    def _needs_submit(self, url: str) -> bool:
+        h = self.history.get(url) or {}
+        res = self.fetch(url, h.get("etag"), h.get("last_modified"))
+        if res.error:
+            return True  # emin olamıyoruz; gönder
+        unchanged = content_unchanged(res, h) and h.get("last_result") == "ok"
+        self.history.record_fetch(res, commit=unchanged)
+        return not unchanged
+
+    def iter_changed(self, urls: Iterable[str]) -> Iterator[str]:
+        for url, fut in bounded_map(self._needs_submit, urls, self.workers, self.workers * 4, name="gsc-check"):
+            self.checked += 1
+            if fut.result():
+                yield url
+            else:
+                self.skipped += 1
+                if self.on_skip:
+                    self.on_skip(url)
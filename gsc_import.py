@@ -0,0 +1,95 @@
+import csv
+import gzip
+import io
+import os
+import sys
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from gsc_core import is_probably_sitemap
+
+IMPORT_CHUNK = 2000  # listeye tek seferde aktarılan satır
+
+@dataclass
+class ImportStats:
+    lines: int = 0
+    accepted: int = 0
+    added: int = 0
+    bytes_done: int = 0
+    bytes_total: int = 0   # 0 = bilinmiyor (stdin)
+    cancelled: bool = False
+
+    @property
+    def fraction(self) -> float:
+        return min(1.0, self.bytes_done / self.bytes_total) if self.bytes_total else 0.0
+
+def normalize_url(u: str) -> Optional[str]:
+    u = u.strip().strip("\"'<>")
+    p = urlsplit(u)
+    if p.scheme.lower() not in ("http", "https") or not p.netloc:
+        return None
+    return urlunsplit((p.scheme.lower(), p.netloc.lower(), p.path or "/", p.query, ""))
+
+def _open(source: str):
+    # (metin akışı, ham ikili akış) döner; ilerleme ham akışın konumundan okunur
+    if source == "-":
+        raw = sys.stdin.buffer
+        stream = raw
+    else:
+        raw = open(source, "rb")
+        stream = gzip.GzipFile(fileobj=raw) if source.lower().endswith(".gz") else raw
+    return io.TextIOWrapper(stream, encoding="utf-8", errors="replace", newline=""), raw
+
+def _iter_cells(text, source: str) -> Iterator[str]:
+    name = source.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv"):
+        for row in csv.reader(text):
+            yield from row
+    else:
+        yield from text
+
+def iter_sitemap_urls(source: str, stats: Optional[ImportStats] = None, cancel=None) -> Iterator[str]:
+    # Dosyayı satır satır okur; bellekte yalnızca o anki satır tutulur.
+    stats = stats if stats is not None else ImportStats()
+    if source != "-":
+        stats.bytes_total = os.path.getsize(source)
+    text, raw = _open(source)
+    try:
+        for cell in _iter_cells(text, source):
+            stats.lines += 1
+            if stats.lines % 1000 == 0:
+                if cancel is not None and cancel.is_set():
+                    stats.cancelled = True
+                    return
+                if stats.bytes_total:
+                    stats.bytes_done = raw.tell()
+            u = normalize_url(cell)
+            if u and is_probably_sitemap(u):
+                stats.accepted += 1
+                yield u
+        stats.bytes_done = stats.bytes_total
+    finally:
+        if source != "-":
+            text.close()
+
+def import_sitemaps(source: str, on_chunk: Callable[[list], int],
+                    on_progress: Optional[Callable[[ImportStats], None]] = None,
+                    cancel=None, chunk_size: int = IMPORT_CHUNK) -> ImportStats:
+    # on_chunk(urls) -> eklenen sayısı (ör. SitemapListModel.extend); asıl tekrar eleme orada yapılır.
+    stats = ImportStats()
+    chunk = []
+    for u in iter_sitemap_urls(source, stats, cancel):
+        chunk.append(u)
+        if len(chunk) >= chunk_size:
+            stats.added += on_chunk(chunk)
+            chunk = []
+            if on_progress:
+                on_progress(stats)
+    if chunk and not stats.cancelled:
+        stats.added += on_chunk(chunk)
+    if on_progress:
+        on_progress(stats)
+    return stats
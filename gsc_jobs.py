@@ -0,0 +1,214 @@
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+
+JOBS_DIR = "jobs"
+
+@dataclass
+class JobProgress:
+    done: int
+    total: int
+    ok: int
+    failed: int
+    rate: float           # öğe/sn (yalnızca bu oturumda, duraklatma hariç)
+    eta: Optional[float]  # sn
+    state: str
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    def text(self) -> str:
+        eta = "—" if self.eta is None else time.strftime("%H:%M:%S", time.gmtime(self.eta))
+        state = {"paused": " · ⏸ duraklatıldı", "cancelled": " · iptal ediliyor"}.get(self.state, "")
+        return f"{self.done:,}/{self.total:,} · {self.rate:.1f}/sn · kalan {eta}{state}"
+
+class Job:
+    # Bir uzun işlemin (submit, durum, performans) öğe listesi ve ilerlemesi. Başlık (öğeler + seçenekler)
+    # <id>.json'a bir kez atomik yazılır; biten her öğe <id>.log'a bir satır eklenir. Kapanış ya da çökme
+    # sonrası yalnızca log'da olmayan öğeler işlenir.
+    def __init__(self, path: str, job_id: str, kind: str, items: List[str], label: str = "",
+                 options: Optional[dict] = None, created: Optional[float] = None):
+        self.id = job_id
+        self.kind = kind
+        self.items = items
+        self.label = label
+        self.options = options or {}
+        self.created = created or time.time()
+        self.state = "running"    # running | paused | cancelled | stopped | finished
+        self.done: Dict[str, bool] = {}
+        self._header = os.path.join(path, f"{job_id}.json")
+        self._log_path = os.path.join(path, f"{job_id}.log")
+        self._log = None
+        self._lock = threading.Lock()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._session_done = 0
+        self._active = 0.0        # duraklatma dışında geçen süre
+        self._since = time.monotonic()
+
+    # ---------- persistence ----------
+    def save_header(self):
+        raw = {"id": self.id, "kind": self.kind, "label": self.label, "options": self.options,
+               "created": self.created, "items": self.items}
+        tmp = self._header + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(raw, f, ensure_ascii=False)
+        os.replace(tmp, self._header)
+
+    def load_log(self):
+        try:
+            with open(self._log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break  # çökme anında yarım kalmış son satır
+                    ok, _, item = line[:-1].partition("\t")
+                    if item:
+                        self.done[item] = ok == "1"
+        except FileNotFoundError:
+            pass
+
+    def delete(self):
+        self._close_log()
+        for p in (self._header, self._log_path):
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+
+    def _close_log(self):
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+
+    # ---------- progress ----------
+    @property
+    def total(self) -> int:
+        return len(self.items)
+
+    @property
+    def remaining(self) -> List[str]:
+        return [i for i in self.items if i not in self.done]
+
+    def record(self, item: str, ok: bool):
+        with self._lock:
+            if item in self.done:
+                return
+            self.done[item] = ok
+            self._session_done += 1
+            if self._log is None:
+                self._log = open(self._log_path, "a", encoding="utf-8")
+            self._log.write(f"{int(ok)}\t{item}\n")
+            self._log.flush()
+
+    def progress(self) -> JobProgress:
+        with self._lock:
+            done = len(self.done)
+            ok = sum(self.done.values())
+            active = self._active + (time.monotonic() - self._since if self.state == "running" else 0.0)
+            rate = self._session_done / active if active > 0 else 0.0
+        remaining = self.total - done
+        eta = remaining / rate if rate > 0 else None
+        return JobProgress(done, self.total, ok, done - ok, rate, eta, self.state)
+
+    # ---------- control ----------
+    def pause(self):
+        with self._lock:
+            if self.state == "running":
+                self.state = "paused"
+                self._active += time.monotonic() - self._since
+                self._resume.clear()
+
+    def resume(self):
+        with self._lock:
+            if self.state == "paused":
+                self.state = "running"
+                self._since = time.monotonic()
+                self._resume.set()
+
+    def cancel(self):
+        self._halt("cancelled")
+
+    def stop(self):
+        # uygulama kapanırken: iş diskte kalır, sonraki açılışta devam ettirilebilir
+        self._halt("stopped")
+
+    def _halt(self, state: str):
+        with self._lock:
+            if self.state in ("running", "paused"):
+                self.state = state
+                self._resume.set()
+
+    @property
+    def halted(self) -> bool:
+        return self.state in ("cancelled", "stopped")
+
+    def wait_running(self) -> bool:
+        # duraklatılmışsa devam edilene kadar bekler; iptal/durdurmada False
+        self._resume.wait()
+        return not self.halted
+
+    def iter_pending(self) -> Iterator[str]:
+        # Henüz bitmemiş öğeler; duraklatılınca bekler, iptal/durdurmada biter.
+        for item in self.items:
+            self._resume.wait()
+            if self.halted:
+                return
+            if item not in self.done:
+                yield item
+
+    def iter_batches(self, size: int) -> Iterator[List[str]]:
+        batch = []
+        for item in self.iter_pending():
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch and not self.halted:
+            yield batch
+
+    def finish(self):
+        # bitmiş veya iptal edilmiş iş diskten silinir; durdurulan iş kalır
+        with self._lock:
+            if self.state in ("running", "paused"):
+                self.state = "finished"
+        if self.state == "stopped":
+            self._close_log()
+        else:
+            self.delete()
+
+class JobManager:
+    def __init__(self, path: str = JOBS_DIR):
+        self.path = path
+
+    def create(self, kind: str, items: Iterable[str], label: str = "", **options) -> Job:
+        os.makedirs(self.path, exist_ok=True)
+        job_id = time.strftime("%Y%m%d-%H%M%S-") + f"{kind}-{uuid.uuid4().hex[:6]}"
+        job = Job(self.path, job_id, kind, list(dict.fromkeys(items)), label, options)
+        job.save_header()
+        return job
+
+    def load(self, job_id: str) -> Optional[Job]:
+        try:
+            with open(os.path.join(self.path, f"{job_id}.json"), "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            job = Job(self.path, raw["id"], raw["kind"], list(raw["items"]), raw.get("label", ""),
+                      raw.get("options"), raw.get("created"))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None  # bozuk / eksik başlık: iş yok sayılır
+        job.load_log()
+        return job
+
+    def pending(self) -> List[Job]:
+        # yarım kalmış işler, eskiden yeniye
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return []
+        jobs = [self.load(n[:-len(".json")]) for n in names if n.endswith(".json")]
+        return sorted((j for j in jobs if j is not None), key=lambda j: j.created)
@@ -0,0 +1,83 @@
+import threading
+from typing import Iterable, List
+
+class SitemapListModel:
+    # Sitemap listesinin asıl kaynağı. Ekleme sırasını koruyan dict sayesinde tekrar kontrolü ve
+    # üyelik O(1); her thread'den değiştirilebilir, arayüz `version` değiştikçe yeniden çizer.
+    def __init__(self):
+        self._items = {}
+        self._order = None   # önbelleğe alınmış sıralı liste
+        self._lower = None   # filtre için küçük harfli kopya
+        self._fcache = ("", -1, None)
+        self._lock = threading.RLock()
+        self.version = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, url):
+        return url in self._items
+
+    def _changed(self, appended=None):
+        if appended is not None and self._order is not None:
+            self._order.extend(appended)
+            self._lower.extend(u.lower() for u in appended)
+        else:
+            self._order = self._lower = None
+        self.version += 1
+
+    def add(self, url: str) -> bool:
+        return self.extend([url]) == 1
+
+    def extend(self, urls: Iterable[str]) -> int:
+        added = []
+        with self._lock:
+            for u in urls:
+                u = u.strip()
+                if u and u not in self._items:
+                    self._items[u] = None
+                    added.append(u)
+            if added:
+                self._changed(added)
+        return len(added)
+
+    def remove(self, urls: Iterable[str]) -> int:
+        n = 0
+        with self._lock:
+            for u in urls:
+                if self._items.pop(u, 0) is None:
+                    n += 1
+            if n:
+                self._changed()
+        return n
+
+    def clear(self):
+        with self._lock:
+            if self._items:
+                self._items.clear()
+                self._changed()
+
+    def _ensure_order(self):
+        if self._order is None:
+            self._order = list(self._items)
+            self._lower = [u.lower() for u in self._order]
+
+    def items(self) -> List[str]:
+        with self._lock:
+            self._ensure_order()
+            return list(self._order)
+
+    def filtered(self, query: str) -> List[str]:
+        # Artımlı arama: sorgu öncekini genişletiyorsa yalnızca önceki sonuçlar taranır.
+        q = query.strip().lower()
+        with self._lock:
+            self._ensure_order()
+            if not q:
+                return list(self._order)
+            cq, cv, cres = self._fcache
+            if cres is not None and cv == self.version and cq and q.startswith(cq):
+                res = [u for u in cres if q in u.lower()]
+            else:
+                res = [u for u, lu in zip(self._order, self._lower) if q in lu]
+            self._fcache = (q, self.version, res)
+            return list(res)
@@ -0,0 +1,82 @@
+import datetime
+import json
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_DIR = "logs"
+LOG_FILE = os.path.join(LOG_DIR, "gsc.jsonl")
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5
+DRAIN_MAX = 2000  # tek seferde arayüze aktarılacak en fazla kayıt
+
+class _JsonFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps({
+            "ts": datetime.datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }, ensure_ascii=False)
+
+class LogSink:
+    # Her thread'den güvenle çağrılabilir. Mesajlar iki kuyruğa gider: arayüz kuyruğu (Tk thread'i
+    # drain() ile toplu boşaltır) ve dosya kuyruğu (arka plan dinleyicisi dönen JSONL dosyasına yazar).
+    def __init__(self, path: str = LOG_FILE, max_bytes: int = LOG_MAX_BYTES, backups: int = LOG_BACKUPS):
+        self.path = path
+        self.backups = backups
+        self._ui = queue.SimpleQueue()
+        self._file_q = queue.Queue()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8", delay=True)
+        handler.setFormatter(_JsonFormatter())
+        self._listener = QueueListener(self._file_q, handler)
+        self._listener.start()
+        self._logger = logging.getLogger(f"gsc.sink.{id(self)}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._logger.addHandler(QueueHandler(self._file_q))
+
+    def emit(self, msg: str):
+        self._ui.put(msg)
+        self._logger.info(msg)
+
+    def drain(self, limit: int = DRAIN_MAX) -> list:
+        out = []
+        try:
+            while len(out) < limit:
+                out.append(self._ui.get_nowait())
+        except queue.Empty:
+            pass
+        return out
+
+    def flush(self):
+        self._file_q.join()
+
+    def files(self) -> list:
+        # eskiden yeniye: gsc.jsonl.N … gsc.jsonl.1, gsc.jsonl
+        paths = [f"{self.path}.{i}" for i in range(self.backups, 0, -1)] + [self.path]
+        return [p for p in paths if os.path.exists(p)]
+
+    def iter_records(self):
+        self.flush()
+        for p in self.files():
+            with open(p, "r", encoding="utf-8") as f:
+                for ln in f:
+                    try:
+                        yield json.loads(ln)
+                    except ValueError:
+                        continue
+
+    def export_text(self, out_path: str) -> int:
+        n = 0
+        with open(out_path, "w", encoding="utf-8") as f:
+            for rec in self.iter_records():
+                f.write(f"{rec.get('ts', '')}  {rec.get('msg', '')}\n")
+                n += 1
+        return n
+
+    def close(self):
+        self._listener.stop()
+        for h in list(self._logger.handlers):
+            self._logger.removeHandler(h)
@@ -0,0 +1,282 @@
+import bisect
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+METRICS_ENV = "GSC_METRICS_FILE"   # tanımlıysa metrikler bu dosyaya periyodik yazılır (node_exporter textfile)
+METRICS_INTERVAL = 15.0            # sn; textfile yazma aralığı
+PROFILE_DIR = "profiles"
+# sn; Prometheus varsayılanına yakın, üst uçta geri çekilme beklemeleri için genişletilmiş
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+MAX_PROPERTIES = 500               # mülk etiketi kardinalite sınırı; sonrakiler "other" altında toplanır
+
+API_REQUEST = "gsc_api_request"    # tek HTTP denemesi: service.*().execute()
+API_CALL = "gsc_api_call"          # mantıksal çağrı: yeniden denemeler + geri çekilme dahil
+UI = "gsc_ui"                      # Tk thread'i ve log yolu
+FAMILIES = {
+    API_REQUEST: "Tek HTTP denemesinin (execute) süresi",
+    API_CALL: "Yeniden denemeler ve geri çekilme dahil API çağrısının süresi",
+    UI: "Arayüz sıcak yollarının (log, liste yenileme, Tk gecikmesi) süresi",
+}
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count", "errors")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)  # son hücre: +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool = False):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+        self.errors += error
+
+    def merge(self, other: "Histogram"):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.sum += other.sum
+        self.count += other.count
+        self.errors += other.errors
+
+    def copy(self) -> "Histogram":
+        h = Histogram()
+        h.merge(self)
+        return h
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        # Prometheus histogram_quantile gibi: kova içinde doğrusal ara değer
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                if i == len(LATENCY_BUCKETS):
+                    return LATENCY_BUCKETS[-1]
+                lo = LATENCY_BUCKETS[i - 1] if i else 0.0
+                return lo + (LATENCY_BUCKETS[i] - lo) * (rank - seen) / n
+            seen += n
+        return LATENCY_BUCKETS[-1]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _labels(labels: Tuple[Tuple[str, str], ...], extra: str = "") -> str:
+    parts = [f'{k}="{_escape(v)}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class MetricsRegistry:
+    # Aile + etiketler -> gecikme histogramı (sayım, toplam, hata dahil). Her thread'den çağrılabilir;
+    # kayıt bir kilit + bisect maliyetindedir, HTTP çağrısının yanında ihmal edilebilir.
+    def __init__(self, max_properties: int = MAX_PROPERTIES):
+        self.max_properties = max_properties
+        self._series: Dict[tuple, Histogram] = {}
+        self._properties = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._path = None
+
+    def observe(self, family: str, seconds: float, error: bool = False, **labels):
+        with self._lock:
+            prop = labels.get("property")
+            if prop and prop not in self._properties:
+                if len(self._properties) < self.max_properties:
+                    self._properties.add(prop)
+                else:
+                    labels["property"] = "other"
+            key = (family, tuple(sorted(labels.items())))
+            h = self._series.get(key)
+            if h is None:
+                h = self._series[key] = Histogram()
+            h.observe(seconds, error)
+
+    @contextmanager
+    def timer(self, family: str, **labels):
+        t0 = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(family, time.perf_counter() - t0, error, **labels)
+
+    def snapshot(self) -> List[Tuple[str, tuple, Histogram]]:
+        with self._lock:
+            return [(family, labels, h.copy()) for (family, labels), h in sorted(self._series.items())]
+
+    def grouped(self, family: str, by: str) -> Dict[str, Histogram]:
+        # bir etikete göre toplanmış histogramlar (ör. uç nokta başına, mülkler birleştirilerek)
+        out: Dict[str, Histogram] = {}
+        for fam, labels, h in self.snapshot():
+            if fam != family:
+                continue
+            key = dict(labels).get(by, "")
+            if key not in out:
+                out[key] = Histogram()
+            out[key].merge(h)
+        return out
+
+    # ---------- Export ----------
+    def render(self) -> str:
+        # Prometheus metin biçimi 0.0.4 (node_exporter textfile toplayıcısının okuduğu biçim)
+        lines = []
+        series = self.snapshot()
+        for family, help_text in FAMILIES.items():
+            rows = [(labels, h) for fam, labels, h in series if fam == family]
+            if not rows:
+                continue
+            name = f"{family}_duration_seconds"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, h in rows:
+                cumulative = 0
+                for bound, n in zip(LATENCY_BUCKETS + (float("inf"),), h.counts):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    bucket = _labels(labels, f'le="{le}"')
+                    lines.append(f"{name}_bucket{bucket} {cumulative}")
+                lines.append(f"{name}_sum{_labels(labels)} {h.sum:.6f}")
+                lines.append(f"{name}_count{_labels(labels)} {h.count}")
+            errors = f"{family}_errors_total"
+            lines.append(f"# HELP {errors} Hata ile biten ölçümler")
+            lines.append(f"# TYPE {errors} counter")
+            for labels, h in rows:
+                lines.append(f"{errors}{_labels(labels)} {h.errors}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        # atomik: textfile toplayıcısı yarım dosya görmez
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+    def start_exporter(self, path: str, log_fn=None, interval: float = METRICS_INTERVAL):
+        if self._thread is not None:
+            return
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.write_textfile(path)
+                except OSError as e:
+                    if log_fn:
+                        log_fn(f"⚠️ Metrik dosyası yazılamadı: {e}")
+        self._path = path
+        self._thread = threading.Thread(target=loop, daemon=True, name="gsc-metrics")
+        self._thread.start()
+
+    def stop(self):
+        # son durum da yazılır
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self.write_textfile(self._path)
+
+    # ---------- Report ----------
+    def report(self, top: int = 5) -> str:
+        def table(title, groups, key_name):
+            rows = [f"{title}\n{key_name:24s} {'adet':>7s} {'hata%':>6s} {'p50 ms':>8s} {'p99 ms':>8s} {'ort ms':>8s}\n"]
+            for key, h in groups:
+                rows.append(f"{(key or '-')[:24]:24s} {h.count:7d} {h.error_rate * 100:6.1f} "
+                            f"{h.quantile(0.5) * 1000:8.1f} {h.quantile(0.99) * 1000:8.1f} {h.mean * 1000:8.1f}\n")
+            return "".join(rows)
+
+        out = []
+        calls = self.grouped(API_CALL, "endpoint")
+        if calls:
+            out.append(table("API çağrıları (yeniden denemeler dahil):", sorted(calls.items()), "uç nokta"))
+            attempts = self.grouped(API_REQUEST, "endpoint")
+            if attempts:
+                out.append(table("HTTP denemeleri:", sorted(attempts.items()), "uç nokta"))
+            props = self.grouped(API_CALL, "property")
+            props.pop("", None)
+            slow = sorted(props.items(), key=lambda kv: kv[1].quantile(0.99), reverse=True)[:top]
+            if slow:
+                out.append(table(f"En yavaş {len(slow)} mülk (p99):", slow, "mülk"))
+        ui = self.grouped(UI, "op")
+        if ui:
+            out.append(table("Arayüz:", sorted(ui.items()), "işlem"))
+        return "\n".join(out) or "Henüz ölçüm yok.\n"
+
+# -------------------- Profiling --------------------
+class ThreadProfiler:
+    # Tek bir işi cProfile ile ölçer. 3.12 öncesinde cProfile yalnızca etkinleştirildiği thread'i görür:
+    # iş sürerken başlayan thread'ler (submit/durum işçileri) threading.setprofile kancasıyla kendi
+    # profillerini açar ve sonunda birleştirilir. 3.12+ (sys.monitoring) tek profil tüm thread'leri görür.
+    def __init__(self):
+        self._profiles = []
+        self._lock = threading.Lock()
+        self._per_thread = sys.version_info < (3, 12)
+
+    def _start_thread(self, *args):
+        import cProfile
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()  # bu thread'in profil fonksiyonunu (kancayı) değiştirir
+
+    def __enter__(self):
+        import cProfile
+        main = cProfile.Profile()
+        self._profiles.append(main)
+        if self._per_thread:
+            threading.setprofile(self._start_thread)
+        main.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiles[0].disable()
+        if self._per_thread:
+            threading.setprofile(None)
+        return False
+
+    def stats(self):
+        import pstats
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = None
+        for p in profiles:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(p)
+                else:
+                    stats.add(p)
+            except TypeError:
+                continue  # hiç çağrı kaydetmemiş profil
+        return stats
+
+    def dump(self, path: str, top: int = 15) -> str:
+        # .prof (snakeviz / pstats ile açılabilir) yazar, kümülatif süreye göre ilk `top` satırı döner
+        import io
+        stats = self.stats()
+        if stats is None:
+            return ""
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        stats.dump_stats(path)
+        buf = io.StringIO()
+        stats.stream = buf
+        stats.sort_stats("cumulative").print_stats(top)
+        return buf.getvalue()
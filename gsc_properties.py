@@ -0,0 +1,86 @@
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+_DOMAIN = "\0domain"    # düğümde: bu host ve tüm alt alan adlarını kapsayan sc-domain: mülkü
+_ORIGINS = "\0origins"  # düğümde: şema[:port] -> yol segmenti ağacı (URL-önek mülkleri)
+_PROP = "\0prop"        # yol düğümünde: bu önekle biten URL-önek mülkü
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+class UnownedPropertyError(ValueError):
+    pass
+
+def _origin_key(scheme: str, port: Optional[int]) -> str:
+    return scheme if port is None or port == DEFAULT_PORTS.get(scheme) else f"{scheme}:{port}"
+
+def _dir_segments(path: str) -> list:
+    # "/a/b/sitemap.xml" -> ["a", "b"]; son segment dosya adıdır, önek eşleşmesine girmez
+    return path.split("/")[1:-1]
+
+class PropertyIndex:
+    # Doğrulanmış mülkler üzerinde ters host + yol trie'si. resolve(), URL uzunluğuyla orantılı
+    # sürede en uzun eşleşen mülkü bulur: URL-önek mülkü varsa o, yoksa en özel sc-domain: mülkü.
+    def __init__(self, site_entries: Iterable[dict] = ()):
+        self._root = {}
+        self._count = 0
+        for entry in site_entries:
+            if entry.get("permissionLevel") != "siteUnverifiedUser":
+                self.add(entry.get("siteUrl", ""))
+
+    def __len__(self):
+        return self._count
+
+    def add(self, site_url: str):
+        if site_url.startswith("sc-domain:"):
+            host = site_url[len("sc-domain:"):].strip().lower().rstrip(".")
+            self._host_node(host)[_DOMAIN] = site_url
+        else:
+            p = urlsplit(site_url)
+            if not p.scheme or not p.hostname:
+                return
+            node = self._host_node(p.hostname).setdefault(_ORIGINS, {}).setdefault(
+                _origin_key(p.scheme.lower(), p.port), {})
+            for seg in (p.path or "/").split("/")[1:]:
+                if seg:
+                    node = node.setdefault(seg, {})
+            node[_PROP] = site_url
+        self._count += 1
+
+    def _host_node(self, host: str) -> dict:
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.setdefault(label, {})
+        return node
+
+    def resolve(self, url: str) -> Optional[str]:
+        try:
+            p = urlsplit(url.strip())
+            host, port = p.hostname, p.port
+        except ValueError:
+            return None
+        if not p.scheme or not host:
+            return None
+        host = host.rstrip(".")
+        best_domain = None
+        node = self._root
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                return best_domain
+            best_domain = node.get(_DOMAIN, best_domain)
+        path_node = node.get(_ORIGINS, {}).get(_origin_key(p.scheme.lower(), port))
+        best_prefix = None
+        if path_node is not None:
+            best_prefix = path_node.get(_PROP)
+            for seg in _dir_segments(p.path or "/"):
+                path_node = path_node.get(seg)
+                if path_node is None:
+                    break
+                best_prefix = path_node.get(_PROP, best_prefix)
+        return best_prefix or best_domain
+
+    def resolve_or_raise(self, url: str) -> str:
+        prop = self.resolve(url)
+        if prop is None:
+            raise UnownedPropertyError("Doğrulanmış mülk yok (GSC'ye istek gönderilmedi)")
+        return prop
@@ -0,0 +1,284 @@
+import datetime
+import email.utils
+import json
+import os
+import random
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+MAX_RETRIES = 6
+BACKOFF_BASE = 1.0        # sn; deneme n için üst sınır BACKOFF_BASE * 2**n (tam jitter)
+BACKOFF_MAX = 64.0
+MIN_CONCURRENCY = 1
+START_CONCURRENCY = 8
+MAX_CONCURRENCY = 32      # AIMD'nin çıkabileceği en yüksek eşzamanlılık (gsc_core servis havuzu buna göre)
+BREAKER_THRESHOLD = 5     # mülk başına art arda hata → devre açılır
+BREAKER_COOLDOWN = 60.0   # sn; sonra tek deneme isteğine izin verilir (yarı açık)
+QUOTA_FILE = "gsc_quota.json"
+DAILY_QUOTA: Dict[str, int] = {}  # endpoint -> günlük üst sınır; boş = yalnızca sayım
+# Google günlük kotaları Pasifik saatiyle gece yarısı sıfırlanır (yaz saati yok sayılır)
+QUOTA_TZ = datetime.timezone(datetime.timedelta(hours=-8))
+
+THROTTLE_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "backendError"}
+QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+class CircuitOpenError(Exception):
+    pass
+
+class QuotaExhaustedError(Exception):
+    pass
+
+# -------------------- Error classification --------------------
+def _status(exc) -> Optional[int]:
+    resp = getattr(exc, "resp", None)
+    status = getattr(resp, "status", None)
+    return int(status) if status is not None else None
+
+def _reasons(exc) -> set:
+    details = getattr(exc, "error_details", None) or []
+    out = {d.get("reason") for d in details if isinstance(d, dict)}
+    content = getattr(exc, "content", b"") or b""
+    try:
+        err = json.loads(content.decode("utf-8") if isinstance(content, bytes) else content).get("error", {})
+        out.update(e.get("reason") for e in err.get("errors", []))
+    except (ValueError, AttributeError):
+        pass
+    out.discard(None)
+    return out
+
+def retry_after(exc) -> Optional[float]:
+    resp = getattr(exc, "resp", None)
+    value = resp.get("retry-after") if hasattr(resp, "get") else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def classify(exc) -> str:
+    # "throttle" | "quota" | "server" | "network" | "client"
+    status = _status(exc)
+    if status is None:
+        if isinstance(exc, (socket.timeout, TimeoutError, ConnectionError, OSError)):
+            return "network"
+        if type(exc).__module__.startswith(("httplib2", "ssl", "http.client")):
+            return "network"
+        return "client"
+    if status == 429:
+        return "throttle"
+    if status == 403:
+        reasons = _reasons(exc)
+        if reasons & QUOTA_REASONS:
+            return "quota"
+        if reasons & THROTTLE_REASONS:
+            return "throttle"
+        return "client"
+    if status >= 500:
+        return "server"
+    return "client"
+
+# -------------------- AIMD --------------------
+class AdaptiveLimiter:
+    # Eşzamanlı istek sınırı: her `limit` başarıda +1 (toplamsal artış), kısıtlamada yarıya (çarpımsal azalış).
+    def __init__(self, start: int = START_CONCURRENCY, minimum: int = MIN_CONCURRENCY,
+                 maximum: int = MAX_CONCURRENCY):
+        self.limit = start
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self._successes = 0
+        self._last_cut = 0.0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    def on_success(self):
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.maximum:
+                self._successes = 0
+                self.limit += 1
+                self._cond.notify()
+
+    def on_throttle(self):
+        with self._cond:
+            now = time.monotonic()
+            if now - self._last_cut < 1.0:
+                return  # aynı kısıtlama dalgası için bir kez azalt
+            self._last_cut = now
+            self._successes = 0
+            self.limit = max(self.minimum, self.limit // 2)
+
+# -------------------- Circuit breaker --------------------
+class CircuitBreaker:
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures: Dict[str, int] = {}
+        self._opened: Dict[str, float] = {}
+        self._probing = set()
+        self._lock = threading.Lock()
+
+    def check(self, key: str):
+        with self._lock:
+            opened = self._opened.get(key)
+            if opened is None:
+                return
+            if time.monotonic() - opened < self.cooldown or key in self._probing:
+                raise CircuitOpenError(f"Devre açık ({key}): art arda {self.threshold} hata, istek gönderilmedi")
+            self._probing.add(key)  # yarı açık: tek deneme
+
+    def record_success(self, key: str):
+        with self._lock:
+            self._failures.pop(key, None)
+            self._opened.pop(key, None)
+            self._probing.discard(key)
+
+    def release(self, key: str):
+        # deneme gönderilmeden vazgeçildi (ör. kota): sonuç sayılmaz, sonraki çağrı yeniden deneyebilir
+        with self._lock:
+            self._probing.discard(key)
+
+    def record_failure(self, key: str):
+        with self._lock:
+            n = self._failures.get(key, 0) + 1
+            self._failures[key] = n
+            self._probing.discard(key)
+            if n >= self.threshold:
+                self._opened[key] = time.monotonic()
+
+    def open_circuits(self) -> list:
+        with self._lock:
+            return sorted(self._opened)
+
+# -------------------- Quota --------------------
+class QuotaTracker:
+    def __init__(self, limits: Optional[Dict[str, int]] = None, path: Optional[str] = None):
+        self.limits = dict(DAILY_QUOTA if limits is None else limits)
+        self.path = path
+        self._day = self._today()
+        self._used: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if path:
+            self.load()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.datetime.now(QUOTA_TZ).date().isoformat()
+
+    def consume(self, endpoint: str):
+        with self._lock:
+            today = self._today()
+            if today != self._day:
+                self._day, self._used = today, {}
+            used = self._used.get(endpoint, 0)
+            limit = self.limits.get(endpoint.partition("@")[0])  # "uç@hesap": sınır hesap başına
+            if limit is not None and used >= limit:
+                raise QuotaExhaustedError(f"Günlük kota doldu: {endpoint} ({used}/{limit})")
+            self._used[endpoint] = used + 1
+
+    def used(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._used)
+
+    def total(self) -> int:
+        with self._lock:
+            return sum(self._used.values())
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return
+        if raw.get("day") == self._day:
+            self._used = {k: int(v) for k, v in raw.get("used", {}).items()}
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            raw = {"day": self._day, "used": dict(self._used)}
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(raw, f)
+        os.replace(tmp, self.path)
+
+# -------------------- Scheduler --------------------
+class RequestScheduler:
+    # Tüm GSC çağrılarının geçtiği merkezi kapı: kota sayımı, mülk başına devre kesici,
+    # AIMD eşzamanlılık sınırı, Retry-After'a uyan üstel geri çekilme + tam jitter.
+    def __init__(self, limiter: Optional[AdaptiveLimiter] = None, breaker: Optional[CircuitBreaker] = None,
+                 quota: Optional[QuotaTracker] = None, max_retries: int = MAX_RETRIES,
+                 backoff_base: float = BACKOFF_BASE, backoff_max: float = BACKOFF_MAX, sleep=time.sleep):
+        self.limiter = limiter or AdaptiveLimiter()
+        self.breaker = breaker or CircuitBreaker()
+        self.quota = quota or QuotaTracker()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sleep = sleep
+        self.retries = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int, exc=None) -> float:
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        hinted = retry_after(exc) if exc is not None else None
+        return max(delay, hinted) if hinted is not None else delay
+
+    def call(self, endpoint: str, site_url: Optional[str], fn: Callable[[], object]):
+        key = site_url or "*"
+        self.breaker.check(key)
+        attempt = 0
+        while True:
+            try:
+                self.quota.consume(endpoint)
+            except QuotaExhaustedError:
+                self.breaker.release(key)
+                raise
+            try:
+                with self.limiter:
+                    result = fn()
+            except Exception as e:
+                kind = classify(e)
+                if kind == "throttle":
+                    self.limiter.on_throttle()
+                    with self._lock:
+                        self.throttled += 1
+                if kind in ("throttle", "server", "network") and attempt < self.max_retries:
+                    with self._lock:
+                        self.retries += 1
+                    self.sleep(self.backoff(attempt, e))
+                    attempt += 1
+                    continue
+                if kind != "client" or _status(e) in (401, 403):
+                    self.breaker.record_failure(key)
+                else:
+                    self.breaker.record_success(key)  # mülk yanıt veriyor (ör. 404), devreyi etkilemez
+                raise
+            self.limiter.on_success()
+            self.breaker.record_success(key)
+            return result
+
+    def summary(self) -> str:
+        return (f"Kota: {self.quota.total()} çağrı (bugün) · eşzamanlılık {self.limiter.limit} · "
+                f"yeniden deneme {self.retries} · kısıtlama {self.throttled}")
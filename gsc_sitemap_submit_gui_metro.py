@@ -1,43 +1,132 @@
 import os
 import platform
+import queue
 import threading
+import time
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
-from urllib.parse import urlparse
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from gsc_analytics import ANALYTICS_DB, AnalyticsStore, date_window, sync_sites
+from gsc_core import connect, fetch_statuses, iter_existing_sitemaps, submit_sitemaps, unowned_sitemaps
+from gsc_cache import CACHE_FILE, ResponseCache
+from gsc_history import HISTORY_DB, SubmissionHistory
+from gsc_import import import_sitemaps, normalize_url
+from gsc_jobs import JOBS_DIR, JobManager
+from gsc_listmodel import SitemapListModel
+from gsc_log import LogSink
+from gsc_metrics import METRICS_ENV, PROFILE_DIR, UI, MetricsRegistry, ThreadProfiler
+from gsc_validator import validate_sitemaps
+from gsc_watch import SitemapWatcher
 
 APP_TITLE = "GSC Sitemap Submitter — Metro UI"
-SCOPES = ["https://www.googleapis.com/auth/webmasters"]
-
-# -------------------- OAuth --------------------
-def get_credentials(log_fn):
-    if os.path.exists("token.json"):
-        log_fn("Mevcut token.json bulundu, kimlik doğrulanıyor…")
-        return Credentials.from_authorized_user_file("token.json", SCOPES)
-    if not os.path.exists("credentials.json"):
-        raise FileNotFoundError("credentials.json yok! Google Cloud → OAuth 'Desktop app' oluşturup bu klasöre koyun.")
-    log_fn("Tarayıcı ile OAuth akışı başlatılıyor…")
-    flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
-    creds = flow.run_local_server(port=0)
-    with open("token.json", "w", encoding="utf-8") as f:
-        f.write(creds.to_json())
-    log_fn("OAuth tamamlandı, token.json kaydedildi.")
-    return creds
-
-# -------------------- Helpers --------------------
-def base_prefix_from_sitemap(sitemap_url: str) -> str:
-    p = urlparse(sitemap_url.strip())
-    if not p.scheme or not p.netloc:
-        raise ValueError("Geçersiz URL (şema/host yok)")
-    return f"{p.scheme}://{p.netloc}/"
-
-def is_probably_sitemap(u: str) -> bool:
-    u = u.strip().lower()
-    return u.endswith(".xml") or "sitemap" in u
+LOG_DRAIN_MS = 100    # log / arayüz kuyruklarının boşaltılma aralığı
+LOG_UI_LINES = 5000   # log alanında tutulan en fazla satır (halka tampon)
+LIST_REFRESH_MS = 150 # liste modeli değişiklik kontrolü / filtre gecikmesi
+PERF_DAYS = 7
+STATUS_BATCH = 500    # durum işinde kontrol noktası başına sitemap
+STATS_REFRESH_MS = 1000  # istatistik paneli yenileme aralığı
+
+# -------------------- Virtual List --------------------
+class VirtualListView:
+    # Listbox yalnızca görünen satırları tutar; kaydırma ve seçim modelin (filtrelenmiş)
+    # satırları üzerinden yapılır, böylece 100k+ kayıtta da Tk'ye sayfa kadar satır gider.
+    def __init__(self, parent, model: SitemapListModel, **listbox_opts):
+        self.model = model
+        self.listbox = tk.Listbox(parent, selectmode="extended", exportselection=False, **listbox_opts)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._on_scroll)
+        self.rows = []
+        self.top = 0
+        self.query = ""
+        self.selected = set()
+        self.on_select = None
+        self._page = []
+        self._version = -1
+        self._plain_click = False
+        self._line_h = tkfont.Font(font=self.listbox.cget("font")).metrics("linespace") + 1
+        self.listbox.bind("<Configure>", lambda e: self.render())
+        self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
+        self.listbox.bind("<ButtonPress-1>", self._on_press, add="+")
+        self.listbox.bind("<MouseWheel>", self._on_wheel)
+        self.listbox.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self.listbox.bind("<Button-5>", lambda e: self._scroll_by(3))
+
+    def refresh(self, force: bool = False) -> bool:
+        if not force and self._version == self.model.version:
+            return False
+        self._version = self.model.version
+        self.rows = self.model.filtered(self.query)
+        if self.selected:
+            live = set(self.model.items())
+            self.selected &= live
+        self.render()
+        return True
+
+    def set_query(self, query: str):
+        if query != self.query:
+            self.query = query
+            self.top = 0
+            self.refresh(force=True)
+
+    def _visible(self) -> int:
+        return max(1, self.listbox.winfo_height() // self._line_h)
+
+    def render(self):
+        n = len(self.rows)
+        vis = self._visible()
+        self.top = max(0, min(self.top, n - vis))
+        self._page = self.rows[self.top:self.top + vis]
+        self.listbox.delete(0, tk.END)
+        if self._page:
+            self.listbox.insert(tk.END, *self._page)
+            for i, u in enumerate(self._page):
+                if u in self.selected:
+                    self.listbox.selection_set(i)
+        if n:
+            self.scrollbar.set(self.top / n, (self.top + len(self._page)) / n)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_by(self, rows: int):
+        self.top += rows
+        self.render()
+        return "break"
+
+    def _on_scroll(self, *args):
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self.top += step * self._visible() if args[2] == "pages" else step
+        self.render()
+
+    def _on_wheel(self, event):
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_press(self, event):
+        self._plain_click = not (event.state & 0x0005)  # Shift / Control yok
+
+    def _on_listbox_select(self, event=None):
+        if self._plain_click:
+            self.selected.clear()
+            self._plain_click = False
+        for i, u in enumerate(self._page):
+            if self.listbox.selection_includes(i):
+                self.selected.add(u)
+            else:
+                self.selected.discard(u)
+        if self.on_select:
+            self.on_select()
+
+    def selection(self):
+        # seçili satırlar, görünüm sırasıyla
+        if not self.selected:
+            return []
+        return [u for u in self.rows if u in self.selected]
+
+    def clear_selection(self):
+        self.selected.clear()
+        self.render()
 
 # -------------------- Metro App --------------------
 class App(tk.Tk):
@@ -47,10 +136,31 @@ class App(tk.Tk):
         self.geometry("980x680")
         self.minsize(900, 560)
 
-        self.service = None
+        self.client = None
+        self.metrics = MetricsRegistry()  # API + arayüz gecikmeleri; client da aynı kayıt defterine yazar
+        self.log_sink = LogSink()
+        self.model = SitemapListModel()
+        self.cache = ResponseCache(path=CACHE_FILE)
+        self.analytics = None
+        self.history = SubmissionHistory(HISTORY_DB)
+        self.validation = {}  # url -> gsc_validator.ValidationResult (son doğrulama)
+        self._ui_calls = queue.SimpleQueue()
+        self._import_cancel = None
+        self.jobs = JobManager(JOBS_DIR)
+        self.job = None       # çalışan gsc_jobs.Job (tek seferde bir iş)
+        self.watcher = None
+        self._watch_stop = None
+        self._profile_next = False
+        self._last_pump = None
+        self._stats_due = 0.0
         self._apply_metro_style()
         self._build_ui()
         self._make_responsive()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        if os.environ.get(METRICS_ENV):
+            self.metrics.start_exporter(os.environ[METRICS_ENV], self._log)
+        self.after(LOG_DRAIN_MS, self._pump_ui)
+        self.after(LIST_REFRESH_MS, self._refresh_list)
 
     # ---------- Metro Style ----------
     def _apply_metro_style(self):
@@ -82,6 +192,12 @@ class App(tk.Tk):
         style.map("Accent.TButton", background=[("active", self.P_ACCENT_D)])
         style.configure("Ghost.TButton", background=self.P_SURFACE, foreground=self.P_TEXT, borderwidth=0)
         style.map("Ghost.TButton", background=[("active", "#2a3648")])
+        style.configure("Subtle.TCheckbutton", background=self.P_CARD, foreground=self.P_TEXT)
+        style.map("Subtle.TCheckbutton", background=[("active", self.P_CARD)])
+        style.configure("Treeview", background="#0b1220", fieldbackground="#0b1220", foreground=self.P_TEXT,
+                        borderwidth=0)
+        style.configure("Treeview.Heading", background=self.P_SURFACE, foreground=self.P_TEXT, borderwidth=0)
+        style.map("Treeview.Heading", background=[("active", "#2a3648")])
 
     # ---------- UI ----------
     def _build_ui(self):
@@ -96,11 +212,14 @@ class App(tk.Tk):
         actbar = ttk.Frame(header, style="Subtle.TFrame")
         self.btn_auth = ttk.Button(actbar, text="🔐 Google ile Yetkilendir", style="Accent.TButton", command=self.on_auth)
         self.lbl_status = ttk.Label(actbar, text="Durum: Bağlı değil", style="Card.TLabel")
+        self.lbl_cache = ttk.Label(actbar, text=self.cache.summary(), style="Card.TLabel")
+        self.lbl_cache.configure(foreground=self.P_MUTED)
         title.grid(row=0, column=0, sticky="w")
         actbar.grid(row=0, column=1, sticky="e")
         subtitle.grid(row=1, column=0, columnspan=2, sticky="w", pady=(6,0))
         self.btn_auth.grid(row=0, column=0, padx=(0,10))
         self.lbl_status.grid(row=0, column=1)
+        self.lbl_cache.grid(row=1, column=0, columnspan=2, sticky="e", pady=(4,0))
 
         # Body shell
         shell = ttk.Frame(self, style="Card.TFrame", padding=10)
@@ -110,14 +229,23 @@ class App(tk.Tk):
         left = ttk.Frame(shell, style="Card.TFrame", padding=8)
         left.grid(row=0, column=0, sticky="nsew")
         ttk.Label(left, text="📄 Sitemap URL listesi:", style="Card.TLabel").grid(row=0, column=0, sticky="w")
-        self.listbox = tk.Listbox(left, selectmode="extended", bg="#0b1220", fg=self.P_TEXT, relief="flat")
-        self.listbox.grid(row=1, column=0, sticky="nsew", pady=(6,4))
-        lb_scroll = ttk.Scrollbar(left, orient="vertical", command=self.listbox.yview)
-        self.listbox.configure(yscrollcommand=lb_scroll.set)
-        lb_scroll.grid(row=1, column=1, sticky="ns")
+        filterbar = ttk.Frame(left, style="Card.TFrame")
+        filterbar.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(6,0))
+        ttk.Label(filterbar, text="🔎", style="Card.TLabel").pack(side="left", padx=(0,4))
+        self.var_filter = tk.StringVar()
+        self.var_filter.trace_add("write", lambda *a: self._schedule_filter())
+        ttk.Entry(filterbar, textvariable=self.var_filter).pack(side="left", fill="x", expand=True)
+        self.lbl_count = ttk.Label(filterbar, text="0", style="Card.TLabel")
+        self.lbl_count.pack(side="left", padx=(6,0))
+        self._filter_job = None
+
+        self.view = VirtualListView(left, self.model, bg="#0b1220", fg=self.P_TEXT, relief="flat")
+        self.listbox = self.view.listbox
+        self.listbox.grid(row=2, column=0, sticky="nsew", pady=(6,4))
+        self.view.scrollbar.grid(row=2, column=1, sticky="ns")
 
         controls = ttk.Frame(left, style="Card.TFrame")
-        controls.grid(row=2, column=0, columnspan=2, sticky="w", pady=(4,0))
+        controls.grid(row=3, column=0, columnspan=2, sticky="w", pady=(4,0))
         ttk.Button(controls, text="📂 .txt Yükle", style="Ghost.TButton", command=self.on_load_txt).pack(side="left", padx=(0,6))
         ttk.Button(controls, text="➕ Elle Ekle", style="Ghost.TButton", command=self.on_add_manual).pack(side="left", padx=(0,6))
         ttk.Button(controls, text="🗑️ Seçileni Sil", style="Ghost.TButton", command=self.on_delete_selected).pack(side="left", padx=(0,6))
@@ -125,9 +253,12 @@ class App(tk.Tk):
 
         # NEW buttons
         ttk.Button(controls, text="📜 Mevcut Sitemap’leri Listele", style="Ghost.TButton", command=self.on_list_existing).pack(side="left", padx=(0,6))
+        ttk.Button(controls, text="🧪 Doğrula + Genişlet", style="Ghost.TButton", command=self.on_validate).pack(side="left", padx=(0,6))
         ttk.Button(controls, text="🔍 Durum Kontrolü", style="Ghost.TButton", command=self.on_check_status).pack(side="left", padx=(0,6))
         ttk.Button(controls, text="📊 Performans Verilerini Getir", style="Ghost.TButton", command=self.on_fetch_performance).pack(side="left", padx=(0,6))
         ttk.Button(controls, text="📤 Listelenenleri Submit Et", style="Ghost.TButton", command=self.on_resubmit_listed).pack(side="left", padx=(0,6))
+        self.btn_watch = ttk.Button(controls, text="👁️ İzlemeyi Başlat", style="Ghost.TButton", command=self.on_toggle_watch)
+        self.btn_watch.pack(side="left", padx=(0,6))
 
         # Right: log
         right = ttk.Frame(shell, style="Card.TFrame", padding=8)
@@ -140,19 +271,37 @@ class App(tk.Tk):
         log_scroll.grid(row=1, column=1, sticky="ns")
         
         ttk.Label(right, text="📊 Performans Özeti:", style="Card.TLabel").grid(row=2, column=0, sticky="w", pady=(10,2))
+        self.btn_stats = ttk.Button(right, text="📈 İstatistikler", style="Ghost.TButton", command=self.on_toggle_stats)
+        self.btn_stats.grid(row=2, column=0, sticky="e", pady=(10,2))
         self.txt_perf = tk.Text(right, height=8, wrap="word", bg="#0b1220", fg=self.P_INFO, relief="flat", padx=10, pady=10)
         self.txt_perf.grid(row=3, column=0, sticky="nsew", pady=(4,4))
         perf_scroll = ttk.Scrollbar(right, orient="vertical", command=self.txt_perf.yview)
         self.txt_perf.configure(yscrollcommand=perf_scroll.set)
         perf_scroll.grid(row=3, column=1, sticky="ns")
+        mono = ("Consolas" if platform.system() == "Windows" else "Courier", 9)
+        self.txt_stats = tk.Text(right, height=10, wrap="none", bg="#0b1220", fg=self.P_TEXT, relief="flat",
+                                 padx=10, pady=10, font=mono)
+        self.txt_stats.grid(row=4, column=0, columnspan=2, sticky="nsew", pady=(4,4))
+        self.txt_stats.grid_remove()
 
 
         # Footer
         footer = ttk.Frame(self, style="Subtle.TFrame", padding=(10, 8))
         footer.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0,12))
         ttk.Button(footer, text="💾 Log Kaydet (.txt)", style="Ghost.TButton", command=self.on_save_log).pack(side="left")
+        self.progress = ttk.Progressbar(footer, length=220, mode="determinate", maximum=1.0)
+        self.lbl_progress = ttk.Label(footer, text="", style="Card.TLabel")
+        self.btn_pause = ttk.Button(footer, text="⏸ Duraklat", style="Ghost.TButton", command=self.on_pause)
+        self.btn_cancel = ttk.Button(footer, text="⏹ İptal", style="Ghost.TButton", command=self.on_cancel)
         self.btn_submit = ttk.Button(footer, text="🚀 Seçilenleri Submit Et", style="Accent.TButton", command=self.on_submit_selected)
         self.btn_submit.pack(side="right")
+        self.var_incremental = tk.BooleanVar(value=False)
+        ttk.Checkbutton(footer, text="♻️ Yalnızca değişenler", variable=self.var_incremental,
+                        style="Subtle.TCheckbutton").pack(side="right", padx=(0,10))
+        self.var_profile = tk.BooleanVar(value=False)
+        ttk.Checkbutton(footer, text="🔬 Sonraki işi profille", variable=self.var_profile,
+                        command=lambda: setattr(self, "_profile_next", self.var_profile.get()),
+                        style="Subtle.TCheckbutton").pack(side="right", padx=(0,10))
 
         self._log("Uygulama hazır. OAuth yap, sitemap’leri yükle veya listele.")
 
@@ -160,44 +309,32 @@ class App(tk.Tk):
         shell.grid_rowconfigure(0, weight=1)
         shell.grid_columnconfigure(0, weight=1)
         shell.grid_columnconfigure(1, weight=1)
-        left.grid_rowconfigure(1, weight=1)
+        left.grid_rowconfigure(2, weight=1)
         left.grid_columnconfigure(0, weight=1)
         right.grid_rowconfigure(3, weight=1)
+        right.grid_rowconfigure(4, weight=1)
         right.grid_columnconfigure(0, weight=1)
         
       
     def on_list_existing(self):
-        if self.service is None:
+        if self.client is None:
             return messagebox.showwarning("Uyarı", "Önce OAuth yapın.")
-        self.listbox.delete(0, tk.END)
+        self.model.clear()
         self._log("Sitemap listesi alınıyor, lütfen bekleyin...")
     
         def run():
             try:
                 total_sitemaps = 0
-                site_urls = self.service.sites().list().execute().get("siteEntry", [])
-                for site in site_urls:
-                    site_url = site.get("siteUrl")
-                    self._log(f"🌐 Site: {site_url}")
-                    try:
-                        sitemaps = self.service.sitemaps().list(siteUrl=site_url).execute().get("sitemap", [])
-                        for sm in sitemaps:
-                            sm_path = sm.get("path")
-                            # 🧩 path göreliyse site_url ile birleştir
-                            if sm_path.startswith("/"):
-                                sm_url = site_url.rstrip("/") + sm_path
-                            else:
-                                sm_url = sm_path
-                            # Listeye ve log’a ekle
-                            self.listbox.insert(tk.END, sm_url)
-                            self._log(f"   • {sm_url} (Last submitted: {sm.get('lastSubmitted')})")
-                            total_sitemaps += 1
-                    except HttpError as e:
-                        self._log(f"   ⚠️ Sitemap bilgisi alınamadı: {e}")
+                for site_url, sm_url, sm in iter_existing_sitemaps(self.client, self._log):
+                    # Listeye ve log’a ekle
+                    self.model.add(sm_url)
+                    self._log(f"   • {sm_url} (Last submitted: {sm.get('lastSubmitted')})")
+                    total_sitemaps += 1
     
                 # 🧾 Özet log ve kullanıcıya bilgi kutusu
                 self._log(f"Toplam {total_sitemaps} sitemap bulundu ve listeye eklendi.")
-                messagebox.showinfo("Listeleme Tamamlandı", f"Toplam {total_sitemaps} sitemap bulundu ve listeye eklendi.")
+                self._ui(messagebox.showinfo, "Listeleme Tamamlandı",
+                         f"Toplam {total_sitemaps} sitemap bulundu ve listeye eklendi.")
                 
             except Exception as e:
                 self._log(f"HATA (listeleme): {e}")
@@ -206,11 +343,13 @@ class App(tk.Tk):
     
     
     def on_resubmit_listed(self):
-        if self.service is None:
+        if self.client is None:
             return messagebox.showwarning("Uyarı", "Önce OAuth yapın.")
+        if self._busy():
+            return
     
         # Liste içeriğinde sitemap URL'leri var mı kontrol et
-        all_items = [self.listbox.get(i) for i in range(self.listbox.size())]
+        all_items = self.view.rows
         sitemaps = [u.strip() for u in all_items if u.strip().endswith(".xml")]
     
         if not sitemaps:
@@ -219,104 +358,83 @@ class App(tk.Tk):
         if not messagebox.askyesno("Onay", f"{len(sitemaps)} sitemap yeniden submit edilecek. Devam edilsin mi?"):
             return
     
-        def run():
-            ok = 0
-            for i, sm_url in enumerate(sitemaps, 1):
-                try:
-                    prefix = base_prefix_from_sitemap(sm_url)
-                    self._log(f"[{i}/{len(sitemaps)}] Yeniden Submit → {sm_url}")
-                    self.service.sitemaps().submit(siteUrl=prefix, feedpath=sm_url).execute()
-                    self._log(f"✅ Gönderildi: {sm_url}")
-                    ok += 1
-                except Exception as e:
-                    self._log(f"❌ Hata: {sm_url} — {e}")
-            self._log(f"Tamamlandı. Başarılı: {ok}/{len(sitemaps)}")
-            messagebox.showinfo("Tamamlandı", f"Başarılı: {ok}/{len(sitemaps)}")
-        threading.Thread(target=run, daemon=True).start()
+        self._log(f"{len(sitemaps)} sitemap yeniden submit ediliyor…")
+        self._start_job(self.jobs.create("submit", sitemaps, label="Listelenenleri submit", ok_text="Gönderildi",
+                                         incremental=self.var_incremental.get(), notify=True))
           
     def on_fetch_performance(self):
-        if self.service is None:
+        if self.client is None:
             return messagebox.showwarning("Uyarı", "Önce OAuth yapın.")
-    
-        self.listbox.delete(0, tk.END)
-        self.txt_perf.delete("1.0", tk.END)
-    
-        def run():
+        if self._busy():
+            return
+        # siteler işin içinde alınır: ön plan yuvası Tk thread'inde hemen ayrılır
+        self._start_job(self.jobs.create("performance", [], label="Performans"))
+
+    def _job_performance(self, job):
+        if not job.items:
             try:
-                sites = self.service.sites().list().execute().get("siteEntry", [])
-                if not sites:
-                    return self._log("Hiç doğrulanmış site bulunamadı.")
-                self._log(f"{len(sites)} site bulundu. Performans verileri alınıyor…")
-    
-                import datetime
-                end_date = datetime.date.today()
-                start_date = end_date - datetime.timedelta(days=7)
-    
-                self.site_performance = {}
-    
-                for site in sites:
-                    site_url = site.get("siteUrl")
-                    try:
-                        result = self.service.searchanalytics().query(
-                            siteUrl=site_url,
-                            body={
-                                "startDate": start_date.isoformat(),
-                                "endDate": end_date.isoformat(),
-                                "dimensions": []
-                            }
-                        ).execute()
-    
-                        rows = result.get("rows", [])
-                        clicks = impressions = ctr = position = 0.0
-                        if rows:
-                            for row in rows:
-                                clicks += row.get("clicks", 0)
-                                impressions += row.get("impressions", 0)
-                                ctr += row.get("ctr", 0)
-                                position += row.get("position", 0)
-                            ctr = (ctr / len(rows)) * 100
-                            position = position / len(rows)
-    
-                        info = {
-                            "clicks": clicks,
-                            "impressions": impressions,
-                            "ctr": round(ctr, 2),
-                            "position": round(position, 2)
-                        }
-                        self.site_performance[site_url] = info
-                        self.listbox.insert(tk.END, site_url)
-                        self._log(f"📊 {site_url} — {clicks:.0f} tıklama, {impressions:.0f} gösterim")
-                    except Exception as e:
-                        self._log(f"⚠️ {site_url} performans alınamadı: {e}")
-    
-                self._log("Performans verileri alındı. Sol listeden bir site seçin.")
-                self.listbox.bind("<<ListboxSelect>>", self._show_site_performance)
-    
+                sites = self.client.sites_list()
             except Exception as e:
-                self._log(f"HATA (performans): {e}")
-    
-        threading.Thread(target=run, daemon=True).start()
+                return self._log(f"HATA (performans): {e}")
+            if not sites:
+                return self._log("Hiç doğrulanmış site bulunamadı.")
+            job.items = list(dict.fromkeys(s.get("siteUrl") for s in sites))
+            job.save_header()
+            self._log(f"{len(sites)} site bulundu. Performans verileri alınıyor…")
+        self.model.clear()
+        self._ui(self.txt_perf.delete, "1.0", tk.END)
+        if self.analytics is None:
+            self.analytics = AnalyticsStore(ANALYTICS_DB)
+        self.site_performance = {}
+        start, end = date_window(PERF_DAYS)
+
+        def show(site_url, note):
+            info = self.analytics.summary(site_url, start, end)
+            self.site_performance[site_url] = info
+            self.model.add(site_url)
+            self._log(f"📊 {site_url} — {info['clicks']:.0f} tıklama, {info['impressions']:.0f} gösterim ({note})")
+
+        for site_url, ok in list(job.done.items()):
+            if ok:
+                show(site_url, "önceki oturumda alındı")
+
+        def on_site(site_url, n_rows, err):
+            job.record(site_url, err is None)
+            if err is not None:
+                return self._log(f"⚠️ {site_url} performans alınamadı: {err}")
+            show(site_url, f"{n_rows} yeni satır" if n_rows else "yerel depodan")
+
+        sync_sites(self.client, self.analytics, job.iter_pending(), days=PERF_DAYS, on_site=on_site)
+        self._log("Performans verileri alındı. Sol listeden bir site seçin.")
+        self.view.on_select = self._show_site_performance
     
     
     def _show_site_performance(self, event=None):
         if not hasattr(self, "site_performance"):
             return
-        sel = self.listbox.curselection()
+        sel = self.view.selection()
         if not sel:
             return
-        site_url = self.listbox.get(sel[0])
+        site_url = sel[0]
         perf = self.site_performance.get(site_url)
         if not perf:
             return
-        self.txt_perf.delete("1.0", tk.END)
-        self.txt_perf.insert(tk.END,
+        start, end = date_window(PERF_DAYS)
+        lines = [
             f"📍 Site: {site_url}\n\n"
-            f"Son 7 Gün:\n"
+            f"Son {PERF_DAYS} Gün ({start} → {end}):\n"
             f"• Tıklama: {perf['clicks']:.0f}\n"
             f"• Gösterim: {perf['impressions']:.0f}\n"
             f"• CTR: {perf['ctr']}%\n"
             f"• Ortalama Pozisyon: {perf['position']}\n"
-        )
+        ]
+        for dim, title in (("page", "En çok tıklanan sayfalar"), ("query", "En çok tıklanan sorgular")):
+            top = self.analytics.top(site_url, dim, start, end)
+            if top:
+                lines.append(f"\n{title}:\n")
+                lines.extend(f"• {clicks:.0f} — {key}\n" for key, clicks, _ in top)
+        self.txt_perf.delete("1.0", tk.END)
+        self.txt_perf.insert(tk.END, "".join(lines))
     
     def _make_responsive(self):
         self.grid_rowconfigure(1, weight=1)
@@ -327,44 +445,104 @@ class App(tk.Tk):
         def run():
             try:
                 self._log("OAuth başlatılıyor…")
-                creds = get_credentials(self._log)
-                self.service = build("webmasters", "v3", credentials=creds)
-                self.lbl_status.config(text="Durum: Bağlı")
+                self.client = connect(self._log, cache=self.cache)
+                n = len(self.client.pool)
+                self._ui(self.lbl_status.config, {"text": f"Durum: Bağlı ({n} hesap)" if n > 1 else "Durum: Bağlı"})
                 self._log("Google Search Console servisi hazır.")
+                self._ui(self._offer_resume)
             except Exception as e:
                 self._log(f"HATA (OAuth): {e}")
-                messagebox.showerror("Hata", str(e))
+                self._ui(messagebox.showerror, "Hata", str(e))
         threading.Thread(target=run, daemon=True).start()
 
     def on_load_txt(self):
+        if self._busy():
+            return
         try:
             base_dir = os.path.dirname(os.path.abspath(__file__))
         except NameError:
             base_dir = os.getcwd()
         path = filedialog.askopenfilename(
-            title="Sitemap URL listesi (.txt)",
-            filetypes=[("Text", "*.txt"), ("All files", "*.*")],
+            title="Sitemap URL listesi (.txt / .csv / .gz)",
+            filetypes=[("Sitemap listesi", "*.txt *.csv *.gz"), ("Text", "*.txt"), ("CSV", "*.csv"),
+                       ("Gzip", "*.gz"), ("All files", "*.*")],
             initialdir=base_dir
         )
         if not path:
             return
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                lines = [ln.strip() for ln in f if ln.strip()]
-            for ln in lines:
-                if is_probably_sitemap(ln):
-                    self.listbox.insert(tk.END, ln)
-            self._log(f"{len(lines)} satır yüklendi: {os.path.basename(path)}")
-        except Exception as e:
-            self._log(f"HATA (.txt): {e}")
-            messagebox.showerror("Hata", str(e))
+        cancel = self._import_cancel = threading.Event()
+        self._show_progress(True)
+        name = os.path.basename(path)
+        self._log(f"İçe aktarılıyor: {name}")
+
+        def on_progress(st):
+            self._ui(self._set_progress, st.fraction, f"{st.lines:,} satır, {st.added:,} yeni")
+
+        def run():
+            try:
+                st = import_sitemaps(path, self.model.extend, on_progress=on_progress, cancel=cancel)
+                state = "iptal edildi" if st.cancelled else "tamamlandı"
+                self._log(f"İçe aktarma {state}: {st.lines} satır okundu, {st.accepted} sitemap, "
+                          f"{st.added} yeni eklendi: {name}")
+            except Exception as e:
+                self._log(f"HATA (içe aktarma): {e}")
+                self._ui(messagebox.showerror, "Hata", str(e))
+            finally:
+                self._ui(self._show_progress, False)
+                self._import_cancel = None
+        threading.Thread(target=run, daemon=True).start()
+
+    def on_cancel(self):
+        if self._import_cancel is not None:
+            self._import_cancel.set()
+        elif self.job is not None:
+            self.job.cancel()
+            self._log("⏹ İptal ediliyor; devam eden istekler tamamlanıyor…")
+
+    def on_pause(self):
+        job = self.job
+        if job is None:
+            return
+        if job.state == "paused":
+            job.resume()
+            self.btn_pause.config(text="⏸ Duraklat")
+            self._log("▶ İş devam ediyor.")
+        else:
+            job.pause()
+            self.btn_pause.config(text="▶ Devam")
+            self._log("⏸ İş duraklatıldı (devam eden istekler tamamlanıyor).")
+
+    def _busy(self) -> bool:
+        if self._import_cancel is not None or self.job is not None:
+            messagebox.showinfo("Bilgi", "Devam eden bir işlem var; bitmesini bekleyin veya iptal edin.")
+            return True
+        return False
+
+    def _show_progress(self, visible: bool, pausable: bool = False):
+        if visible:
+            self.progress["value"] = 0
+            self.lbl_progress.config(text="")
+            self.btn_pause.config(text="⏸ Duraklat")
+            self.progress.pack(side="left", padx=(12,6))
+            self.lbl_progress.pack(side="left")
+            if pausable:
+                self.btn_pause.pack(side="left", padx=(6,0))
+            self.btn_cancel.pack(side="left", padx=(6,0))
+        else:
+            for w in (self.progress, self.lbl_progress, self.btn_pause, self.btn_cancel):
+                w.pack_forget()
+
+    def _set_progress(self, fraction: float, text: str):
+        self.progress["value"] = fraction
+        self.lbl_progress.config(text=text)
 
     def on_add_manual(self):
         def add():
-            url = ent.get().strip()
+            url = normalize_url(ent.get())
             if not url:
-                return
-            self.listbox.insert(tk.END, url)
+                return messagebox.showwarning("Uyarı", "Geçerli bir http(s) URL girin.", parent=win)
+            if not self.model.add(url):
+                self._log(f"Zaten listede: {url}")
             win.destroy()
         win = tk.Toplevel(self)
         win.title("Sitemap URL ekle")
@@ -376,57 +554,265 @@ class App(tk.Tk):
         ttk.Button(win, text="Ekle", style="Accent.TButton", command=add).pack(pady=(0,10))
 
     def on_delete_selected(self):
-        sel = list(self.listbox.curselection())
-        sel.reverse()
-        for idx in sel:
-            self.listbox.delete(idx)
+        self.model.remove(self.view.selection())
+        self.view.clear_selection()
 
     def on_clear_all(self):
-        self.listbox.delete(0, tk.END)
+        self.model.clear()
 
     def on_submit_selected(self):
-        if self.service is None:
+        if self.client is None:
             return messagebox.showwarning("Uyarı", "Önce OAuth ile yetkilendirin.")
-        sel = self.listbox.curselection()
-        indices = sel if sel else range(self.listbox.size())
-        urls = [self.listbox.get(i) for i in indices]
+        if self._busy():
+            return
+        urls = self.view.selection() or list(self.view.rows)
         if not urls:
             return messagebox.showinfo("Bilgi", "Gönderilecek URL yok.")
         if not messagebox.askyesno("Onay", f"{len(urls)} sitemap gönderilecek, devam edilsin mi?"):
             return
 
+        self._log(f"{len(urls)} sitemap submit ediliyor…")
+        self._start_job(self.jobs.create("submit", urls, label="Seçilenleri submit", ok_text="OK",
+                                         incremental=self.var_incremental.get()))
+
+    # ---------- Jobs ----------
+    def _start_job(self, job):
+        # Tk thread'inde çağrılır: yuva thread başlamadan ayrılır, arada ikinci bir iş başlatılamaz
+        self.job = job
+        threading.Thread(target=self._run_job, args=(job,), daemon=True).start()
+
+    def _run_job(self, job):
+        # İş bitene (veya iptal/durdurulana) kadar bu thread'de çalışır.
+        self._ui(self._show_progress, True, True)
+        profiler = ThreadProfiler() if self._profile_next else None
+        try:
+            if profiler is None:
+                getattr(self, f"_job_{job.kind}")(job)
+            else:
+                self._profile_next = False
+                self._ui(self.var_profile.set, False)
+                with profiler:
+                    getattr(self, f"_job_{job.kind}")(job)
+        except Exception as e:
+            job.stop()  # kontrol noktası diskte kalır; sonraki yetkilendirmede devam ettirilebilir
+            self._log(f"HATA ({job.label}): {e} — iş kaydedildi, kaldığı yerden sürdürülebilir.")
+        finally:
+            if profiler is not None:
+                self._save_profile(job, profiler)
+            p = job.progress()
+            if job.state == "cancelled":
+                self._log(f"⏹ {job.label} iptal edildi: {p.done:,}/{p.total:,} öğe işlendi.")
+            job.finish()
+            if self.job is job:
+                self.job = None
+            self._ui(self._show_progress, False)
+
+    def _save_profile(self, job, profiler):
+        path = os.path.join(PROFILE_DIR, f"{job.id}.prof")
+        try:
+            top = profiler.dump(path, top=10)
+        except OSError as e:
+            return self._log(f"HATA (profil kaydetme): {e}")
+        self._log(f"🔬 Profil kaydedildi: {path} (python -m pstats {path})")
+        for line in top.splitlines():
+            if line.strip():
+                self._log(f"   {line}")
+
+    def _offer_resume(self):
+        pending = self.jobs.pending()
+        if not pending or self.job is not None:
+            return
+        job = pending[-1]
+        p = job.progress()
+        answer = messagebox.askyesnocancel(
+            "Yarım kalan iş",
+            f"“{job.label}” işi yarım kalmış: {p.done:,}/{p.total:,} öğe tamamlandı "
+            f"({p.ok:,} başarılı, {p.failed:,} hatalı).\n\n"
+            "Evet: kaldığı yerden devam et\nHayır: işi sil\nİptal: sonra karar ver")
+        if answer:
+            self._log(f"▶ “{job.label}” kaldığı yerden sürüyor: {p.total - p.done:,} öğe kaldı.")
+            self._start_job(job)
+        elif answer is False:
+            job.delete()
+            self._log(f"🗑️ Yarım kalan “{job.label}” işi silindi.")
+
+    def _job_submit(self, job):
+        urls = job.remaining
+        ok_text = job.options.get("ok_text", "OK")
+        n = job.total
+        def on_result(res):
+            job.record(res.url, res.ok)
+            done = len(job.done)
+            if res.ok:
+                self._log(f"[{done}/{n}] ✅ {ok_text}: {res.url}")
+            else:
+                self._log(f"[{done}/{n}] ❌ Hata: {res.url} — {res.error}")
+        if len(urls) < n:
+            self._log(f"▶ {n - len(urls):,} sitemap önceki oturumda işlenmişti, atlanıyor.")
+        try:
+            unowned = unowned_sitemaps(self.client, urls)
+        except Exception as e:
+            self._log(f"HATA (mülk listesi): {e}")
+            unowned = []
+        if unowned:
+            self._log(f"🚫 {len(unowned)} sitemap doğrulanmış bir mülke ait değil, GSC'ye gönderilmeyecek:")
+            for u in unowned[:20]:
+                self._log(f"   • {u}")
+            if len(unowned) > 20:
+                self._log(f"   … ve {len(unowned) - 20} tane daha")
+        invalid = sum(1 for u in urls if u in self.validation and not self.validation[u].ok)
+        if invalid:
+            self._log(f"⚠️ {invalid} sitemap son doğrulamada hatalıydı (🧪 tablosuna bakın); yine de gönderiliyor.")
+        incremental = job.options.get("incremental", False)
+        if incremental:
+            self._log("♻️ Artımlı mod: sitemap'ler koşullu GET ile kontrol ediliyor, değişmeyenler atlanacak.")
+        summary = submit_sitemaps(self.client, job.iter_pending(), on_result=on_result, history=self.history,
+                                  incremental=incremental, on_skip=lambda u: job.record(u, True),
+                                  should_run=job.wait_running)
+        self._log(f"Tamamlandı. Başarılı: {summary.ok}/{summary.total} — "
+                  f"{summary.throughput:.1f} submit/sn ({summary.elapsed:.1f} sn)")
+        if incremental:
+            self._log(f"♻️ {summary.skipped} sitemap değişmemiş, {summary.skipped} API çağrısı önlendi.")
+        if job.options.get("notify") and not job.halted:
+            self._ui(messagebox.showinfo, "Tamamlandı", f"Başarılı: {summary.ok}/{summary.total}\n"
+                                                        f"Hız: {summary.throughput:.1f} submit/sn")
+
+    def on_toggle_watch(self):
+        if self.watcher is not None:
+            self._watch_stop.set()
+            self.btn_watch.config(text="👁️ İzlemeyi Başlat")
+            return
+        if self.client is None:
+            return messagebox.showwarning("Uyarı", "Önce OAuth yapın.")
+        urls = self.view.selection() or list(self.view.rows)
+        if not urls:
+            return messagebox.showinfo("Bilgi", "İzlenecek sitemap yok.")
+
+        def on_check(url, changed, interval, error):
+            if error:
+                self._log(f"👁️ ⚠️ {url}: {error} (sonraki kontrol {interval / 60:.0f} dk)")
+            elif changed:
+                self._log(f"👁️ ♻️ Değişti: {url} (sonraki kontrol {interval / 60:.0f} dk)")
+
+        def on_result(res):
+            if res.ok:
+                self._log(f"👁️ ✅ Gönderildi: {res.url}")
+            else:
+                self._log(f"👁️ ❌ Hata: {res.url} — {res.error}")
+
+        watcher = self.watcher = SitemapWatcher(self.client, self.history, on_check=on_check, on_result=on_result)
+        stop = self._watch_stop = threading.Event()
+        n = watcher.add(urls)
+        self.btn_watch.config(text="⏹ İzlemeyi Durdur")
+        self._log(f"👁️ {n} sitemap izleniyor: koşullu GET ile yoklanır, yalnızca değişenler submit edilir.")
+
         def run():
-            ok = 0
-            for i, u in enumerate(urls, 1):
-                try:
-                    prefix = base_prefix_from_sitemap(u)
-                    self._log(f"[{i}/{len(urls)}] Submit → {u}")
-                    self.service.sitemaps().submit(siteUrl=prefix, feedpath=u).execute()
-                    self._log(f"✅ OK: {u}")
-                    ok += 1
-                except Exception as e:
-                    self._log(f"❌ Hata: {u} — {e}")
-            self._log(f"Tamamlandı. Başarılı: {ok}/{len(urls)}")
+            try:
+                watcher.run(stop)
+            except Exception as e:
+                self._log(f"HATA (izleme): {e}")
+            finally:
+                self._log(f"👁️ İzleme durdu. {watcher.summary()}")
+                self.watcher = None
+                self._ui(self.btn_watch.config, {"text": "👁️ İzlemeyi Başlat"})
         threading.Thread(target=run, daemon=True).start()
 
-
     def on_check_status(self):
-        if self.service is None:
+        if self.client is None:
             return messagebox.showwarning("Uyarı", "Önce OAuth yapın.")
-        sel = self.listbox.curselection()
-        urls = [self.listbox.get(i) for i in sel] if sel else [self.listbox.get(i) for i in range(self.listbox.size())]
+        if self._busy():
+            return
+        urls = self.view.selection() or list(self.view.rows)
         if not urls:
             return messagebox.showinfo("Bilgi", "Kontrol edilecek sitemap yok.")
+        self._start_job(self.jobs.create("status", urls, label="Durum kontrolü"))
+
+    def _job_status(self, job):
+        if job.done:
+            self._log(f"▶ {len(job.done):,} sitemap önceki oturumda kontrol edilmişti (sonuçları geçmişte); "
+                      "tablo bu oturumdakileri gösterir.")
+        self._log(f"🔍 {job.total - len(job.done)} sitemap için durum alınıyor (mülk başına tek sorgu)…")
+        rows = []
+        for batch in job.iter_batches(STATUS_BATCH):
+            batch_rows = fetch_statuses(self.client, batch)
+            self.history.record_statuses(batch_rows)
+            for r in batch_rows:
+                job.record(r.url, not r.error)
+            rows.extend(batch_rows)
+        failed = sum(1 for r in rows if r.error)
+        self._log(f"Durum kontrolü tamamlandı: {len(rows) - failed} bulundu, {failed} hata.")
+        if rows:
+            self._ui(self._show_table, f"Durum Kontrolü — {len(rows)} sitemap", self.STATUS_COLUMNS, rows)
+
+    def on_validate(self):
+        urls = self.view.selection() or list(self.view.rows)
+        if not urls:
+            return messagebox.showinfo("Bilgi", "Doğrulanacak sitemap yok.")
+        def on_result(res):
+            self.validation[res.url] = res
+            if res.children:
+                added = self.model.extend(res.children)
+                self._log(f"📚 {res.url} — index, {len(res.children)} alt sitemap ({added} yeni listeye eklendi)")
+            elif res.ok:
+                self._log(f"✅ {res.url} — {res.entries:,} URL, {res.size / 1048576:.1f} MB")
+            if res.errors:
+                self._log(f"❌ {res.url} — {res.issues}")
         def run():
-            for u in urls:
-                try:
-                    prefix = base_prefix_from_sitemap(u)
-                    resp = self.service.sitemaps().get(siteUrl=prefix, feedpath=u).execute()
-                    self._log(f"🔍 {u} → Status: {resp.get('isPending', False)}, LastDownload: {resp.get('lastDownloaded')}")
-                except Exception as e:
-                    self._log(f"❌ {u} — {e}")
+            self._log(f"🧪 {len(urls)} sitemap indiriliyor ve doğrulanıyor (index'ler genişletilecek)…")
+            try:
+                summary = validate_sitemaps(urls, on_result=on_result)
+            except Exception as e:
+                return self._log(f"HATA (doğrulama): {e}")
+            self._log(f"Doğrulama tamamlandı: {summary.valid}/{summary.total} geçerli, "
+                      f"{summary.expanded} alt sitemap genişletildi ({summary.elapsed:.1f} sn)")
+            rows = [self.validation[u] for u in self.validation]
+            self._ui(self._show_table, f"Doğrulama — {len(rows)} sitemap", self.VALIDATION_COLUMNS, rows)
         threading.Thread(target=run, daemon=True).start()
 
+    STATUS_COLUMNS = (
+        ("url", "Sitemap", 360), ("is_pending", "Bekliyor", 70), ("last_downloaded", "Son İndirme", 150),
+        ("errors", "Hata", 55), ("warnings", "Uyarı", 55), ("submitted", "Gönderilen", 80),
+        ("indexed", "Dizinlenen", 80), ("error", "Sorun", 220),
+    )
+
+    VALIDATION_COLUMNS = (
+        ("url", "Sitemap", 360), ("kind", "Tür", 95), ("entries", "Girdi", 70), ("size", "Bayt", 90),
+        ("compressed", "gzip", 50), ("parent", "Üst index", 220), ("issues", "Sorun", 260),
+    )
+
+    def _show_table(self, title, columns, rows):
+        win = tk.Toplevel(self)
+        win.title(title)
+        win.configure(bg=self.P_BG)
+        win.geometry("1100x520")
+        cols = [c[0] for c in columns]
+        tree = ttk.Treeview(win, columns=cols, show="headings")
+        scroll = ttk.Scrollbar(win, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scroll.set)
+        tree.grid(row=0, column=0, sticky="nsew", padx=(10,0), pady=10)
+        scroll.grid(row=0, column=1, sticky="ns", pady=10, padx=(0,10))
+        win.grid_rowconfigure(0, weight=1)
+        win.grid_columnconfigure(0, weight=1)
+
+        data = {}
+        for r in rows:
+            values = ["" if v is None else v for v in (getattr(r, c) for c in cols)]
+            data[tree.insert("", tk.END, values=values)] = values
+        order = {"col": None, "reverse": False}
+
+        def sort_by(col):
+            order["reverse"] = not order["reverse"] if order["col"] == col else False
+            order["col"] = col
+            i = cols.index(col)
+            items = sorted(data, key=lambda iid: (str(type(data[iid][i])), data[iid][i]), reverse=order["reverse"])
+            for pos, iid in enumerate(items):
+                tree.move(iid, "", pos)
+
+        for col, heading, width in columns:
+            tree.heading(col, text=heading, command=lambda c=col: sort_by(c))
+            tree.column(col, width=width, stretch=(col in ("url", "error", "issues")),
+                        anchor="w" if col in ("url", "last_downloaded", "error", "parent", "issues") else "center")
+
     def on_save_log(self):
         path = filedialog.asksaveasfilename(
             title="Log dosyasını kaydet",
@@ -437,17 +823,137 @@ class App(tk.Tk):
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(self.txt_log.get("1.0", tk.END))
-            self._log(f"💾 Log kaydedildi: {path}")
+            n = self.log_sink.export_text(path)
+            self._log(f"💾 Log kaydedildi ({n} kayıt): {path}")
             messagebox.showinfo("Bilgi", f"Log kaydedildi:\n{path}")
         except Exception as e:
             self._log(f"HATA (log kaydetme): {e}")
 
     # ---------- Utils ----------
     def _log(self, msg: str):
-        self.txt_log.insert(tk.END, msg + "\n")
-        self.txt_log.see(tk.END)
+        # Her thread'den çağrılabilir; widget'a yalnızca Tk thread'i _pump_ui ile yazar.
+        with self.metrics.timer(UI, op="log_emit"):
+            self.log_sink.emit(msg)
+
+    def _ui(self, fn, *args):
+        # Worker thread'lerinden Tk çağrısı: Tk thread'inde _pump_ui ile çalıştırılır.
+        self._ui_calls.put((fn, args))
+
+    def _pump_ui(self):
+        # Bir çağrı hata verse de pompa durmamalı: aksi halde log ve tüm _ui çağrıları oturum boyunca kesilir.
+        try:
+            self._drain_ui()
+        finally:
+            self.after(LOG_DRAIN_MS, self._pump_ui)
+
+    def _drain_ui(self):
+        t0 = time.perf_counter()
+        if self._last_pump is not None:
+            # planlanandan ne kadar geç çalıştık: Tk thread'inin başka bir işte bloklandığı süre
+            self.metrics.observe(UI, max(0.0, t0 - self._last_pump - LOG_DRAIN_MS / 1000), op="pump_lag")
+        self._last_pump = t0
+        lines = self.log_sink.drain()
+        if lines:
+            self.txt_log.insert(tk.END, "\n".join(lines[-LOG_UI_LINES:]) + "\n")
+            overflow = int(self.txt_log.index("end-1c").split(".")[0]) - 1 - LOG_UI_LINES
+            if overflow > 0:
+                self.txt_log.delete("1.0", f"{overflow + 1}.0")
+            self.txt_log.see(tk.END)
+            t1 = time.perf_counter()
+            self.metrics.observe(UI, t1 - t0, op="log_drain")
+            t0 = t1
+        n = 0
+        while True:
+            try:
+                fn, args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            n += 1
+            try:
+                fn(*args)
+            except Exception as e:
+                self._log(f"HATA (arayüz, {getattr(fn, '__name__', fn)}): {type(e).__name__}: {e}")
+        if n:
+            self.metrics.observe(UI, time.perf_counter() - t0, op="ui_calls")
+
+    def _schedule_filter(self):
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(LIST_REFRESH_MS, self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_job = None
+        self.view.set_query(self.var_filter.get())
+        self._update_count()
+
+    def _refresh_list(self):
+        # _pump_ui gibi: bir güncelleme hata verse de döngü durmamalı (liste, ilerleme ve başlık donar)
+        try:
+            self._refresh_views()
+        finally:
+            self.after(LIST_REFRESH_MS, self._refresh_list)
+
+    def _refresh_views(self):
+        t0 = time.perf_counter()
+        if self.view.refresh():
+            self._update_count()
+            self.metrics.observe(UI, time.perf_counter() - t0, op="list_refresh")
+        if self.txt_stats.winfo_ismapped() and t0 >= self._stats_due:
+            self._stats_due = t0 + STATS_REFRESH_MS / 1000
+            self._render_stats()
+        job = self.job
+        if job is not None:
+            p = job.progress()
+            self._set_progress(p.fraction, f"{job.label}: {p.text()}")
+        cache_text = self.cache.summary()
+        if self.client is not None:
+            cache_text = f"{self.client.scheduler.summary()}  ·  {cache_text}"
+        if self.watcher is not None:
+            cache_text = f"👁️ {self.watcher.summary()}  ·  {cache_text}"
+        if self.lbl_cache.cget("text") != cache_text:
+            self.lbl_cache.config(text=cache_text)
+
+    def on_toggle_stats(self):
+        if self.txt_stats.winfo_ismapped():
+            self.txt_stats.grid_remove()
+            self.btn_stats.config(text="📈 İstatistikler")
+        else:
+            self.txt_stats.grid()
+            self.btn_stats.config(text="📈 İstatistikleri Gizle")
+            self._stats_due = 0.0
+
+    def _render_stats(self):
+        text = self.metrics.report()
+        if self.client is not None:
+            text += f"\n{self.client.scheduler.summary()}\n"
+        self.txt_stats.delete("1.0", tk.END)
+        self.txt_stats.insert(tk.END, text)
+
+    def _update_count(self):
+        total = len(self.model)
+        shown = len(self.view.rows)
+        self.lbl_count.config(text=f"{shown}/{total}" if shown != total else f"{total}")
+
+    def _on_close(self):
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+        if self.job is not None:
+            self.job.stop()  # kontrol noktası diskte kalır, sonraki açılışta devam edilebilir
+        try:
+            self.cache.save()
+            if self.client is not None:
+                self.client.scheduler.quota.save()
+        except OSError as e:
+            self._log(f"HATA (durum kaydetme): {e}")
+        try:
+            self.metrics.stop()
+        except OSError as e:
+            self._log(f"HATA (metrik kaydetme): {e}")
+        self.history.close()
+        if self.analytics is not None:
+            self.analytics.close()
+        self.log_sink.close()
+        self.destroy()
 
 if __name__ == "__main__":
     app = App()
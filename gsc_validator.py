@@ -0,0 +1,304 @@
+import asyncio
+import gzip
+import http.client
+import threading
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+from gsc_fetch import FETCH_CHUNK, FETCH_TIMEOUT, USER_AGENT
+
+# sitemaps.org protokol sınırları
+MAX_SITEMAP_URLS = 50000
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024  # sıkıştırılmamış
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+VALIDATE_CONNECTIONS = 16  # eşzamanlı indirme (ve thread başına açık tutulan bağlantı)
+MAX_REDIRECTS = 5
+SAMPLE_LIMIT = 3           # hata mesajında örneklenen geçersiz <loc> sayısı
+
+class _LimitExceeded(Exception):
+    pass
+
+@dataclass
+class ValidationResult:
+    url: str
+    parent: Optional[str] = None
+    kind: str = ""            # "urlset" | "sitemapindex" | ""
+    status: int = 0
+    entries: int = 0
+    size: int = 0             # sıkıştırılmamış bayt
+    compressed: bool = False
+    children: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def issues(self) -> str:
+        return "; ".join(self.errors + self.warnings)
+
+@dataclass
+class ValidationSummary:
+    total: int
+    valid: int
+    expanded: int
+    elapsed: float
+
+    @property
+    def invalid(self) -> int:
+        return self.total - self.valid
+
+# -------------------- HTTP --------------------
+class ConnectionPool:
+    # Thread başına (şema, host) -> açık HTTP(S) bağlantısı. Aynı hosttaki alt sitemap'ler
+    # keep-alive ile tek bağlantı (ve tek TLS el sıkışması) üzerinden indirilir.
+    def __init__(self, timeout: float = FETCH_TIMEOUT):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._all = []
+        self._lock = threading.Lock()
+
+    def _conns(self) -> dict:
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        return conns
+
+    def get(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        conns = self._conns()
+        conn = conns.get((scheme, netloc))
+        if conn is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conns[(scheme, netloc)] = cls(netloc, timeout=self.timeout)
+            with self._lock:
+                self._all.append(conn)
+        return conn
+
+    def discard(self, scheme: str, netloc: str):
+        conn = self._conns().pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self):
+        with self._lock:
+            conns, self._all = self._all, []
+        for conn in conns:
+            conn.close()
+
+    def open(self, url: str):
+        # GET + yönlendirme takibi; (son URL, yanıt) döner. Yanıt sonuna kadar okunmazsa discard() çağrılmalı.
+        for _ in range(MAX_REDIRECTS + 1):
+            p = urlsplit(url)
+            if p.scheme not in ("http", "https") or not p.netloc:
+                raise ValueError(f"Geçersiz URL: {url}")
+            target = (p.path or "/") + (f"?{p.query}" if p.query else "")
+            headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+            for attempt in (0, 1):
+                conn = self.get(p.scheme, p.netloc)
+                try:
+                    conn.request("GET", target, headers=headers)
+                    resp = conn.getresponse()
+                    break
+                except (http.client.HTTPException, ConnectionError):
+                    self.discard(p.scheme, p.netloc)  # sunucu keep-alive bağlantısını kapatmış olabilir
+                    if attempt:
+                        raise
+            if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+                resp.read()
+                url = urljoin(url, resp.getheader("Location"))
+                continue
+            return url, resp
+        raise ValueError(f"Çok fazla yönlendirme: {url}")
+
+class _Stream:
+    # Okunan (sıkıştırılmamış) baytları sayar, sınır aşılınca ayrıştırmayı keser.
+    def __init__(self, raw, head: bytes, limit: int):
+        self.raw = raw
+        self.head = head
+        self.limit = limit
+        self.count = 0
+
+    def read(self, n: int = -1) -> bytes:
+        if self.head:
+            data, self.head = self.head, b""
+        else:
+            data = self.raw.read(n if n and n > 0 else FETCH_CHUNK)
+        self.count += len(data)
+        if self.count > self.limit:
+            raise _LimitExceeded()
+        return data
+
+# -------------------- Parsing --------------------
+def _local(tag: str):
+    ns, _, name = tag[1:].partition("}") if tag.startswith("{") else ("", "", tag)
+    return ns, name
+
+def _parse(stream, res: ValidationResult, sitemap_url: str):
+    # iterparse + her girdiden sonra kökü temizleme: bellek kullanımı dosya boyutundan bağımsız.
+    # Yalnızca index'lerin alt sitemap URL'leri (genişletme için) tutulur.
+    scope = sitemap_url.rsplit("/", 1)[0] + "/"
+    stack, root, entry_tag = [], None, None
+    has_loc = False
+    bad, bad_sample, missing, out_of_scope = 0, [], 0, 0
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        ns, name = _local(elem.tag)
+        if event == "start":
+            if root is None:
+                root = elem
+                res.kind = name if name in ("urlset", "sitemapindex") else ""
+                if not res.kind:
+                    res.errors.append(f"Kök öğe <{name}>; <urlset> veya <sitemapindex> bekleniyordu")
+                    return
+                if ns != SITEMAP_NS:
+                    res.warnings.append(f"Ad alanı '{ns or '-'}' (beklenen {SITEMAP_NS})")
+                entry_tag = "url" if res.kind == "urlset" else "sitemap"
+            stack.append(name)
+            continue
+        stack.pop()
+        if name == "loc" and len(stack) == 2 and stack[1] == entry_tag:
+            has_loc = True
+            loc = (elem.text or "").strip()
+            p = urlsplit(loc)
+            if p.scheme not in ("http", "https") or not p.netloc:
+                bad += 1
+                if len(bad_sample) < SAMPLE_LIMIT:
+                    bad_sample.append(loc or "(boş)")
+            elif res.kind == "sitemapindex":
+                res.children.append(loc)
+            elif not loc.startswith(scope):
+                out_of_scope += 1
+        elif name == entry_tag and len(stack) == 1:
+            res.entries += 1
+            missing += not has_loc
+            has_loc = False
+            root.clear()
+    noun = "URL" if res.kind == "urlset" else "alt sitemap"
+    if res.entries > MAX_SITEMAP_URLS:
+        res.errors.append(f"{res.entries:,} {noun} (sınır {MAX_SITEMAP_URLS:,})")
+    if missing:
+        res.errors.append(f"{missing} girdide <loc> yok")
+    if bad:
+        res.errors.append(f"{bad} geçersiz <loc> (ör. {', '.join(bad_sample)})")
+    if res.entries == 0:
+        res.warnings.append("Hiç girdi yok")
+    if out_of_scope:
+        res.warnings.append(f"{out_of_scope} URL sitemap'in bulunduğu dizinin dışında")
+
+def validate_sitemap(url: str, parent: Optional[str] = None, pool: Optional[ConnectionPool] = None,
+                     max_bytes: int = MAX_SITEMAP_BYTES) -> ValidationResult:
+    res = ValidationResult(url, parent)
+    own_pool = pool is None
+    pool = pool or ConnectionPool()
+    t0 = time.perf_counter()
+    final_url, resp = url, None
+    try:
+        final_url, resp = pool.open(url)
+        res.status = resp.status
+        if resp.status != 200:
+            res.errors.append(f"HTTP {resp.status}")
+            return res
+        head = resp.read(2)
+        res.compressed = head == b"\x1f\x8b" or resp.getheader("Content-Encoding", "").lower() == "gzip"
+        raw = resp
+        if res.compressed:
+            raw, head = gzip.GzipFile(fileobj=_Stream(resp, head, float("inf")), mode="rb"), b""
+        stream = _Stream(raw, head, max_bytes)
+        try:
+            _parse(stream, res, final_url)
+        except _LimitExceeded:
+            res.errors.append(f"{max_bytes // (1024 * 1024)} MB sınırı aşıldı (sıkıştırılmamış)")
+        except ET.ParseError as e:
+            res.errors.append(f"XML ayrıştırılamadı: {e}")
+        finally:
+            res.size = stream.count
+    except (OSError, EOFError, zlib.error, http.client.HTTPException, ValueError) as e:
+        res.errors.append(str(e) or type(e).__name__)
+    except Exception as e:
+        res.errors.append(f"Beklenmeyen hata: {type(e).__name__}: {e}")
+    finally:
+        if resp is not None and not resp.isclosed():
+            # yanıt sonuna kadar okunmadı; bağlantı yeniden kullanılamaz
+            p = urlsplit(final_url)
+            pool.discard(p.scheme, p.netloc)
+        res.elapsed = time.perf_counter() - t0
+        if own_pool:
+            pool.close()
+    return res
+
+# -------------------- Async orchestration --------------------
+async def validate_async(urls: Iterable[str], connections: int = VALIDATE_CONNECTIONS, expand: bool = True,
+                         on_result: Optional[Callable[[ValidationResult], None]] = None,
+                         max_bytes: int = MAX_SITEMAP_BYTES) -> ValidationSummary:
+    # Sabit sayıda işçi coroutine'i kuyruktan sitemap alır; indirme + ayrıştırma engelleyici olduğundan
+    # `connections` boyutlu thread havuzunda çalışır. Index'lerin alt sitemap'leri aynı kuyruğa eklenir.
+    connections = max(1, connections)
+    loop = asyncio.get_running_loop()
+    pool = ConnectionPool()
+    executor = ThreadPoolExecutor(max_workers=connections, thread_name_prefix="gsc-validate")
+    queue = asyncio.Queue()
+    window = asyncio.Semaphore(connections * 4)  # girdi listesi akış halinde okunur
+    seen = set()
+    counts = {"total": 0, "valid": 0, "expanded": 0}
+    callback_errors = []  # on_result hataları: işçi sürer, bitişte ilki yükseltilir
+    t0 = time.perf_counter()
+
+    async def worker():
+        while True:
+            url, parent = await queue.get()
+            try:
+                try:
+                    res = await loop.run_in_executor(executor, validate_sitemap, url, parent, pool, max_bytes)
+                except Exception as e:
+                    res = ValidationResult(url, parent, errors=[f"Beklenmeyen hata: {type(e).__name__}: {e}"])
+                if parent is not None and res.kind == "sitemapindex":
+                    res.errors.append("İç içe sitemap index: index dosyası yalnızca urlset içerebilir")
+                counts["total"] += 1
+                counts["valid"] += res.ok
+                if expand and parent is None and res.kind == "sitemapindex":
+                    for child in res.children:
+                        if child not in seen:
+                            seen.add(child)
+                            counts["expanded"] += 1
+                            queue.put_nowait((child, url))
+                if on_result:
+                    try:
+                        on_result(res)
+                    except Exception as e:
+                        callback_errors.append(e)
+            finally:
+                if parent is None:
+                    window.release()
+                queue.task_done()
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(connections)]
+    try:
+        for u in urls:
+            if u in seen:
+                continue
+            seen.add(u)
+            await window.acquire()
+            queue.put_nowait((u, None))
+        await queue.join()
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        executor.shutdown(wait=True)
+        pool.close()
+    if callback_errors:
+        raise callback_errors[0]
+    return ValidationSummary(counts["total"], counts["valid"], counts["expanded"], time.perf_counter() - t0)
+
+def validate_sitemaps(urls: Iterable[str], connections: int = VALIDATE_CONNECTIONS, expand: bool = True,
+                      on_result: Optional[Callable[[ValidationResult], None]] = None,
+                      max_bytes: int = MAX_SITEMAP_BYTES) -> ValidationSummary:
+    # on_result çağıran thread'de (olay döngüsü) çalışır
+    return asyncio.run(validate_async(urls, connections, expand, on_result, max_bytes))
@@ -0,0 +1,180 @@
+import datetime
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+from gsc_fetch import fetch_conditional
+from gsc_history import SubmissionHistory, content_unchanged
+
+WATCH_WORKERS = 16          # eşzamanlı koşullu GET
+WATCH_START_INTERVAL = 3600.0
+WATCH_MIN_INTERVAL = 300.0
+WATCH_MAX_INTERVAL = 86400.0
+WATCH_FASTER = 0.5          # değişiklik görülünce aralık çarpanı
+WATCH_SLOWER = 1.25         # değişmeyince aralık çarpanı
+WATCH_JITTER = 0.1          # ±%10; aynı anda eklenen sitemap'ler zamanla dağılır
+WATCH_ERROR_INTERVAL = 900.0
+WATCH_TICK = 1.0            # sn; yeni eklenen URL'ler / durdurma en geç bu sürede fark edilir
+
+def modified_after_download(last_modified: Optional[str], gsc_last_downloaded: Optional[str]) -> bool:
+    # HTTP Last-Modified, GSC'nin bildirdiği son indirmeden yeni mi (taban çizgisinden önceki değişiklik)
+    if not last_modified or not gsc_last_downloaded:
+        return False
+    try:
+        modified = parsedate_to_datetime(last_modified)
+        downloaded = datetime.datetime.fromisoformat(gsc_last_downloaded.replace("Z", "+00:00"))
+        if downloaded.tzinfo is None:
+            downloaded = downloaded.replace(tzinfo=datetime.timezone.utc)
+        return modified > downloaded
+    except (TypeError, ValueError):
+        return False
+
+class SitemapWatcher:
+    # Uzun süre çalışan izleyici: her sitemap kendi zamanında koşullu GET (ETag / Last-Modified)
+    # ile yoklanır, yalnızca içerik değişince (veya hiç başarıyla gönderilmemişse) submit edilir.
+    # Aralık sitemap başına uyarlanır: değişiklik gördükçe kısalır, görmedikçe uzar.
+    def __init__(self, client, history: SubmissionHistory, workers: int = WATCH_WORKERS,
+                 min_interval: float = WATCH_MIN_INTERVAL, max_interval: float = WATCH_MAX_INTERVAL,
+                 start_interval: float = WATCH_START_INTERVAL, fetch=fetch_conditional, submit=None,
+                 on_check: Optional[Callable] = None, on_result: Optional[Callable] = None, clock=time.time):
+        if submit is None:
+            from gsc_core import submit_sitemaps as submit
+        self.client = client
+        self.history = history
+        self.workers = max(1, workers)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.start_interval = min(self.max_interval, max(min_interval, start_interval))
+        self.fetch = fetch
+        self.submit = submit
+        self.on_check = on_check      # on_check(url, değişti mi | None (hata), sonraki aralık, hata)
+        self.on_result = on_result    # submit sonuçları (gsc_core.SubmitResult)
+        self.clock = clock
+        self.checks = 0
+        self.changes = 0
+        self.submitted = 0
+        self.errors = 0
+        self._heap = []
+        self._due = {}
+        self._interval = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._due)
+
+    def add(self, urls: Iterable[str]) -> int:
+        now = self.clock()
+        added = 0
+        with self._lock:
+            for u in urls:
+                if u in self._due:
+                    continue
+                h = self.history.get(u) or {}
+                interval = self._clamp(h.get("watch_interval") or self.start_interval)
+                checked = h.get("checked")
+                self._schedule(u, interval, max(now, checked + interval) if checked else now)
+                added += 1
+        return added
+
+    def remove(self, urls: Iterable[str]):
+        with self._lock:
+            for u in urls:
+                self._due.pop(u, None)
+                self._interval.pop(u, None)
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def _schedule(self, url: str, interval: float, due: float):
+        self._interval[url] = interval
+        self._due[url] = due
+        heapq.heappush(self._heap, (due, url))
+
+    def _pop_due(self, now: float, limit: int) -> list:
+        out = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now and len(out) < limit:
+                due, url = heapq.heappop(self._heap)
+                if self._due.get(url) == due:  # kaldırılmış / yeniden planlanmış girdiler atlanır
+                    out.append(url)
+        return out
+
+    def _next_due(self) -> Optional[float]:
+        with self._lock:
+            while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def _check(self, url: str):
+        # (değişti mi | None (hata), hata). Değişen içerik submit başarılı olana kadar geçmişte
+        # "bekliyor" kalır: durdurma anında yarım kalan kontroller sonraki yoklamada yine değişmiş görünür.
+        h = self.history.get(url) or {}
+        res = self.fetch(url, h.get("etag"), h.get("last_modified"))
+        if res.error:
+            return None, res.error
+        if h.get("checked"):
+            changed = not content_unchanged(res, h)
+        else:
+            # ilk gözlem yalnızca taban çizgisi; GSC son indirmesinden sonra değişmişse yine gönderilir
+            changed = modified_after_download(res.last_modified, h.get("gsc_last_downloaded"))
+        self.history.record_fetch(res, commit=not changed)
+        return changed, ""
+
+    def _reschedule(self, url: str, changed: Optional[bool]):
+        with self._lock:
+            interval = self._interval.get(url)
+            if interval is None:
+                return None  # izleme sırasında kaldırıldı
+            if changed is None:
+                nxt = max(interval, WATCH_ERROR_INTERVAL)
+            else:
+                interval = self._clamp(interval * (WATCH_FASTER if changed else WATCH_SLOWER))
+                nxt = interval
+            self._schedule(url, interval, self.clock() + nxt * random.uniform(1 - WATCH_JITTER, 1 + WATCH_JITTER))
+        self.history.record_watch(url, interval)
+        return nxt
+
+    def _submit(self, urls: list):
+        summary = self.submit(self.client, urls, on_result=self.on_result, history=self.history)
+        self.submitted += summary.ok
+
+    def run(self, stop: threading.Event):
+        pending = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="gsc-watch") as ex:
+            while not stop.is_set():
+                for url in self._pop_due(self.clock(), self.workers - len(pending)):
+                    pending[ex.submit(self._check, url)] = url
+                if not pending:
+                    nxt = self._next_due()
+                    stop.wait(WATCH_TICK if nxt is None else min(WATCH_TICK, max(0.0, nxt - self.clock())))
+                    continue
+                done, _ = wait(pending, timeout=WATCH_TICK, return_when=FIRST_COMPLETED)
+                to_submit = []
+                for fut in done:
+                    url = pending.pop(fut)
+                    try:
+                        changed, error = fut.result()
+                    except Exception as e:
+                        changed, error = None, str(e)
+                    self.checks += 1
+                    self.changes += bool(changed)
+                    self.errors += changed is None
+                    nxt = self._reschedule(url, changed)
+                    if nxt is None:
+                        continue
+                    if changed:
+                        to_submit.append(url)
+                    if self.on_check:
+                        self.on_check(url, changed, nxt, error)
+                if to_submit:
+                    self._submit(to_submit)
+            for fut in pending:
+                fut.cancel()
+
+    def summary(self) -> str:
+        return (f"İzlenen {len(self)} sitemap · {self.checks} kontrol · {self.changes} değişiklik · "
+                f"{self.submitted} submit · {self.errors} hata")
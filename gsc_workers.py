@@ -0,0 +1,70 @@
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+FEED_POLL = 0.1   # sn; girdi beklenirken biten işlerin toplanma aralığı
+FEED_BUFFER = 2   # işçilere verilmeden önce okunmuş bekleyen girdi
+
+T = TypeVar("T")
+
+def bounded_map(fn: Callable[[T], object], items: Iterable[T], workers: int, window: Optional[int] = None,
+                name: str = "gsc-worker") -> Iterator[Tuple[T, Future]]:
+    # fn(item) işçi thread'lerinde çalışır; biten her iş (item, future) olarak tüketen thread'e verilir.
+    # Aynı anda en fazla `window` iş (çalışan + sırada) bulunur. Girdi ayrı bir thread'de okunur:
+    # girdi beklerken (ör. iş duraklatıldığında) biten işler yine teslim edilir. Girdinin hatası
+    # uçuştaki işler teslim edildikten sonra yükseltilir.
+    workers = max(1, workers)
+    window = max(1, window or workers)
+    inbox = queue.Queue(maxsize=FEED_BUFFER)
+    stopped = threading.Event()
+    end = object()
+
+    def put(entry) -> bool:
+        while not stopped.is_set():
+            try:
+                inbox.put(entry, timeout=FEED_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def feed():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except Exception as e:
+            put((end, e))
+
+    pending = {}
+    error = None
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name) as ex:
+        threading.Thread(target=feed, daemon=True, name=f"{name}-feed").start()
+        try:
+            while True:
+                while len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield pending.pop(fut), fut
+                try:
+                    item, error = inbox.get(timeout=FEED_POLL) if pending else inbox.get()
+                except queue.Empty:
+                    done, _ = wait(pending, timeout=0)
+                    for fut in done:
+                        yield pending.pop(fut), fut
+                    continue
+                if item is end:
+                    break
+                pending[ex.submit(fn, item)] = item
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield pending.pop(fut), fut
+        finally:
+            stopped.set()
+            for fut in pending:
+                fut.cancel()  # tüketici erken bıraktı: sıradakiler başlamasın
+    if error is not None:
+        raise error
@@ -0,0 +1,90 @@
+from gsc_cache import ResponseCache
+from gsc_core import NOT_SUBMITTED, GscClient, fetch_statuses
+from gsc_credentials import CredentialPool
+
+class FakeService:
+    def __init__(self, sites):
+        self.sites = sites
+        self.fail = None
+        self.in_use = 0
+
+    def execute(self, make_request):
+        if self.fail:
+            raise self.fail
+        return {"siteEntry": [{"siteUrl": s, "permissionLevel": "siteOwner"} for s in self.sites]}
+
+class FakeAccount:
+    def __init__(self, name, sites):
+        self.name = name
+        self.pool = FakeService(sites)
+
+def _client(tmp_path, logs):
+    a = FakeAccount("a", ["https://a.example/"])
+    b = FakeAccount("b", ["https://b.example/"])
+    cache = ResponseCache(path=str(tmp_path / "cache.json"))
+    return GscClient(CredentialPool([a, b]), cache=cache, log_fn=logs.append), a, b
+
+def test_partial_sites_list_is_logged_and_not_cached(tmp_path):
+    logs = []
+    client, a, b = _client(tmp_path, logs)
+    b.pool.fail = ConnectionError("bağlantı koptu")
+    assert [s["siteUrl"] for s in client.sites_list()] == ["https://a.example/"]
+    assert client.sites_partial
+    assert any("b hesabının mülkleri alınamadı" in line for line in logs)
+    assert client.property_index().resolve("https://b.example/sitemap.xml") is None
+
+    b.pool.fail = None  # hesap düzeldi: eksik sonuç önbellekten dönmemeli
+    assert sorted(s["siteUrl"] for s in client.sites_list()) == ["https://a.example/", "https://b.example/"]
+    assert not client.sites_partial
+    client.cache.save()
+    reloaded = ResponseCache(path=str(tmp_path / "cache.json"))
+    assert reloaded.get(("sites.list", "a", "b"))[0]
+
+def test_partial_property_index_is_rebuilt_sooner(tmp_path, monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr("gsc_core.time.monotonic", lambda: clock[0])
+    client, a, b = _client(tmp_path, [])
+    b.pool.fail = ConnectionError("bağlantı koptu")
+    assert client.property_index().resolve("https://b.example/sitemap.xml") is None
+    b.pool.fail = None
+    clock[0] = 61.0
+    assert client.property_index().resolve("https://b.example/sitemap.xml") == "https://b.example/"
+
+class FakeStatusClient:
+    # sitemaps.list yanıtları: (site, index) -> kaynaklar; sitemaps.get çağrılmamalı
+    def __init__(self, lists):
+        self.lists = lists
+        self.calls = []
+
+    def sitemaps_list(self, site_url, sitemap_index=None):
+        self.calls.append(("list", site_url, sitemap_index))
+        return self.lists.get((site_url, sitemap_index), [])
+
+    def sitemaps_get(self, site_url, feedpath):
+        raise AssertionError("sitemaps.get çağrılmamalı")
+
+SITE = "https://a.example/"
+
+def _resource(path, index=False):
+    return {"path": path, "isSitemapsIndex": index, "lastDownloaded": "2026-10-01T00:00:00Z",
+            "contents": [{"submitted": "10", "indexed": "7"}]}
+
+def test_statuses_expand_indexes_and_mark_unsubmitted_locally():
+    client = FakeStatusClient({
+        (SITE, None): [_resource(f"{SITE}sitemap.xml"), _resource(f"{SITE}index.xml", index=True),
+                       _resource(f"{SITE}other-index.xml", index=True)],
+        (SITE, f"{SITE}index.xml"): [_resource(f"{SITE}child-1.xml")],
+    })
+    urls = [f"{SITE}sitemap.xml", f"{SITE}child-1.xml"] + [f"{SITE}new-{i}.xml" for i in range(50)]
+    rows = fetch_statuses(client, urls, resolve=lambda u: SITE)
+    assert [r.url for r in rows] == urls
+    assert rows[0].found and rows[1].found and rows[1].indexed == 7
+    assert all(not r.found and r.error == NOT_SUBMITTED for r in rows[2:])
+    # mülk başına bir liste + index başına bir alt liste; URL başına çağrı yok
+    assert sorted(c[2] or "" for c in client.calls) == ["", f"{SITE}index.xml", f"{SITE}other-index.xml"]
+
+def test_statuses_skip_index_expansion_when_everything_is_listed():
+    client = FakeStatusClient({(SITE, None): [_resource(f"{SITE}sitemap.xml"),
+                                              _resource(f"{SITE}index.xml", index=True)]})
+    rows = fetch_statuses(client, [f"{SITE}sitemap.xml"], resolve=lambda u: SITE)
+    assert rows[0].found and len(client.calls) == 1
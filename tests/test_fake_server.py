@@ -0,0 +1,21 @@
+import http.client
+import json
+import time
+
+from fake_gsc_server import start_server
+
+def test_keep_alive_responses_do_not_stall():
+    server = start_server(sites=2, sitemaps=10)
+    try:
+        host, port = server.server_address[:2]
+        conn = http.client.HTTPConnection(host, port)
+        times = []
+        for _ in range(10):
+            t0 = time.perf_counter()
+            conn.request("GET", "/webmasters/v3/sites")
+            body = conn.getresponse().read()
+            times.append(time.perf_counter() - t0)
+        assert len(json.loads(body)["siteEntry"]) == 2
+        assert sorted(times)[len(times) // 2] < 0.02  # Nagle + gecikmeli ACK: ~40 ms
+    finally:
+        server.shutdown()
@@ -0,0 +1,48 @@
+from gsc_fetch import FetchResult
+from gsc_history import IncrementalPlanner, SubmissionHistory
+
+URLS = [f"https://site.example/sitemap-{i}.xml" for i in range(100)]
+
+def _fetcher(content: str):
+    def fetch(url, etag=None, last_modified=None):
+        return FetchResult(url, 200, etag=f'"{content}"', content_hash=content)
+    return fetch
+
+def _baseline(history):
+    planner = IncrementalPlanner(history, workers=4, fetch=_fetcher("v1"))
+    for url in planner.iter_changed(URLS):
+        history.record_submit(url, "https://site.example/", True)
+
+def test_unchanged_sitemaps_are_skipped(tmp_path):
+    history = SubmissionHistory(str(tmp_path / "h.sqlite"))
+    _baseline(history)
+    planner = IncrementalPlanner(history, workers=4, fetch=_fetcher("v1"))
+    assert list(planner.iter_changed(URLS)) == []
+    assert planner.skipped == len(URLS)
+
+def test_cancelled_run_does_not_hide_changes(tmp_path):
+    history = SubmissionHistory(str(tmp_path / "h.sqlite"))
+    _baseline(history)
+    planner = IncrementalPlanner(history, workers=4, fetch=_fetcher("v2"))
+    it = planner.iter_changed(URLS)
+    submitted = []
+    for url in it:
+        history.record_submit(url, "https://site.example/", True)
+        submitted.append(url)
+        if len(submitted) == 5:
+            break
+    it.close()  # iptal: önden getirilmiş (ama gönderilmemiş) sitemap'ler
+    planner = IncrementalPlanner(history, workers=4, fetch=_fetcher("v2"))
+    assert sorted(planner.iter_changed(URLS)) == sorted(set(URLS) - set(submitted))
+
+def test_failed_submit_keeps_change_pending(tmp_path):
+    history = SubmissionHistory(str(tmp_path / "h.sqlite"))
+    _baseline(history)
+    planner = IncrementalPlanner(history, workers=4, fetch=_fetcher("v2"))
+    for url in planner.iter_changed(URLS[:1]):
+        history.record_submit(url, "https://site.example/", False, "HTTP 500")
+    row = history.get(URLS[0])
+    assert row["content_hash"] == "v1" and row["pending_hash"] == "v2"
+    history.record_submit(URLS[0], "https://site.example/", True)
+    row = history.get(URLS[0])
+    assert row["content_hash"] == "v2" and row["pending_hash"] is None
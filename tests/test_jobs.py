@@ -0,0 +1,103 @@
+import threading
+import time
+
+from gsc_core import SubmitEngine
+from gsc_jobs import JobManager
+
+def test_results_are_recorded_while_paused(tmp_path):
+    jobs = JobManager(str(tmp_path))
+    job = jobs.create("submit", [f"https://site.example/s-{i}.xml" for i in range(200)])
+    started = threading.Event()
+    calls = []
+
+    def submit(prefix, url):
+        calls.append(url)
+        started.set()
+        time.sleep(0.05)
+
+    engine = SubmitEngine(submit, workers=8, rate_per_property=1e6, burst=1e6,
+                          resolve=lambda url: "https://site.example/")
+    t = threading.Thread(target=engine.run, args=(job.iter_pending(),),
+                         kwargs={"on_result": lambda res: job.record(res.url, res.ok)}, daemon=True)
+    t.start()
+    started.wait(5)
+    job.pause()
+    time.sleep(0.5)  # duraklatma anında uçuştaki tüm submit'ler biter
+    paused_at = len(job.done)
+    assert paused_at == len(calls)  # gönderilen her sitemap kaydedildi
+    time.sleep(0.3)
+    assert len(job.done) == paused_at  # duraklatılmışken yeni submit başlamaz
+    reloaded = jobs.load(job.id)
+    assert len(reloaded.done) == paused_at  # ve bitenler kontrol noktasına yazılmıştır
+    job.resume()
+    t.join(10)
+    assert not t.is_alive()
+    assert len(job.done) == 200
+
+def test_stop_keeps_unfinished_items(tmp_path):
+    jobs = JobManager(str(tmp_path))
+    items = [f"https://site.example/s-{i}.xml" for i in range(50)]
+    job = jobs.create("submit", items)
+    engine = SubmitEngine(lambda p, u: time.sleep(0.01), workers=4, rate_per_property=1e6, burst=1e6,
+                          resolve=lambda url: "https://site.example/")
+
+    def on_result(res):
+        job.record(res.url, res.ok)
+        if len(job.done) == 10:
+            job.stop()
+    engine.run(job.iter_pending(), on_result=on_result)
+    job.finish()
+    reloaded = jobs.load(job.id)
+    assert 10 <= len(reloaded.done) < 50
+    assert len(reloaded.remaining) == 50 - len(reloaded.done)
+
+def test_malformed_header_is_ignored(tmp_path):
+    jobs = JobManager(str(tmp_path))
+    good = jobs.create("submit", ["https://site.example/a.xml"])
+    (tmp_path / "broken.json").write_text('{"kind": "submit"}', encoding="utf-8")
+    (tmp_path / "list.json").write_text("[1, 2]", encoding="utf-8")
+    assert jobs.load("broken") is None and jobs.load("list") is None
+    assert [j.id for j in jobs.pending()] == [good.id]
+
+def test_cancel_skips_queued_submits(tmp_path):
+    # arayüz ayarları: 32 işçi, mülk başına 5/sn; iptalden sonra sıradakiler API'ye gitmemeli
+    jobs = JobManager(str(tmp_path))
+    job = jobs.create("submit", [f"https://site.example/s-{i}.xml" for i in range(400)])
+    calls = []
+    at_cancel = []
+    engine = SubmitEngine(lambda p, u: calls.append(u), workers=32, rate_per_property=5, burst=10,
+                          resolve=lambda url: "https://site.example/", should_run=job.wait_running)
+
+    def on_result(res):
+        job.record(res.url, res.ok)
+        if len(job.done) == 12:
+            at_cancel.append(len(calls))
+            job.cancel()
+    t0 = time.monotonic()
+    summary = engine.run(job.iter_pending(), on_result=on_result)
+    assert time.monotonic() - t0 < 5
+    assert len(calls) - at_cancel[0] <= 2
+    assert summary.total == len(job.done) == len(calls)
+
+def test_pause_holds_queued_submits(tmp_path):
+    jobs = JobManager(str(tmp_path))
+    job = jobs.create("submit", [f"https://site.example/s-{i}.xml" for i in range(40)])
+    calls = []
+    engine = SubmitEngine(lambda p, u: calls.append(u), workers=16, rate_per_property=20, burst=1,
+                          resolve=lambda url: "https://site.example/", should_run=job.wait_running)
+
+    def on_result(res):
+        job.record(res.url, res.ok)
+        if len(job.done) == 5:
+            job.pause()
+    t = threading.Thread(target=engine.run, args=(job.iter_pending(),), kwargs={"on_result": on_result},
+                         daemon=True)
+    t.start()
+    time.sleep(1.0)
+    held = len(calls)
+    assert held <= 7
+    time.sleep(0.5)
+    assert len(calls) == held  # sıradakiler duraklatmada bekler
+    job.resume()
+    t.join(15)
+    assert not t.is_alive() and len(calls) == 40
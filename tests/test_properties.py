@@ -0,0 +1,58 @@
+import pytest
+
+from gsc_properties import PropertyIndex, UnownedPropertyError
+
+def _index(*sites, level="siteOwner"):
+    return PropertyIndex([{"siteUrl": s, "permissionLevel": level} for s in sites])
+
+def test_sc_domain_covers_host_and_subdomains():
+    index = _index("sc-domain:example.com")
+    assert index.resolve("https://example.com/sitemap.xml") == "sc-domain:example.com"
+    assert index.resolve("http://blog.shop.example.com/sitemap.xml") == "sc-domain:example.com"
+    assert index.resolve("https://example.com.evil.test/sitemap.xml") is None
+    assert index.resolve("https://notexample.com/sitemap.xml") is None
+
+def test_most_specific_domain_wins():
+    index = _index("sc-domain:example.com", "sc-domain:shop.example.com")
+    assert index.resolve("https://a.shop.example.com/s.xml") == "sc-domain:shop.example.com"
+    assert index.resolve("https://blog.example.com/s.xml") == "sc-domain:example.com"
+
+def test_longest_path_prefix_wins_over_domain():
+    index = _index("sc-domain:example.com", "https://example.com/", "https://example.com/tr/",
+                   "https://example.com/tr/blog/")
+    assert index.resolve("https://example.com/tr/blog/sitemap.xml") == "https://example.com/tr/blog/"
+    assert index.resolve("https://example.com/tr/sitemap.xml") == "https://example.com/tr/"
+    assert index.resolve("https://example.com/tr/blogs/sitemap.xml") == "https://example.com/tr/"
+    assert index.resolve("https://example.com/sitemap.xml") == "https://example.com/"
+    assert index.resolve("http://example.com/sitemap.xml") == "sc-domain:example.com"  # başka şema
+
+def test_sitemap_file_name_is_not_a_prefix_segment():
+    index = _index("https://example.com/tr/")
+    assert index.resolve("https://example.com/tr") is None
+    assert index.resolve("https://example.com/tr/sitemap.xml") == "https://example.com/tr/"
+
+def test_default_port_matches_and_other_port_does_not():
+    index = _index("https://example.com/", "http://example.com:8080/")
+    assert index.resolve("https://example.com:443/sitemap.xml") == "https://example.com/"
+    assert index.resolve("https://example.com:8443/sitemap.xml") is None
+    assert index.resolve("http://example.com:8080/sitemap.xml") == "http://example.com:8080/"
+    assert index.resolve("http://example.com/sitemap.xml") is None
+
+def test_host_matching_is_case_insensitive():
+    index = _index("https://example.com/")
+    assert index.resolve("HTTPS://Example.COM./sitemap.xml") == "https://example.com/"
+
+def test_unverified_entries_are_ignored():
+    index = PropertyIndex([{"siteUrl": "https://a.example/", "permissionLevel": "siteUnverifiedUser"},
+                           {"siteUrl": "sc-domain:b.example", "permissionLevel": "siteFullUser"}])
+    assert len(index) == 1
+    assert index.resolve("https://a.example/sitemap.xml") is None
+    assert index.resolve("https://b.example/sitemap.xml") == "sc-domain:b.example"
+
+def test_unowned_urls():
+    index = _index("https://example.com/")
+    for url in ("https://other.example/sitemap.xml", "not a url", "https://[::1/sitemap.xml"):
+        assert index.resolve(url) is None
+        with pytest.raises(UnownedPropertyError):
+            index.resolve_or_raise(url)
+    assert index.resolve_or_raise("https://example.com/sitemap.xml") == "https://example.com/"
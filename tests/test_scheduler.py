@@ -0,0 +1,129 @@
+import json
+import socket
+
+import pytest
+
+from gsc_scheduler import (AdaptiveLimiter, CircuitBreaker, CircuitOpenError, QuotaExhaustedError, QuotaTracker,
+                           RequestScheduler, classify, retry_after)
+
+SITE = "https://site.example/"
+
+def _fail():
+    raise ConnectionError("bağlantı koptu")
+
+def test_quota_exhaustion_does_not_leave_probe_stuck(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr("gsc_scheduler.time.monotonic", lambda: clock[0])
+    breaker = CircuitBreaker(threshold=1, cooldown=10)
+    quota = QuotaTracker(limits={"sitemaps.get": 1})
+    scheduler = RequestScheduler(breaker=breaker, quota=quota, max_retries=0, sleep=lambda _: None)
+
+    with pytest.raises(ConnectionError):
+        scheduler.call("sitemaps.get", SITE, _fail)
+    with pytest.raises(CircuitOpenError):
+        scheduler.call("sitemaps.get", SITE, lambda: "ok")
+
+    clock[0] = 11.0  # soğuma bitti: yarı açık deneme kotaya takılır
+    with pytest.raises(QuotaExhaustedError):
+        scheduler.call("sitemaps.get", SITE, lambda: "ok")
+
+    quota.limits["sitemaps.get"] = 10
+    assert scheduler.call("sitemaps.get", SITE, lambda: "ok") == "ok"
+    assert breaker.open_circuits() == []
+
+class FakeResp(dict):
+    def __init__(self, status, headers=None):
+        super().__init__(headers or {})
+        self.status = status
+
+class FakeHttpError(Exception):
+    # googleapiclient.errors.HttpError'un sınıflandırmada kullanılan alanları
+    def __init__(self, status, reason=None, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.resp = FakeResp(status, headers)
+        errors = [{"reason": reason, "message": reason}] if reason else []
+        self.content = json.dumps({"error": {"code": status, "errors": errors}}).encode()
+
+@pytest.mark.parametrize("exc, kind", [
+    (FakeHttpError(429), "throttle"),
+    (FakeHttpError(403, "rateLimitExceeded"), "throttle"),
+    (FakeHttpError(403, "userRateLimitExceeded"), "throttle"),
+    (FakeHttpError(403, "quotaExceeded"), "quota"),
+    (FakeHttpError(403, "dailyLimitExceeded"), "quota"),
+    (FakeHttpError(403, "forbidden"), "client"),
+    (FakeHttpError(404, "notFound"), "client"),
+    (FakeHttpError(500, "backendError"), "server"),
+    (FakeHttpError(503), "server"),
+    (ConnectionResetError("reset"), "network"),
+    (socket.timeout("timed out"), "network"),
+    (ValueError("bozuk"), "client"),
+])
+def test_classify(exc, kind):
+    assert classify(exc) == kind
+
+def test_retry_after_sets_backoff_lower_bound():
+    scheduler = RequestScheduler(quota=QuotaTracker(), backoff_base=0.01, backoff_max=0.01)
+    exc = FakeHttpError(429, headers={"retry-after": "7"})
+    assert retry_after(exc) == 7.0
+    assert all(scheduler.backoff(attempt, exc) >= 7.0 for attempt in range(5))
+    assert all(scheduler.backoff(attempt) <= 0.01 for attempt in range(5))
+    assert retry_after(FakeHttpError(429, headers={"retry-after": "soon"})) is None
+
+def test_retries_are_bounded_then_raise():
+    sleeps, calls = [], []
+
+    def fail():
+        calls.append(1)
+        raise FakeHttpError(503)
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    scheduler = RequestScheduler(breaker=breaker, quota=QuotaTracker(), max_retries=3, sleep=sleeps.append)
+    with pytest.raises(FakeHttpError):
+        scheduler.call("sitemaps.submit", SITE, fail)
+    assert len(calls) == 4 and len(sleeps) == 3 and scheduler.retries == 3
+    assert breaker.open_circuits() == [SITE]
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    def not_found():
+        calls.append(1)
+        raise FakeHttpError(404, "notFound")
+    breaker = CircuitBreaker(threshold=1, cooldown=60)
+    scheduler = RequestScheduler(breaker=breaker, quota=QuotaTracker(), sleep=lambda _: None)
+    with pytest.raises(FakeHttpError):
+        scheduler.call("sitemaps.get", SITE, not_found)
+    assert len(calls) == 1 and breaker.open_circuits() == []
+
+def test_throttle_is_retried_and_halves_concurrency():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise FakeHttpError(429)
+        return "ok"
+    limiter = AdaptiveLimiter(start=8, maximum=32)
+    scheduler = RequestScheduler(limiter, quota=QuotaTracker(), sleep=lambda _: None)
+    assert scheduler.call("sitemaps.submit", SITE, flaky) == "ok"
+    assert scheduler.throttled == 1 and limiter.limit == 4
+
+def test_aimd_halves_once_per_wave_and_grows_additively(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("gsc_scheduler.time.monotonic", lambda: clock[0])
+    limiter = AdaptiveLimiter(start=8, minimum=1, maximum=10)
+    limiter.on_throttle()
+    limiter.on_throttle()  # aynı dalga: yalnızca bir kez
+    assert limiter.limit == 4
+    clock[0] += 2
+    limiter.on_throttle()
+    assert limiter.limit == 2
+    for _ in range(2):
+        limiter.on_success()
+    assert limiter.limit == 3  # `limit` başarıda +1
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.limit == 10  # tavan
+    for _ in range(10):
+        clock[0] += 2
+        limiter.on_throttle()
+    assert limiter.limit == 1  # taban
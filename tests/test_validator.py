@@ -0,0 +1,102 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gsc_validator import validate_sitemap, validate_sitemaps
+
+URLSET = (b'<?xml version="1.0" encoding="UTF-8"?>'
+          b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+          b'<url><loc>http://127.0.0.1/a</loc></url><url><loc>http://127.0.0.1/b</loc></url></urlset>')
+
+def _corrupt_gzip() -> bytes:
+    data = bytearray(gzip.compress(URLSET * 50))
+    data[12:40] = b"\xff" * 28  # başlık sağlam, deflate akışı bozuk -> zlib.error
+    return bytes(data)
+
+def _index(base: str) -> bytes:
+    return ('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f'<sitemap><loc>{base}/good.xml</loc></sitemap><sitemap><loc>{base}/good.xml.gz</loc></sitemap>'
+            '</sitemapindex>').encode()
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        base = f"http://{self.headers['Host']}"
+        bodies = {
+            "/good.xml": URLSET,
+            "/good.xml.gz": gzip.compress(URLSET),
+            "/bad.xml.gz": _corrupt_gzip(),
+            "/index.xml": _index(base),
+        }
+        body = bodies.get(self.path)
+        self.send_response(200 if body is not None else 404)
+        body = body or b""
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture(scope="module")
+def base():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+def _run(urls, timeout=10, **kw):
+    # doğrulama asılı kalırsa test zaman aşımıyla başarısız olur
+    out = {}
+    def target():
+        try:
+            out["summary"] = validate_sitemaps(urls, **kw)
+        except Exception as e:
+            out["error"] = e
+    t = threading.Thread(target=target, daemon=True)
+    t.start()
+    t.join(timeout)
+    assert not t.is_alive(), "validate_sitemaps asılı kaldı"
+    return out
+
+def test_valid_plain_and_gzip(base):
+    for path in ("/good.xml", "/good.xml.gz"):
+        res = validate_sitemap(base + path)
+        assert res.ok, res.issues
+        assert res.kind == "urlset" and res.entries == 2
+    assert validate_sitemap(base + "/good.xml.gz").compressed
+
+def test_missing_is_error(base):
+    res = validate_sitemap(base + "/missing.xml")
+    assert res.status == 404 and not res.ok
+
+def test_corrupt_gzip_is_error(base):
+    res = validate_sitemap(base + "/bad.xml.gz")
+    assert not res.ok
+    assert res.compressed
+
+def test_corrupt_gzip_does_not_stall_worker(base):
+    results = []
+    out = _run([base + "/bad.xml.gz", base + "/good.xml.gz"], connections=1, on_result=results.append)
+    summary = out["summary"]
+    assert summary.total == 2 and summary.valid == 1
+    assert [r.ok for r in results] == [False, True]
+
+def test_index_expansion(base):
+    results = []
+    summary = _run([base + "/index.xml"], on_result=results.append)["summary"]
+    assert summary.expanded == 2 and summary.total == 3 and summary.valid == 3
+    index = next(r for r in results if r.url.endswith("/index.xml"))
+    assert index.kind == "sitemapindex" and len(index.children) == 2
+
+def test_on_result_error_is_raised_after_completion(base):
+    seen = []
+    def on_result(res):
+        seen.append(res.url)
+        raise RuntimeError("boom")
+    out = _run([base + "/good.xml", base + "/good.xml.gz"], connections=1, on_result=on_result)
+    assert isinstance(out["error"], RuntimeError)
+    assert len(seen) == 2
@@ -0,0 +1,81 @@
+import threading
+
+from gsc_fetch import FetchResult
+from gsc_watch import SitemapWatcher
+
+URL = "https://site.example/sitemap.xml"
+
+class _Site:
+    # ETag destekli sahte sunucu: içerik değişince ETag da değişir
+    def __init__(self, content="v1", last_modified=None):
+        self.content = content
+        self.last_modified = last_modified
+
+    def fetch(self, url, etag=None, last_modified=None):
+        if etag == f'"{self.content}"':
+            return FetchResult(url, 304, etag, self.last_modified)
+        return FetchResult(url, 200, f'"{self.content}"', self.last_modified, content_hash=self.content)
+
+class _Submit:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, client, urls, on_result=None, history=None):
+        from gsc_core import SubmitSummary
+        for u in urls:
+            history.record_submit(u, "https://site.example/", True)
+        self.calls.append(list(urls))
+        return SubmitSummary(len(urls), len(urls), 0.0)
+
+def _watcher(history, site, submit):
+    return SitemapWatcher(None, history, workers=2, min_interval=0, start_interval=0, fetch=site.fetch,
+                          submit=submit)
+
+def _history(tmp_path):
+    from gsc_history import SubmissionHistory
+    return SubmissionHistory(str(tmp_path / "h.sqlite"))
+
+def test_first_poll_is_baseline_only(tmp_path):
+    history, site, submit = _history(tmp_path), _Site(), _Submit()
+    w = _watcher(history, site, submit)
+    assert w._check(URL) == (False, "")
+    assert w._check(URL) == (False, "")
+    site.content = "v2"
+    assert w._check(URL) == (True, "")
+
+def test_change_survives_stop_before_submit(tmp_path):
+    history, site, submit = _history(tmp_path), _Site(), _Submit()
+    w = _watcher(history, site, submit)
+    w._check(URL)
+    site.content = "v2"
+    assert w._check(URL) == (True, "")  # izleme bu noktada durduruldu: submit edilmedi
+    assert w._check(URL) == (True, "")  # sonraki yoklama değişikliği yine görür
+    history.record_submit(URL, "https://site.example/", True)
+    assert w._check(URL) == (False, "")
+
+def test_change_before_baseline_uses_gsc_last_downloaded(tmp_path):
+    history = _history(tmp_path)
+    history._upsert(URL, gsc_last_downloaded="2024-01-01T00:00:00.000Z")
+    w = _watcher(history, _Site(last_modified="Tue, 02 Jan 2024 00:00:00 GMT"), _Submit())
+    assert w._check(URL) == (True, "")
+    other = "https://site.example/other.xml"
+    history._upsert(other, gsc_last_downloaded="2024-01-03T00:00:00.000Z")
+    assert w._check(other) == (False, "")
+
+def test_run_submits_only_changes(tmp_path):
+    history, site, submit = _history(tmp_path), _Site(), _Submit()
+    w = _watcher(history, site, submit)
+    w.add([URL])
+    stop = threading.Event()
+    w.on_check = lambda *a: stop.set() if w.checks >= 3 else None
+    site_changes = iter(["v1", "v2", "v2"])
+    original = site.fetch
+    def fetch(url, etag=None, last_modified=None):
+        site.content = next(site_changes, "v2")
+        return original(url, etag, last_modified)
+    w.fetch = fetch
+    t = threading.Thread(target=w.run, args=(stop,), daemon=True)
+    t.start()
+    t.join(10)
+    assert not t.is_alive()
+    assert submit.calls == [[URL]]
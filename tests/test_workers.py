@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+from gsc_workers import bounded_map
+
+def test_delivers_every_item_within_window():
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work(i):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.005)
+        with lock:
+            running[0] -= 1
+        return i * 2
+
+    out = {item: fut.result() for item, fut in bounded_map(work, range(100), workers=4, window=6)}
+    assert out == {i: i * 2 for i in range(100)}
+    assert peak[0] <= 4
+
+def test_finished_work_is_delivered_while_input_blocks():
+    gate = threading.Event()
+    seen = []
+
+    def items():
+        yield from range(3)
+        gate.wait(5)  # ör. duraklatılmış iş
+        yield 3
+
+    def consume():
+        for item, _ in bounded_map(lambda i: i, items(), workers=2):
+            seen.append(item)
+    t = threading.Thread(target=consume, daemon=True)
+    t.start()
+    time.sleep(0.5)
+    assert sorted(seen) == [0, 1, 2]
+    gate.set()
+    t.join(5)
+    assert sorted(seen) == [0, 1, 2, 3]
+
+def test_input_error_is_raised_after_in_flight_work():
+    def items():
+        yield 1
+        yield 2
+        raise RuntimeError("girdi okunamadı")
+
+    seen = []
+    with pytest.raises(RuntimeError):
+        for item, fut in bounded_map(lambda i: time.sleep(0.05) or i, items(), workers=2):
+            seen.append(fut.result())
+    assert sorted(seen) == [1, 2]